@@ -0,0 +1,201 @@
+"""
+议程：从 CSV / JSON / JSON Lines 读取分段（标题 + 时长，或开始/结束的墙钟时间），
+逐行流式解析成紧凑的有序边界数组，按时间查当前分段用二分查找。
+
+字段：
+- title     分段标题
+- duration  时长，数字为分钟（可带小数），或 "M:SS" / "H:MM:SS"
+- start/end 墙钟时间，ISO 8601（"2026-10-18T09:30"）；只有 "HH:MM" 时与 date 列组合，缺省为当天
+- track     分会场/轨道，加载时可只保留其中一条；各轨道时间重叠时必须选定一条
+"""
+import bisect
+import csv
+import json
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+
+
+class AgendaError(ValueError):
+    pass
+
+
+class Agenda:
+    """
+    分段按开始时间排序保存在两条 array('d') 中（不为每段建对象）：
+    anchored 为真时是 Unix 时间戳，否则是相对议程开始的秒数。
+    分段之间可以有空档（如茶歇），但不能重叠：index_at 的二分查找依赖结束时间随开始时间递增。
+    """
+
+    __slots__ = ("titles", "starts", "ends", "anchored")
+
+    def __init__(self, titles, starts, ends, anchored):
+        self.titles = titles
+        self.starts = starts
+        self.ends = ends
+        self.anchored = anchored
+
+    def __len__(self):
+        return len(self.titles)
+
+    def index_at(self, t: float) -> int:
+        """t 所在的分段；落在空档里时返回下一个分段；已全部结束返回 len(self)。"""
+        i = bisect.bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return i
+        return i + 1
+
+    def segment(self, i: int):
+        return self.titles[i], self.starts[i], self.ends[i]
+
+    def duration(self, i: int) -> float:
+        return self.ends[i] - self.starts[i]
+
+
+def parse_duration(text) -> float:
+    """分钟数，或 M:SS / H:MM:SS，返回秒。"""
+    if isinstance(text, (int, float)):
+        return float(text) * 60
+    text = text.strip()
+    if ":" not in text:
+        return float(text) * 60
+    seconds = 0.0
+    for part in text.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _parse_wallclock(text, day) -> float:
+    text = text.strip()
+    if len(text) <= 5:
+        # 只有 HH:MM
+        text = f"{day or date.today().isoformat()}T{text}"
+    return datetime.fromisoformat(text).timestamp()
+
+
+def _iter_csv(f):
+    yield from csv.DictReader(f)
+
+
+def _iter_json_lines(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    # 顶层数组逐个元素解码，不把整个文件读进内存
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        # 跳过空白与分隔符
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos = f.read(chunk_size), 0
+            eof = not buf
+        if pos >= len(buf):
+            if started:
+                raise AgendaError("JSON 数组未闭合")
+            return
+        if not started:
+            if buf[pos] != "[":
+                raise AgendaError("JSON 议程的顶层必须是数组")
+            started = True
+            pos += 1
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            more = f.read(chunk_size)
+            eof = not more
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+        yield obj
+        pos = end
+
+
+def iter_records(path):
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if suffix == ".csv":
+            yield from _iter_csv(f)
+        elif suffix in (".jsonl", ".ndjson"):
+            yield from _iter_json_lines(f)
+        elif suffix == ".json":
+            yield from _iter_json_array(f)
+        else:
+            raise AgendaError(f"不支持的议程格式: {path.suffix}")
+
+
+def build_agenda(records, track=None) -> Agenda:
+    titles = []
+    starts = array("d")
+    ends = array("d")
+    anchored = None
+    cursor = 0.0
+    ordered = True
+    tracks = set()
+    for n, rec in enumerate(records, 1):
+        if track is not None and (rec.get("track") or "") != track:
+            continue
+        if track is None:
+            tracks.add(rec.get("track") or "")
+        start = rec.get("start") or None
+        end = rec.get("end") or None
+        duration = rec.get("duration")
+        has_wallclock = start is not None
+        if anchored is None:
+            anchored = has_wallclock
+        elif has_wallclock and not anchored:
+            raise AgendaError(f"第 {n} 条：相对时长的议程里不能出现墙钟时间")
+        try:
+            if has_wallclock:
+                day = rec.get("date")
+                s = _parse_wallclock(start, day)
+                if end is not None:
+                    e = _parse_wallclock(end, day)
+                else:
+                    e = s + parse_duration(duration)
+            else:
+                # 只有时长：紧接上一段结束
+                s = cursor
+                e = s + parse_duration(duration)
+        except (TypeError, ValueError) as exc:
+            raise AgendaError(f"第 {n} 条无法解析: {exc}") from None
+        if e <= s:
+            raise AgendaError(f"第 {n} 条结束时间不晚于开始时间")
+        if starts and s < starts[-1]:
+            ordered = False
+        titles.append(str(rec.get("title") or ""))
+        starts.append(s)
+        ends.append(e)
+        cursor = e
+    if not titles:
+        raise AgendaError("议程为空")
+    if not ordered:
+        order = sorted(range(len(titles)), key=starts.__getitem__)
+        titles = [titles[i] for i in order]
+        starts = array("d", (starts[i] for i in order))
+        ends = array("d", (ends[i] for i in order))
+    for i in range(1, len(titles)):
+        if starts[i] < ends[i - 1]:
+            hint = f"；议程里有 {len(tracks)} 个 track，请用 --track 选择其中一个" if len(tracks) > 1 else ""
+            raise AgendaError(f"分段“{titles[i]}”与“{titles[i - 1]}”时间重叠{hint}")
+    return Agenda(titles, starts, ends, bool(anchored))
+
+
+def load_agenda(path, track=None) -> Agenda:
+    return build_agenda(iter_records(path), track)
@@ -0,0 +1,134 @@
+"""
+提示音：剩余 30 秒、10 秒与结束时各响一声，面向观众的演讲者不看计时器也能知道。
+
+启动时一次性把三段提示音合成成内存里的 PCM（16 位单声道），并预先打开音频输出（QAudioSink，推模式）；
+到点时只把现成的字节写进已经打开的输出，计时回调里不做合成、解码或打开设备。
+输出缓冲区放得下三段提示音首尾相接，写入一次完成；放完后输出进入空闲，不产生额外唤醒。
+多窗口时每个窗口用 channel() 各开一路输出（合成好的缓冲区共用），几个窗口同时提示也不会互相截断。
+
+QtMultimedia 不可用（未安装、缺少 libpulse 等系统库）、没有输出设备、格式不受支持，
+或环境变量 PPT_TIMER_AUDIO=none 时退回 NullAudio：缓冲区照样准备，只记录触发时刻、不出声，
+无界面的测试与基准据此测量触发延迟。
+"""
+import logging
+import math
+import os
+import time
+from array import array
+
+from countdown_engine import CountdownEngine
+
+log = logging.getLogger("ppt_timer.audio")
+
+SAMPLE_RATE = 24000
+AMPLITUDE = 0.45
+RAMP_S = 0.005  # 每个音的淡入淡出，避免爆音
+
+# 提示音：(频率 Hz, 时长 s)，频率为 0 表示静音间隔
+CUES = {
+    "warn": ((880, 0.18),),
+    "urgent": ((1320, 0.12), (0, 0.08), (1320, 0.12)),
+    "finish": ((1568, 0.15), (0, 0.07), (1568, 0.15), (0, 0.07), (1568, 0.45)),
+}
+# 显示的剩余秒数到达这些值时提示，与颜色阈值一致；归零时另由结束提示负责
+THRESHOLDS = ((CountdownEngine.ORANGE_S, "warn"), (CountdownEngine.RED_S, "urgent"))
+
+
+def synthesize(tones, rate: int = SAMPLE_RATE) -> bytes:
+    samples = array("h")
+    peak = AMPLITUDE * 32767
+    ramp = max(1, int(RAMP_S * rate))
+    for freq, seconds in tones:
+        n = int(seconds * rate)
+        if not freq:
+            samples.extend(array("h", bytes(2 * n)))
+            continue
+        step = 2 * math.pi * freq / rate
+        wave = [peak * math.sin(step * i) for i in range(n)]
+        for i in range(min(ramp, n // 2)):
+            wave[i] *= i / ramp
+            wave[n - 1 - i] *= i / ramp
+        samples.extend(map(int, wave))
+    return samples.tobytes()
+
+
+def synthesize_all(rate: int = SAMPLE_RATE) -> dict:
+    return {name: synthesize(tones, rate) for name, tones in CUES.items()}
+
+
+class NullAudio:
+    """不出声的后端：记录 (提示音, time.perf_counter()) 供测试检查。"""
+
+    name = "null"
+
+    def __init__(self, buffers):
+        self.buffers = buffers
+        self.played = []
+
+    def play(self, cue: str):
+        self.played.append((cue, time.perf_counter()))
+
+    def channel(self):
+        return NullAudio(self.buffers)
+
+    def close(self):
+        pass
+
+
+class QtAudio:
+    name = "qt"
+
+    def __init__(self, buffers, device, fmt):
+        from PySide6.QtMultimedia import QAudioSink
+
+        self.buffers = buffers
+        self.device = device
+        self.fmt = fmt
+        self.played = []
+        self.sink = QAudioSink(device, fmt)
+        # 调整剩余时间可能让几段提示音紧挨着排队，缓冲区按全部首尾相接设置
+        self.sink.setBufferSize(sum(len(b) for b in buffers.values()))
+        # 推模式：start() 返回的设备一直保持打开，提示时直接写入
+        self.io = self.sink.start()
+
+    def play(self, cue: str):
+        data = self.buffers[cue]
+        free = self.sink.bytesFree()
+        if free < len(data):
+            log.warning("输出缓冲只剩 %d 字节，提示音 %s 被截断", free, cue)
+            data = data[:free]
+        written = self.io.write(data) if data else 0
+        if written < len(data):
+            log.warning("提示音 %s 只写入 %d/%d 字节", cue, max(written, 0), len(data))
+        self.played.append((cue, time.perf_counter()))
+
+    def channel(self):
+        """同一设备上再开一路输出，合成好的缓冲区共用。"""
+        return QtAudio(self.buffers, self.device, self.fmt)
+
+    def close(self):
+        self.sink.stop()
+
+
+def open_audio(enabled: bool = True):
+    """合成提示音并打开输出；不可用时返回 NullAudio。"""
+    buffers = synthesize_all()
+    if not enabled or os.environ.get("PPT_TIMER_AUDIO", "").lower() == "none":
+        return NullAudio(buffers)
+    try:
+        from PySide6.QtMultimedia import QAudioFormat, QMediaDevices
+    except ImportError as exc:
+        log.warning("QtMultimedia 不可用，提示音静音: %s", exc)
+        return NullAudio(buffers)
+    device = QMediaDevices.defaultAudioOutput()
+    if device.isNull():
+        log.warning("没有音频输出设备，提示音静音")
+        return NullAudio(buffers)
+    fmt = QAudioFormat()
+    fmt.setSampleRate(SAMPLE_RATE)
+    fmt.setChannelCount(1)
+    fmt.setSampleFormat(QAudioFormat.Int16)
+    if not device.isFormatSupported(fmt):
+        log.warning("音频输出 %s 不支持 %d Hz 16 位单声道，提示音静音", device.description(), SAMPLE_RATE)
+        return NullAudio(buffers)
+    return QtAudio(buffers, device, fmt)
@@ -0,0 +1,117 @@
+"""
+议程加载基准：在临时目录生成 50000 段、多天多轨道的 CSV / JSON / JSON Lines 议程，
+测量按轨道过滤的流式解析时间、不选轨道时因各轨道时间重叠而拒绝加载的耗时，
+以及二分查找与线性扫描的定位耗时。
+
+运行：
+    python benchmarks/agenda_load.py [--segments 50000]
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agenda import AgendaError, load_agenda  # noqa: E402
+
+TRACKS = ("A", "B", "C", "D")
+
+
+def generate(segments):
+    # 每条轨道从 08:00 开始排，每段 5~45 分钟，夹杂茶歇空档，跨越多天
+    rng = random.Random(7)
+    rows = []
+    per_track = segments // len(TRACKS)
+    for track in TRACKS:
+        t = datetime(2026, 10, 18, 8, 0)
+        for i in range(per_track):
+            minutes = rng.randint(5, 45)
+            end = t + timedelta(minutes=minutes)
+            rows.append({
+                "title": f"Track {track} / Session {i}",
+                "track": track,
+                "start": t.isoformat(timespec="minutes"),
+                "end": end.isoformat(timespec="minutes"),
+            })
+            t = end + timedelta(minutes=rng.choice((0, 0, 0, 5, 15)))
+            if t.hour >= 19:
+                t = (t + timedelta(days=1)).replace(hour=8, minute=0)
+    return rows
+
+
+def write_files(rows, folder):
+    paths = {}
+    paths["csv"] = folder / "agenda.csv"
+    with open(paths["csv"], "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["title", "track", "start", "end"])
+        writer.writeheader()
+        writer.writerows(rows)
+    paths["jsonl"] = folder / "agenda.jsonl"
+    with open(paths["jsonl"], "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+    paths["json"] = folder / "agenda.json"
+    paths["json"].write_text(json.dumps(rows), encoding="utf-8")
+    return paths
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def linear_index(agenda, t):
+    for i, end in enumerate(agenda.ends):
+        if t < end:
+            return i
+    return len(agenda)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segments", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rows = generate(args.segments)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(rows, Path(tmp))
+        del rows
+        print(f"分段数: {args.segments}（{len(TRACKS)} 条轨道）")
+        # 各格式都要逐行读完整个文件，只保留轨道 B
+        for kind, path in paths.items():
+            _, spent = timed(load_agenda, path, track="B")
+            print(f"加载 {kind:<6} {path.stat().st_size / 1e6:6.1f} MB  {spent * 1000:7.1f} ms（仅轨道 B）")
+        # 不选轨道：各轨道同时进行，分段重叠，加载时报错而不是让定位跳过仍在进行的分段
+        try:
+            load_agenda(paths["csv"])
+        except AgendaError as exc:
+            print(f"不选轨道加载 csv: 拒绝（{exc}）")
+        else:
+            raise AssertionError("多轨道重叠的议程不选轨道时应当拒绝加载")
+        tracemalloc.start()
+        agenda = load_agenda(paths["jsonl"], track="A")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"轨道 A: {len(agenda)} 段，解析峰值内存 {peak / 1e6:.1f} MB")
+
+    rng = random.Random(1)
+    lo, hi = agenda.starts[0], agenda.ends[-1]
+    queries = [rng.uniform(lo, hi) for _ in range(args.queries)]
+    fast, t_bisect = timed(lambda: [agenda.index_at(q) for q in queries])
+    slow, t_linear = timed(lambda: [linear_index(agenda, q) for q in queries])
+    assert fast == slow, "二分查找与线性扫描结果不一致"
+    print(f"定位 {args.queries} 次: 二分 {t_bisect / args.queries * 1e6:.2f} us/次  "
+          f"线性 {t_linear / args.queries * 1e6:.1f} us/次")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+时钟等价性检查：同一段倒计时分别用手动步进的虚拟时钟和加速的虚拟时钟
+（可选再加真实时钟）跑完，比较阈值变色、闪烁和结束提示的行为是否一致。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/clock_equivalence.py [--real]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import MonotonicClock, VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+SECONDS = 35
+
+
+def record(win):
+    trace = []
+    original = win.update_time_view
+
+    def update():
+        original()
+        trace.append((win.remaining_seconds, win.color_state()))
+
+    win.update_time_view = update
+    return trace
+
+
+def summarize(trace):
+    # 与时钟精度无关的行为特征：各颜色首次出现时的秒数，以及结束后的闪烁次数
+    first = {}
+    for remaining, state in trace:
+        first.setdefault(state, remaining)
+    finish_blinks = sum(1 for remaining, _ in trace if remaining == 0) - 1
+    return {"first_seen": first, "finish_blinks": finish_blinks, "final": trace[-1][0]}
+
+
+def run_manual():
+    clock = VirtualClock()
+    win = CountdownWindow(clock)
+    trace = record(win)
+    win.total_seconds = SECONDS
+    win.reset_timer()
+    win.start_timer()
+    while clock.step() is not None:
+        pass
+    return summarize(trace)
+
+
+def run_realtime(clock, speed):
+    win = CountdownWindow(clock)
+    trace = record(win)
+    win.show()
+    # 曝光之前窗口处于遮挡降频模式，等曝光后再开始
+    QTest.qWaitForWindowExposed(win)
+    win.total_seconds = SECONDS
+    win.reset_timer()
+    win.start_timer()
+    # 跑到没有任何待办为止（结束提示也已完成），留足余量防止卡死
+    budget = (SECONDS + CountdownWindow.FINISH_FLASH_S) / speed + 5
+    deadline = time.monotonic() + budget
+    while time.monotonic() < deadline and (win.is_running or win.scheduler.next_due() is not None):
+        QTest.qWait(5)
+    win.close()
+    return summarize(trace)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--real", action="store_true", help="同时用真实时钟跑一遍（约 40 秒）")
+    parser.add_argument("--speed", type=float, default=20)
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+
+    t0 = time.perf_counter()
+    runs = {"手动步进": run_manual()}
+    runs[f"加速 x{args.speed:g}"] = run_realtime(VirtualClock(speed=args.speed), args.speed)
+    if args.real:
+        runs["真实时钟"] = run_realtime(MonotonicClock(), 1)
+    for name, summary in runs.items():
+        print(f"{name:<10} {summary}")
+    reference = next(iter(runs.values()))
+    ok = all(summary == reference for summary in runs.values())
+    print(f"耗时 {time.perf_counter() - t0:.1f} s  结果:", "一致" if ok else "不一致")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+控制接口延迟：回环上的客户端逐条发送 toggle_start_pause，统计
+命令发出 -> 计时状态改变、命令发出 -> 收到应答 两段延迟的 p50 / p99。
+客户端在后台线程里用阻塞套接字收发，服务端照常跑在主线程的 Qt 事件循环里。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/control_latency.py
+"""
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from control_server import ControlServer  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+COMMANDS = 2000
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def connect(address):
+    if "/" in address:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(address)
+    else:
+        host, _, port = address.rpartition(":")
+        sock = socket.create_connection((host, int(port)))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def client(address, sent, replies, errors):
+    try:
+        with connect(address) as sock:
+            f = sock.makefile("rb")
+            for i in range(COMMANDS):
+                line = json.dumps({"cmd": "toggle_start_pause", "id": i}).encode() + b"\n"
+                sent.append(time.perf_counter_ns())
+                sock.sendall(line)
+                reply = json.loads(f.readline())
+                replies.append(time.perf_counter_ns())
+                if not reply["ok"] or reply["id"] != i:
+                    errors.append(reply)
+    except Exception as exc:  # 线程里的异常带回主线程汇报
+        errors.append(repr(exc))
+
+
+def measure(app, win, address):
+    server = ControlServer([win])
+    address = server.listen(address)
+    changed = []
+    toggle = win.toggle_start_pause
+
+    def timed_toggle():
+        toggle()
+        changed.append(time.perf_counter_ns())
+
+    win.toggle_start_pause = timed_toggle
+    sent, replies, errors = [], [], []
+    worker = threading.Thread(target=client, args=(address, sent, replies, errors))
+    worker.start()
+    poll = QTimer()
+    poll.timeout.connect(lambda: worker.is_alive() or app.quit())
+    poll.start(10)
+    app.exec()
+    poll.stop()
+    worker.join()
+    server.close()
+    del win.toggle_start_pause
+    if errors:
+        raise SystemExit(f"控制接口返回错误: {errors[:3]}")
+    state = [(c - s) / 1000 for s, c in zip(sent, changed)]
+    round_trip = [(r - s) / 1000 for s, r in zip(sent, replies)]
+    return state, round_trip
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        targets = (("TCP 127.0.0.1", "127.0.0.1:0"), ("Unix 套接字", os.path.join(tmp, "ppt-timer.sock")))
+        print(f"每种连接 {COMMANDS} 条 toggle_start_pause（单位 µs）")
+        print(f"{'连接':<14} {'状态改变 p50':>12} {'p99':>8} {'应答 p50':>10} {'p99':>8}")
+        for name, address in targets:
+            state, round_trip = measure(app, win, address)
+            print(f"{name:<14} {percentile(state, 0.5):>12.0f} {percentile(state, 0.99):>8.0f} "
+                  f"{percentile(round_trip, 0.5):>10.0f} {percentile(round_trip, 0.99):>8.0f}")
+    print("最终状态:", "运行中" if win.is_running else "暂停")
+
+
+if __name__ == "__main__":
+    main()
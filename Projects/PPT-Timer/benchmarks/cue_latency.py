@@ -0,0 +1,150 @@
+"""
+提示音的触发延迟（无界面，使用 open_audio() 给出的后端；没有声卡或 QtMultimedia 时为 NullAudio）：
+- 真实时钟：剩余时间设在阈值前 0.25 s 开始计时，测量从阈值时刻到提示音交给输出的延迟，
+  以及从跳秒回调开始到交给输出的耗时，30 s / 10 s / 结束各测多次；
+  判定只看回调到交给输出的耗时，阈值到输出的延迟含事件循环与定时器抖动，只报告不判定
+- 对照：若在到点时才合成提示音（旧式“到点再解码”的做法），单次合成的耗时
+- 虚拟时钟：窗口隐藏时也按时在三个阈值各响一次，且只多出这几次唤醒
+- 虚拟时钟：跳秒迟到、一次越过 30 s 与 10 s 两个阈值时只响 10 s 的提示音，不连响两声
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/cue_latency.py
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import audio_cues  # noqa: E402
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+ROUNDS = 5
+LEAD_S = 0.25
+TIMEOUT_S = 3
+# 跳秒回调开始到交给输出的耗时上限（不含事件循环与定时器误差）
+LATENCY_LIMIT_MS = 1.0
+
+
+def real_latency(win, seconds):
+    """返回 (阈值到交给输出 ms, 跳秒回调到交给输出 ms)。"""
+    audio = win.audio
+    entered = []
+    on_tick = win.on_tick
+
+    def traced_tick():
+        entered.append(time.perf_counter())
+        on_tick()
+
+    win.on_tick = traced_tick
+    try:
+        win.reset_timer()
+        win.engine.set_remaining(seconds + LEAD_S)
+        before = len(audio.played)
+        win.start_timer()
+        due = time.perf_counter() + win.engine.left() - seconds
+        deadline = time.perf_counter() + TIMEOUT_S
+        while len(audio.played) == before and time.perf_counter() < deadline:
+            QTest.qWait(1)
+        if len(audio.played) == before:
+            raise TimeoutError(f"{seconds} s 提示音没有触发")
+        _, at = audio.played[-1]
+        return (at - due) * 1000, (at - entered[-1]) * 1000
+    finally:
+        win.on_tick = on_tick
+        win.pause_timer()
+
+
+def hidden_run(buffers):
+    # 隐藏的窗口平时只在截止时刻醒一次；开了提示音时还要在两个阈值醒来
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    played = []
+    audio = audio_cues.NullAudio(buffers)
+    audio.play = lambda cue: played.append((cue, clock.now()))
+    win.audio = audio
+    win.power_mode = "hidden"
+    win.set_duration(2 * 60)
+    win.start_timer()
+    start = clock.now()
+    wakeups = 0
+    while win.is_running and clock.step() is not None:
+        wakeups += 1
+    deadline = start + 2 * 60
+    expected = [("warn", deadline - 30), ("urgent", deadline - 10), ("finish", deadline)]
+    on_time = [c for c, _ in played] == [c for c, _ in expected] and all(
+        abs(at - want) < 1e-6 for (_, at), (_, want) in zip(played, expected)
+    )
+    win.close()
+    return on_time, wakeups
+
+
+def jump_run(buffers):
+    # 像系统休眠后醒来那样，从 60 s 直接跳到剩 5 s
+    clock = VirtualClock(start=1000.0, exact=False)
+    win = CountdownWindow(clock)
+    audio = audio_cues.NullAudio(buffers)
+    win.audio = audio
+    win.set_duration(60)
+    win.start_timer()
+    clock.advance(55)
+    cues = [c for c, _ in audio.played]
+    win.close()
+    return cues
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    t0 = time.perf_counter()
+    audio = audio_cues.open_audio()
+    opened_ms = (time.perf_counter() - t0) * 1000
+    print(f"输出后端: {audio.name}，启动时合成并打开 {opened_ms:.1f} ms，"
+          f"缓冲 {sum(len(b) for b in audio.buffers.values()) / 1024:.0f} KB")
+
+    win = CountdownWindow()
+    win.audio = audio
+    win.show()
+    QTest.qWait(50)
+    rows = {}
+    for seconds, cue in ((30, "warn"), (10, "urgent"), (0, "finish")):
+        samples = [real_latency(win, seconds) for _ in range(ROUNDS)]
+        cues = [c for c, _ in audio.played[-ROUNDS:]]
+        if cues != [cue] * ROUNDS:
+            raise AssertionError(f"{seconds} s 处触发的提示音不对: {cues}")
+        rows[cue] = samples
+    win.close()
+
+    print(f"{'提示音':<8} {'阈值→输出 中位 ms':>18} {'最大 ms':>9} {'回调→输出 最大 ms':>18}")
+    for cue, samples in rows.items():
+        lateness = [a for a, _ in samples]
+        in_tick = [b for _, b in samples]
+        print(f"{cue:<8} {statistics.median(lateness):>18.3f} {max(lateness):>9.3f} {max(in_tick):>18.4f}")
+
+    synth = []
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        audio_cues.synthesize(audio_cues.CUES["finish"])
+        synth.append((time.perf_counter() - t0) * 1000)
+    print(f"对照：到点才合成结束提示音 {statistics.median(synth):.2f} ms/次（还未计打开设备）")
+
+    on_time, wakeups = hidden_run(audio.buffers)
+    print(f"隐藏窗口 2 分钟倒计时: 唤醒 {wakeups} 次，提示音{'按时' if on_time else '未按时'}")
+
+    jumped = jump_run(audio.buffers)
+    print(f"一次越过两个阈值: 响了 {jumped}")
+
+    worst = max(b for samples in rows.values() for _, b in samples)
+    ok = on_time and wakeups == 3 and jumped == ["urgent"] and worst < LATENCY_LIMIT_MS
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
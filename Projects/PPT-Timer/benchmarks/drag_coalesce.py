@@ -0,0 +1,60 @@
+"""
+拖动合帧效果：以 1000 Hz 的鼠标移动事件拖动窗口约 1 秒，
+统计请求的移动次数、实际执行的 move() 次数以及最差帧耗时。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/drag_coalesce.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt  # noqa: E402
+from PySide6.QtGui import QMouseEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+
+EVENTS = 1000
+
+
+def mouse(kind, pos, buttons):
+    p = QPointF(pos)
+    return QMouseEvent(kind, p, p, p, Qt.LeftButton, buttons, Qt.NoModifier)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+
+    # 离屏平台没有真实指针，直接进入按下状态
+    start = win.frameGeometry().topLeft()
+    win._press_pos = start
+    win._moved = False
+    win.dragging = True
+    win.drag_offset = start - win.frameGeometry().topLeft()
+
+    t0 = time.perf_counter()
+    for i in range(EVENTS):
+        # 每毫秒一个移动事件，模拟 1000 Hz 鼠标
+        due = t0 + i / 1000
+        while time.perf_counter() < due:
+            app.processEvents()
+        app.sendEvent(win, mouse(QEvent.MouseMove, start + QPoint(i % 400, i % 300), Qt.LeftButton))
+    app.sendEvent(win, mouse(QEvent.MouseButtonRelease, start, Qt.NoButton))
+    elapsed = time.perf_counter() - t0
+
+    stats = win.drag_stats
+    print(f"拖动时长 {elapsed:.2f} s  帧间隔 {win._frame_ms} ms")
+    print(f"请求移动 {stats['requested']}  实际移动 {stats['applied']}  "
+          f"最差帧 {stats['worst_frame_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
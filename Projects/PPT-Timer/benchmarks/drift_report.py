@@ -0,0 +1,104 @@
+"""
+计时漂移报告：用虚拟单调时钟驱动 CountdownWindow 跑完 3 小时，
+按真实剩余时间核对每一次秒数跳变，并与旧的逐秒递减方式对比。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/drift_report.py
+"""
+import os
+import random
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+DURATION = 180 * 60
+LIMIT = 0.020  # 允许的最大漂移（秒）
+
+
+class SlackModel:
+    """模拟定时器唤醒延迟：通常 0~3 ms，偶尔出现 50~400 ms 的事件循环卡顿。"""
+
+    def __init__(self, seed=1):
+        self.rng = random.Random(seed)
+
+    def __call__(self) -> float:
+        if self.rng.random() < 0.01:
+            return self.rng.uniform(0.050, 0.400)
+        return abs(self.rng.gauss(0.0015, 0.0008))
+
+
+def run_deadline(slack):
+    # exact=False：醒来晚了就在醒来时刻处理，模拟真实定时器的迟到
+    clock = VirtualClock(start=1000.0, exact=False)
+    win = CountdownWindow(clock)
+    win.total_seconds = DURATION
+    win.reset_timer()
+
+    true_left = float(DURATION)
+    worst_late = 0.0
+    worst_drift = 0.0
+    pauses = 0
+    last_late = 0.0
+    win.start_timer()
+    while win.is_running:
+        # 虚拟时钟越过下一次到期再叠加唤醒延迟，等同于定时器晚醒 late 秒
+        late = slack()
+        last_late = late
+        step = clock.next_due() - clock.now() + late
+        true_left -= step
+        before = win.remaining_seconds
+        clock.advance(step)
+        if win.remaining_seconds != before and win.is_running:
+            # 跳变到 s 的理想时刻是真实剩余恰好等于 s；超出部分即显示滞后
+            behind = win.remaining_seconds - true_left
+            worst_late = max(worst_late, behind)
+            # 去掉本次唤醒自身的延迟，剩下的才是累积漂移
+            worst_drift = max(worst_drift, abs(behind - late))
+        # 每 20 分钟暂停一次，检验暂停/继续是否精确衔接
+        if win.is_running and win.remaining_seconds % 1200 == 0 and before != win.remaining_seconds:
+            win.pause_timer()
+            clock.advance(slack() * 37)
+            win.start_timer()
+            pauses += 1
+    finish_error = -true_left
+    return {
+        "finish_error": finish_error,
+        "finish_drift": finish_error - last_late,
+        "worst_late": worst_late,
+        "worst_drift": worst_drift,
+        "pauses": pauses,
+    }
+
+
+def run_legacy(slack):
+    # 旧实现：每次 1000 ms 间隔触发后减 1，唤醒延迟逐次累积
+    elapsed = 0.0
+    for _ in range(DURATION):
+        elapsed += 1.0 + slack()
+    return {"finish_error": elapsed - DURATION}
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    new = run_deadline(SlackModel())
+    old = run_legacy(SlackModel())
+    print(f"倒计时时长: {DURATION // 60} 分钟")
+    print(f"截止时刻模式  结束误差 {new['finish_error'] * 1000:8.2f} ms  "
+          f"最大显示滞后 {new['worst_late'] * 1000:7.2f} ms  "
+          f"最大累积漂移 {new['worst_drift'] * 1000:6.3f} ms  "
+          f"结束漂移 {new['finish_drift'] * 1000:6.3f} ms  (暂停 {new['pauses']} 次)")
+    print(f"逐秒递减模式  结束误差 {old['finish_error'] * 1000:8.2f} ms")
+    ok = new["worst_drift"] < LIMIT and abs(new["finish_drift"]) < LIMIT
+    print("结果:", "通过" if ok else "失败", f"(漂移上限 {LIMIT * 1000:.0f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+计时核心（不依赖 Qt）的导入耗时与每次跳秒开销：
+- 新进程里分别导入 countdown_engine、clocks（时间源与唤醒队列）与 main（含 PySide6），取多次中位数，
+  并确认前两者没有带进 PySide6
+- 用手动推进的时间模拟 180 分钟完整倒计时，统计每次跳秒（left + sync + next_change + 颜色与文本）的耗时
+
+运行：
+    python benchmarks/engine_cost.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from countdown_engine import CountdownEngine  # noqa: E402
+
+RUNS = 7
+PROBE = (
+    "import sys, time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t, 'PySide6' in sys.modules)"
+)
+
+
+def import_cost(module):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    times = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        qt = out[1] == "True"
+    return statistics.median(times) * 1000, qt
+
+
+def tick_cost():
+    t = [0.0]
+    engine = CountdownEngine(lambda: t[0])
+    engine.set_duration(CountdownEngine.MAX_MINUTES * 60)
+    engine.start()
+    ticks = 0
+    left = engine.left()
+    start = time.perf_counter_ns()
+    while left > 0:
+        t[0] += engine.next_change(left)
+        left = engine.left()
+        if engine.sync(left):
+            engine.color_state()
+            engine.text()
+        ticks += 1
+    spent = time.perf_counter_ns() - start
+    engine.finish()
+    return ticks, spent / ticks
+
+
+def main():
+    engine_ms, engine_qt = import_cost("countdown_engine")
+    clocks_ms, clocks_qt = import_cost("clocks")
+    main_ms, _ = import_cost("main")
+    print(f"导入 countdown_engine: {engine_ms:6.2f} ms  （带入 PySide6: {'是' if engine_qt else '否'}）")
+    print(f"导入 clocks:           {clocks_ms:6.2f} ms  （带入 PySide6: {'是' if clocks_qt else '否'}）")
+    print(f"导入 main（Qt 窗口）:  {main_ms:6.2f} ms")
+    ticks, ns = tick_cost()
+    print(f"{CountdownEngine.MAX_MINUTES} 分钟倒计时: {ticks} 次跳秒，每次 {ns / 1000:.2f} µs（不含 Qt）")
+    ok = not engine_qt and not clocks_qt and engine_ms < main_ms and clocks_ms < main_ms and ticks == CountdownEngine.MAX_MINUTES * 60
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+悬停控制区淡入淡出的绘制开销：同一窗口分别用旧的 QGraphicsOpacityEffect 做法与现在的快照做法，
+测量控制区显示（不透明度 1）、隐藏（0）和淡入淡出中途（0.5）三种状态下整窗重绘的 CPU 时间，
+并统计连续多次悬停往返时重新截图的次数（应只在首次或尺寸/样式变化时截图），
+检查新窗口第一次淡入（控制区此前从未显示、排版）的中途确实画出了按钮。
+不透明度恰为 1 或 0 时 Qt 的不透明度效果本身会直接绘制源控件，两种做法在这两种状态下应相当。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/fade_paint.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import Property  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication, QGraphicsOpacityEffect, QWidget  # noqa: E402
+
+import main as timer_main  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+REPAINTS = 500
+ROUNDS = 5
+CYCLES = 20
+
+
+class EffectFadeWidget(QWidget):
+    """旧做法：整个控制区一直挂着不透明度效果，每次绘制都先渲染到离屏缓冲。"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.content = self
+        self._opacity_effect = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(self._opacity_effect)
+        self._opacity_effect.setOpacity(0.0)
+        self._opacity = 0.0
+
+    def getOpacity(self):
+        return self._opacity
+
+    def setOpacity(self, value):
+        self._opacity = value
+        self._opacity_effect.setOpacity(value)
+
+    opacity = Property(float, getOpacity, setOpacity)
+
+
+def make_window(app, fade_class):
+    saved, timer_main.FadeWidget = timer_main.FadeWidget, fade_class
+    try:
+        win = CountdownWindow()
+    finally:
+        timer_main.FadeWidget = saved
+    win.show()
+    app.processEvents()
+    return win
+
+
+def set_opacity(app, win, value):
+    win.hover_anim.stop()
+    win.hover_controls.setVisible(value > 0.0)
+    win.hover_controls.setOpacity(value)
+    app.processEvents()
+
+
+def repaint_cost(win):
+    cpu0 = time.process_time()
+    for _ in range(REPAINTS):
+        win.repaint()
+    return (time.process_time() - cpu0) / REPAINTS * 1e6
+
+
+def measure(app, fade_class):
+    win = make_window(app, fade_class)
+    costs = {}
+    for name, value in (("显示", 1.0), ("隐藏", 0.0), ("淡入淡出中", 0.5)):
+        set_opacity(app, win, value)
+        costs[name] = min(repaint_cost(win) for _ in range(ROUNDS))
+    win.close()
+    win.deleteLater()
+    return costs
+
+
+def snapshot_count(app):
+    win = make_window(app, timer_main.FadeWidget)
+    for _ in range(CYCLES):
+        for value in (0.25, 0.5, 0.75, 1.0, 0.75, 0.5, 0.25, 0.0):
+            set_opacity(app, win, value)
+    count = win.hover_controls.snapshots
+    win.close()
+    win.deleteLater()
+    return count
+
+
+def first_fade_pixels(app):
+    # 第一次淡入走到一半时，控制区范围内不透明的像素数
+    win = make_window(app, timer_main.FadeWidget)
+    win.set_hover_visible(True)
+    QTest.qWait(CountdownWindow.HOVER_FADE_MS // 2)
+    controls = win.hover_controls
+    fading = controls._fading
+    image = win.grab().toImage()
+    r = controls.geometry()
+    drawn = sum(
+        1 for x in range(r.left(), r.right() + 1) for y in range(r.top(), r.bottom() + 1)
+        if image.pixelColor(x, y).alpha() > 0
+    )
+    win.close()
+    win.deleteLater()
+    return drawn if fading else 0
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    rows = {"效果（旧）": measure(app, EffectFadeWidget), "快照": measure(app, timer_main.FadeWidget)}
+    states = ("显示", "隐藏", "淡入淡出中")
+    print(f"{'做法':<10}" + "".join(f"{s + ' µs':>14}" for s in states))
+    for name, costs in rows.items():
+        print(f"{name:<10}" + "".join(f"{costs[s]:>14.1f}" for s in states))
+    snapshots = snapshot_count(app)
+    print(f"{CYCLES} 次淡入淡出往返: 截图 {snapshots} 次")
+    drawn = first_fade_pixels(app)
+    print(f"首次淡入中途: 控制区画出 {drawn} 个像素")
+    ok = drawn > 0 and snapshots <= 2 and rows["快照"]["淡入淡出中"] < rows["效果（旧）"]["淡入淡出中"]
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
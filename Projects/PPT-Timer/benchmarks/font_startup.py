@@ -0,0 +1,112 @@
+"""
+启动时字体解析的耗时：每种情形都在新进程里测量（QApplication 建好之后）
+从请求字体到 QFontMetrics / QFontInfo 得出结果的时间，取多次中位数。
+- 旧做法：直接请求 QFont("Segoe UI", 40, Bold)，交给系统回退匹配
+- 自带字体：首次启动（无缓存）与再次启动（命中 settings.ini 缓存）
+- 自带字体不可用（指向不存在的文件）：首次需要枚举系统字体族，再次启动直接用缓存
+fontconfig 用单独的配置文件（FONTCONFIG_FILE）扫描系统字体目录，缓存目录分冷（每次新建，需重新扫描）/热（预先跑过一次）两种情况。
+计时只是参考（字体少的机器上差别很小），通过条件是字体族解析正确、缓存命中后结果不变。
+
+运行：
+    python benchmarks/font_startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 7
+
+PROBE = """
+import sys, time
+from PySide6.QtGui import QFont, QFontInfo, QFontMetrics
+from PySide6.QtWidgets import QApplication
+import timer_font
+
+app = QApplication([])
+mode, path, settings = sys.argv[1:4]
+t = time.perf_counter()
+if mode == "legacy":
+    font = QFont("Segoe UI", timer_font.POINT_SIZE, QFont.Bold)
+else:
+    font = QFont(timer_font.resolve_family(path, settings), timer_font.POINT_SIZE, QFont.Bold)
+QFontMetrics(font).horizontalAdvance("00:00")
+family = QFontInfo(font).family()
+print(time.perf_counter() - t, family, sep="\\t")
+"""
+
+
+FONTS_CONF = """<?xml version="1.0"?>
+<!DOCTYPE fontconfig SYSTEM "fonts.dtd">
+<fontconfig>
+  <dir>/usr/share/fonts</dir>
+  <dir>/usr/local/share/fonts</dir>
+  <dir>~/.fonts</dir>
+  <cachedir>{cache}</cachedir>
+</fontconfig>
+"""
+
+
+def probe(mode, path, settings, cache_dir):
+    conf = cache_dir + ".conf"
+    if not os.path.exists(conf):
+        with open(conf, "w", encoding="utf-8") as f:
+            f.write(FONTS_CONF.format(cache=cache_dir))
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", FONTCONFIG_FILE=conf)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, mode, str(path), str(settings)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    seconds, family = out.split("\t")
+    return float(seconds) * 1000, family
+
+
+def measure(tmp, name, mode, path):
+    """返回 {(冷/热, 首次/缓存): (ms 中位数, 字体族集合)}。"""
+    warm = os.path.join(tmp, "fc-warm")
+    probe(mode, path, os.path.join(tmp, "prime.ini"), warm)
+    samples = {}
+    for i in range(RUNS):
+        settings = os.path.join(tmp, f"{name}-{i}.ini")
+        for fc in ("冷", "热"):
+            if os.path.exists(settings):
+                os.remove(settings)
+            for run in ("首次", "缓存"):
+                # 冷：每次用新的 fontconfig 缓存目录；热：用预先跑过一次的目录
+                cache_dir = os.path.join(tmp, f"fc-{name}-{i}-{run}") if fc == "冷" else warm
+                samples.setdefault((fc, run), []).append(probe(mode, path, settings, cache_dir))
+    return {k: (statistics.median(ms for ms, _ in v), {f for _, f in v}) for k, v in samples.items()}
+
+
+def main():
+    bundled = ROOT / "fonts" / "PPTTimerDigits-Bold.ttf"
+    with tempfile.TemporaryDirectory() as tmp:
+        missing = Path(tmp) / "missing.ttf"
+        results = {
+            "旧做法 Segoe UI": measure(tmp, "legacy", "legacy", bundled),
+            "自带字体": measure(tmp, "bundled", "resolve", bundled),
+            "自带字体不可用": measure(tmp, "fallback", "resolve", missing),
+        }
+
+    print(f"{'情形':<14} {'fontconfig':>10} {'首次 ms':>9} {'缓存 ms':>9}  字体族")
+    for name, r in results.items():
+        for fc in ("冷", "热"):
+            first, fam = r[(fc, "首次")]
+            cached, fam2 = r[(fc, "缓存")]
+            print(f"{name:<14} {fc:>10} {first:>9.2f} {cached:>9.2f}  {', '.join(sorted(fam | fam2))}")
+
+    bundled_r = results["自带字体"]
+    fallback_r = results["自带字体不可用"]
+    ok = (
+        all(fam == {"PPT Timer Digits"} for _, fam in bundled_r.values())
+        and len({f for _, fam in fallback_r.values() for f in fam}) == 1
+    )
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
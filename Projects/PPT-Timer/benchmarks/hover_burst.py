@@ -0,0 +1,58 @@
+"""
+悬停状态机的事件合并效果：模拟鼠标在窗口、时间标签和控制区之间穿行时
+产生的成串 Enter/Leave，统计收到的事件数、命中测试次数与状态转换次数。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/hover_burst.py
+"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QEvent, QPointF  # noqa: E402
+from PySide6.QtGui import QEnterEvent  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+
+PASSES = 40
+
+
+def enter():
+    p = QPointF(1, 1)
+    return QEnterEvent(p, p, p)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+
+    inside = [False]
+    win._pointer_inside = lambda: inside[0]
+    children = (win, win.time_label, win.hover_controls)
+
+    for i in range(PASSES):
+        inside[0] = i % 2 == 0
+        # 一次穿行：在三个控件之间来回进出，事件在几毫秒内到达
+        for _ in range(3):
+            for w in children:
+                app.sendEvent(w, enter())
+                app.sendEvent(w, QEvent(QEvent.Leave))
+        QTest.qWait(CountdownWindow.HOVER_DEBOUNCE_MS + 20)
+    QTest.qWait(CountdownWindow.HOVER_FADE_MS + 50)
+
+    stats = win.hover_stats
+    print(f"穿行次数: {PASSES}")
+    print(f"收到事件 {stats['events']}  命中测试 {stats['hit_tests']}  "
+          f"状态转换 {stats['transitions']}  最终状态 {win._hover_state}")
+    print(f"每次转换对应事件: {stats['events'] / max(1, stats['transitions']):.1f}")
+
+
+if __name__ == "__main__":
+    main()
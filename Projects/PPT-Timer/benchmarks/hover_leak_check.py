@@ -0,0 +1,61 @@
+"""
+悬停淡入淡出泄漏检查：反复进出 10000 次后，窗口下的 QObject 数量不应增长，
+且中途打断的淡出会平滑反向，不会出现多个动画同时写 opacity。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/hover_leak_check.py
+"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QAbstractAnimation, QObject, QPropertyAnimation  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+
+CYCLES = 10_000
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+
+    before = len(win.findChildren(QObject))
+    for i in range(CYCLES):
+        win.set_hover_visible(True)
+        win.set_hover_visible(True)  # 已在目标上：应当什么都不做
+        win.set_hover_visible(False)
+        if i % 500 == 0:
+            app.processEvents()
+    app.processEvents()
+    after = len(win.findChildren(QObject))
+    animations = len(win.findChildren(QPropertyAnimation))
+
+    # 淡入途中改为淡出：同一个动画反向，从当前值出发
+    win.set_hover_visible(False, instant=True)
+    win.set_hover_visible(True)
+    win.hover_anim.setCurrentTime(win.hover_anim.duration() // 2)
+    mid = win.hover_controls.getOpacity()
+    win.set_hover_visible(False)
+    reversed_ok = (
+        win.hover_anim.state() == QAbstractAnimation.Running
+        and win.hover_anim.startValue() == mid
+        and win.hover_anim.endValue() == 0.0
+    )
+
+    print(f"悬停循环: {CYCLES}")
+    print(f"QObject 子对象: {before} -> {after}  动画对象: {animations}")
+    print(f"中途反向: 起点 {mid:.2f}, 时长 {win.hover_anim.duration()} ms")
+    ok = after == before and animations == 1 and reversed_ok
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
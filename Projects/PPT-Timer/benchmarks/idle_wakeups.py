@@ -0,0 +1,63 @@
+"""
+各状态下的计时唤醒次数：在真实事件循环里分别停留几秒，
+用 WakeScheduler 的唤醒计数换算成每分钟唤醒数。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/idle_wakeups.py
+"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+
+WINDOW_S = 5
+
+
+def rate(win, seconds=WINDOW_S):
+    before = len(win.scheduler._wakeups)
+    QTest.qWait(seconds * 1000)
+    return (len(win.scheduler._wakeups) - before) * 60 / seconds
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    win = CountdownWindow()
+    win.show()
+    QTest.qWait(50)
+
+    rows = []
+    win.start_timer()
+    rows.append(("运行中", rate(win)))
+    win.pause_timer()
+    rows.append(("暂停", rate(win)))
+    win.start_timer()
+    win.hide()
+    rows.append(("运行中 + 隐藏", rate(win)))
+    win.show()
+    QTest.qWait(50)
+    # 离屏平台不会报告遮挡，这里直接切换到遮挡模式
+    win.power_mode = "occluded"
+    win.on_tick()
+    rows.append(("运行中 + 被遮挡", rate(win)))
+    win.power_mode = "visible"
+    win.total_seconds = 10
+    win.reset_timer()
+    win.start_timer()
+    rows.append(("最后 10 秒闪烁", rate(win)))
+    QTest.qWait((10 - WINDOW_S) * 1000 + int(CountdownWindow.FINISH_FLASH_S * 1000) + 200)
+    rows.append(("结束后", rate(win)))
+
+    for name, per_min in rows:
+        print(f"{name:<12} {per_min:6.0f} 次/分钟")
+    print(f"最近一分钟累计唤醒: {win.wakeups_per_minute()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+镜像组播扇出：本机回环上 1 个发布端 + 50 个订阅端（同一进程，各自独立的 UDP 套接字），
+逐帧发布并统计每个订阅端从发出到显示回调的延迟、送达率；
+再注入迟到、重复和损坏的包，确认订阅端按序号丢弃，镜像窗口本地没有计时登记。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/mirror_fanout.py
+"""
+import os
+import random
+import socket
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+from mirror import FRAME, MirrorPublisher, MirrorSubscriber, pack_frame  # noqa: E402
+
+SUBSCRIBERS = 50
+FRAMES = 300
+GROUP = "239.255.42.99"
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def pump(app, until, timeout=1.0):
+    end = time.perf_counter() + timeout
+    while not until() and time.perf_counter() < end:
+        app.processEvents()
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    address = f"{GROUP}:{random.randint(40000, 60000)}"
+
+    source = CountdownWindow()
+    source.show()
+    app.processEvents()
+    publisher = MirrorPublisher(source, address)
+    app.processEvents()
+
+    sent_at = {}
+    latencies = []
+    shown = [0] * SUBSCRIBERS
+
+    def make_callback(i):
+        def on_frame(frame):
+            t = sent_at.get(frame.seq)
+            if t is not None:
+                latencies.append((time.perf_counter_ns() - t) / 1000)
+            shown[i] = frame.seq
+        return on_frame
+
+    subscribers = [MirrorSubscriber(make_callback(i), address) for i in range(SUBSCRIBERS)]
+    mirror = CountdownWindow()
+    mirror.set_read_only()
+    mirror_sub = MirrorSubscriber(
+        lambda frame: mirror.show_remote_state(frame.remaining_ms, frame.color), address)
+    mirror.show()
+    app.processEvents()
+    # 订阅端加入之前发出的帧不计入
+    sent_before = publisher.sent
+
+    source.start_timer()
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        sent_at[publisher.seq + 1] = time.perf_counter_ns()
+        publisher.publish()
+        seq = publisher.seq
+        pump(app, lambda: min(shown) >= seq)
+    spent = time.perf_counter() - t0
+    source.pause_timer()
+    app.processEvents()
+    pump(app, lambda: min(shown) >= publisher.seq)
+
+    delivered = sum(s.stats["received"] for s in subscribers)
+    expected = SUBSCRIBERS * (publisher.sent - sent_before)
+
+    # 注入：旧序号、重复帧、损坏帧都应被丢弃，显示保持不变
+    before = mirror.time_label.text()
+    last = publisher.seq
+    inject = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    inject.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    host, _, port = address.rpartition(":")
+    stale = pack_frame(publisher.session, last - 5, True, False, "red_on", 1000, 60)
+    dup = pack_frame(publisher.session, last, True, False, "red_on", 1000, 60)
+    for data in (stale, dup, b"\0" * FRAME.size):
+        inject.sendto(data, (host, int(port)))
+    pump(app, lambda: mirror_sub.stats["dropped"] + mirror_sub.stats["malformed"] >= 3)
+    inject.close()
+    after = mirror.time_label.text()
+    local_ticks = [k for k in mirror.scheduler._due if k[0] == id(mirror)]
+
+    print(f"订阅端 {SUBSCRIBERS} 个，发布 {publisher.sent - sent_before} 帧（每帧 {FRAME.size} 字节），耗时 {spent:.2f} s")
+    print(f"送达 {delivered}/{expected} ({delivered / expected:.1%})")
+    print(f"发出 -> 显示回调延迟: p50 {percentile(latencies, 0.5):.0f} µs  "
+          f"p99 {percentile(latencies, 0.99):.0f} µs  最大 {max(latencies):.0f} µs")
+    print(f"镜像窗口: 显示 {after}（源 {source.time_label.text()}）  统计 {mirror_sub.stats}")
+    print(f"镜像窗口本地计时登记: {len(local_ticks)}")
+    ok = (
+        delivered == expected
+        and after == before == source.time_label.text()
+        and mirror_sub.stats["dropped"] >= 2
+        and mirror_sub.stats["malformed"] >= 1
+        and not local_ticks
+    )
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+多计时器扩展性：1/10/100/500 个倒计时窗口在同一进程中运行，
+对比 TimerManager 共享心跳与每个窗口各自调度两种方式的 CPU、RSS 与唤醒次数。
+每种规模在独立子进程中测量，避免 RSS 互相影响。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/multi_timer_scaling.py [--seconds 5]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+COUNTS = (1, 10, 100, 500)
+
+
+def rss_kb() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def child(count, mode, seconds):
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QApplication
+
+    from main import CountdownWindow, TimerManager
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    rss0 = rss_kb()
+    if mode == "shared":
+        manager = TimerManager()
+        windows = [manager.create_window() for _ in range(count)]
+        schedulers = [manager.scheduler]
+    else:
+        windows = [CountdownWindow() for _ in range(count)]
+        schedulers = [w.scheduler for w in windows]
+    rng = random.Random(count)
+    redraws = [0]
+    for win in windows:
+        win.show()
+        original = win.update_time_view
+
+        def counted(original=original):
+            redraws[0] += 1
+            original()
+
+        win.update_time_view = counted
+    QTest.qWait(100)
+    # 各计时器在一秒内随机错开启动，模拟不同时间开始的分会场
+    for win in windows:
+        win.total_seconds = rng.randint(5, 60) * 60
+        win.reset_timer()
+    for win in windows:
+        win.start_timer()
+        time.sleep(rng.random() / count)
+    redraws[0] = 0
+    wake0 = sum(len(s._wakeups) for s in schedulers)
+    cpu0 = time.process_time()
+    QTest.qWait(int(seconds * 1000))
+    cpu = time.process_time() - cpu0
+    wakeups = sum(len(s._wakeups) for s in schedulers) - wake0
+    return {
+        "timers": count,
+        "mode": mode,
+        "cpu_ms_per_s": cpu / seconds * 1000,
+        "wakeups_per_s": wakeups / seconds,
+        "redraws_per_s": redraws[0] / seconds,
+        "rss_kb": rss_kb(),
+        "rss_growth_kb": rss_kb() - rss0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--child", nargs=2, metavar=("COUNT", "MODE"))
+    parser.add_argument("--json", help="结果 JSON 路径")
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child(int(args.child[0]), args.child[1], args.seconds)))
+        return
+
+    rows = []
+    for count in COUNTS:
+        for mode in ("shared", "separate"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", str(count), mode, "--seconds", str(args.seconds)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            row = json.loads(out.strip().splitlines()[-1])
+            rows.append(row)
+            print(f"{row['timers']:>4} 个 {row['mode']:<8} CPU {row['cpu_ms_per_s']:7.1f} ms/s  "
+                  f"唤醒 {row['wakeups_per_s']:7.1f}/s  重绘 {row['redraws_per_s']:7.1f}/s  "
+                  f"RSS {row['rss_kb'] / 1024:6.1f} MB (+{row['rss_growth_kb'] / 1024:.1f})")
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+时间显示的绘制开销：QLabel 整体排版重绘 vs TimeDisplay 图集局部重绘。
+两者都放进与主窗口相同的无边框透明顶层窗口，逐秒走完 MAX_MINUTES 的前若干秒。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/paint_cost.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QEvent, QObject, Qt  # noqa: E402
+from PySide6.QtGui import QColor, QFont, QPalette  # noqa: E402
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget  # noqa: E402
+
+from countdown_engine import CountdownEngine  # noqa: E402
+from main import CountdownWindow, TimeDisplay  # noqa: E402
+
+TICKS = 1200
+
+
+class PaintTimer(QObject):
+    """累计目标控件 Paint 事件的处理耗时与重绘面积。"""
+
+    def __init__(self, target):
+        super().__init__(target)
+        self.target = target
+        self.spent = 0.0
+        self.area = 0
+        self.count = 0
+        target.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            rect = event.rect()
+            self.area += rect.width() * rect.height()
+            self.count += 1
+            t0 = time.perf_counter()
+            obj.event(event)
+            self.spent += time.perf_counter() - t0
+            return True
+        return False
+
+
+def host(widget):
+    top = QWidget()
+    top.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+    top.setAttribute(Qt.WA_TranslucentBackground, True)
+    layout = QVBoxLayout(top)
+    layout.addWidget(widget)
+    widget.setFont(QFont("Segoe UI", 40, QFont.Bold))
+    palette = QPalette(widget.palette())
+    palette.setColor(QPalette.WindowText, QColor(CountdownWindow.COLOR_NORMAL))
+    widget.setPalette(palette)
+    top.show()
+    return top
+
+
+def measure(app, widget):
+    top = host(widget)
+    app.processEvents()
+    probe = PaintTimer(widget)
+    start = CountdownWindow.MAX_MINUTES * 60
+    for i in range(TICKS):
+        widget.setText(CountdownEngine.format_time(start - i))
+        app.processEvents()
+    top.close()
+    return probe
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    label = QLabel("180:00")
+    label.setAlignment(Qt.AlignCenter)
+    rows = [("QLabel", measure(app, label)), ("TimeDisplay", measure(app, TimeDisplay("180:00")))]
+    print(f"刷新次数: {TICKS}")
+    for name, probe in rows:
+        print(f"{name:<12} 绘制 {probe.spent / TICKS * 1e6:7.1f} us/次  "
+              f"Paint 事件 {probe.count}  平均重绘面积 {probe.area / max(1, probe.count):8.0f} px")
+
+
+if __name__ == "__main__":
+    main()
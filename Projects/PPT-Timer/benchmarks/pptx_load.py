@@ -0,0 +1,258 @@
+"""
+演示文稿节奏基准：在临时目录生成 500 页、约 200 MB 媒体的 .pptx（页序与文件编号打乱，
+夹杂隐藏页，备注长短不一，另有一份 Strict 命名空间的小文件），测量：
+- 首次加载（解析 XML 部件并写缓存）、再次加载（命中缓存）、只改时间戳后的加载（比对中央目录摘要）
+- 解析时的峰值内存
+并检查页序、标题、隐藏标记与备注长度解析正确，预算合计等于总时长，修改内容后缓存失效，
+以及窗口里的页码随倒计时推进（虚拟时钟，offscreen）；全部隐藏的演示文稿在命令行上报错退出而不是抛异常。
+
+运行：
+    python benchmarks/pptx_load.py [--slides 500] [--media-mb 200]
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pptx_pacing  # noqa: E402
+from pptx_pacing import load_deck, parse_deck  # noqa: E402
+
+NS = {
+    "transitional": (
+        "http://schemas.openxmlformats.org/presentationml/2006/main",
+        "http://schemas.openxmlformats.org/drawingml/2006/main",
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    ),
+    "strict": (
+        "http://purl.oclc.org/ooxml/presentationml/main",
+        "http://purl.oclc.org/ooxml/drawingml/main",
+        "http://purl.oclc.org/ooxml/officeDocument/relationships",
+    ),
+}
+PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WORDS = "节奏 预算 演示 幻灯片 计时 演讲 备注 观众 总结 问题 数据 方案".split()
+TOTAL_SECONDS = 45 * 60
+
+
+def shape(a, ph, paragraphs):
+    ph_attr = f' type="{ph}"' if ph else ""
+    body = "".join(f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>" for text in paragraphs)
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="2" name="s"/><p:cNvSpPr/><p:nvPr><p:ph{ph_attr}/></p:nvPr></p:nvSpPr>'
+        f"<p:spPr/><p:txBody><a:bodyPr/>{body}</p:txBody></p:sp>"
+    )
+
+
+def slide_xml(ns, title, hidden, bullets):
+    p, a, r = NS[ns]
+    show = ' show="0"' if hidden else ""
+    pic = (
+        '<p:pic><p:nvPicPr><p:cNvPr id="4" name="pic"/><p:cNvPicPr/><p:nvPr/></p:nvPicPr>'
+        '<p:blipFill><a:blip r:embed="rId3"/></p:blipFill><p:spPr/></p:pic>'
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sld xmlns:p="{p}" xmlns:a="{a}" xmlns:r="{r}"{show}><p:cSld><p:spTree>'
+        f'<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+        f'{shape(a, "title", [title])}{shape(a, None, bullets)}{pic}'
+        f"</p:spTree></p:cSld></p:sld>"
+    )
+
+
+def notes_xml(ns, number, paragraphs):
+    p, a, r = NS[ns]
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:notes xmlns:p="{p}" xmlns:a="{a}" xmlns:r="{r}"><p:cSld><p:spTree>'
+        f'<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+        f'{shape(a, "sldImg", [])}{shape(a, "body", paragraphs)}{shape(a, "sldNum", [str(number)])}'
+        f"</p:spTree></p:cSld></p:notes>"
+    )
+
+
+def rels_xml(rels):
+    items = "".join(f'<Relationship Id="{rid}" Type="{REL}/{kind}" Target="{target}"/>' for rid, kind, target in rels)
+    return f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><Relationships xmlns="{PKG_RELS}">{items}</Relationships>'
+
+
+def generate(path, slides, media_mb, ns="transitional", seed=7, hidden_share=0.08):
+    """写出一份 .pptx，返回按放映顺序的期望值 [(标题, 隐藏, 备注字符数)]。"""
+    rng = random.Random(seed)
+    p, a, r = NS[ns]
+    files = list(range(1, slides + 1))
+    rng.shuffle(files)  # 放映顺序与 slideN.xml 的编号无关
+    media_bytes = media_mb * 1024 * 1024
+    media_count = max(1, min(slides, 50))
+    expected = []
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>')
+        zf.writestr("_rels/.rels", rels_xml([("rId1", "officeDocument", "ppt/presentation.xml")]))
+        ids = "".join(f'<p:sldId id="{256 + i}" r:id="rId{100 + n}"/>' for i, n in enumerate(files))
+        zf.writestr("ppt/presentation.xml", (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<p:presentation xmlns:p="{p}" xmlns:a="{a}" xmlns:r="{r}">'
+            f'<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+            f'<p:sldIdLst>{ids}</p:sldIdLst><p:sldSz cx="12192000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+            f"</p:presentation>"
+        ))
+        zf.writestr("ppt/_rels/presentation.xml.rels", rels_xml(
+            [("rId1", "slideMaster", "slideMasters/slideMaster1.xml")]
+            + [(f"rId{100 + n}", "slide", f"slides/slide{n}.xml") for n in files]
+        ))
+        for order, n in enumerate(files):
+            title = f"第 {order + 1} 节 {rng.choice(WORDS)}"
+            hidden = rng.random() < hidden_share
+            paragraphs = [" ".join(rng.choices(WORDS, k=rng.randint(2, 30))) for _ in range(rng.randint(0, 6))]
+            bullets = [" ".join(rng.choices(WORDS, k=5)) for _ in range(4)]
+            zf.writestr(f"ppt/slides/slide{n}.xml", slide_xml(ns, title, hidden, bullets))
+            rels = [("rId1", "slideLayout", "../slideLayouts/slideLayout2.xml"),
+                    ("rId3", "image", f"../media/image{n % media_count + 1}.png")]
+            if paragraphs:
+                rels.append(("rId2", "notesSlide", f"../notesSlides/notesSlide{n}.xml"))
+                zf.writestr(f"ppt/notesSlides/notesSlide{n}.xml", notes_xml(ns, order + 1, paragraphs))
+            zf.writestr(f"ppt/slides/_rels/slide{n}.xml.rels", rels_xml(rels))
+            expected.append((title, hidden, len("".join(paragraphs))))
+        # 媒体已是压缩格式，按 PowerPoint 的做法不再压缩存放
+        chunk = rng.randbytes(1024 * 1024)
+        per_file = media_bytes // media_count
+        for i in range(media_count):
+            with zf.open(zipfile.ZipInfo(f"ppt/media/image{i + 1}.png"), "w") as f:
+                for _ in range(per_file // len(chunk)):
+                    f.write(chunk)
+    return expected
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def matches(deck, expected):
+    return [(deck.titles[i], bool(deck.hidden[i]), deck.notes_chars[i]) for i in range(len(deck))] == expected
+
+
+def plan_checks(deck):
+    ok = True
+    for weighting in pptx_pacing.WEIGHTINGS:
+        for include_hidden in (False, True):
+            plan = deck.plan(TOTAL_SECONDS, weighting, include_hidden)
+            budgets = [plan.budget(i) for i in range(len(plan))]
+            ok &= sum(budgets) == TOTAL_SECONDS and min(budgets) > 0
+            ok &= len(plan) == (len(deck) if include_hidden else len(deck) - sum(deck.hidden))
+            ok &= plan.index_at(0) == 0 and plan.index_at(TOTAL_SECONDS + 60) == len(plan) - 1
+    equal = deck.plan(TOTAL_SECONDS, "equal")
+    ok &= max(equal.budget(i) for i in range(len(equal))) - min(equal.budget(i) for i in range(len(equal))) <= 1
+    notes = deck.plan(TOTAL_SECONDS, "notes")
+    longest = max(range(len(notes)), key=lambda i: deck.notes_chars[notes.slides[i]])
+    shortest = min(range(len(notes)), key=lambda i: deck.notes_chars[notes.slides[i]])
+    return ok and notes.budget(longest) > notes.budget(shortest)
+
+
+def window_check(deck):
+    # 倒计时推进时页码随之前进，总时长变了重新分配
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from clocks import VirtualClock
+    from main import CountdownWindow
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    win.set_duration(TOTAL_SECONDS)
+    win.load_deck(deck, "notes")
+    plan = deck.plan(TOTAL_SECONDS, "notes")
+    first = win.pace_label.text()
+    win.start_timer()
+    clock.advance(plan.ends[2] + 0.5)
+    app.processEvents()
+    third = win.pace_label.text()
+    win.set_duration(10 * 60)
+    shorter = win.pace_label.text()
+    ok = (
+        first == pptx_pacing.pace_text(deck, plan, 0)
+        and third == pptx_pacing.pace_text(deck, plan, 3)
+        and shorter == pptx_pacing.pace_text(deck, deck.plan(10 * 60, "notes"), 0)
+        and win.pace_label.isVisibleTo(win)
+    )
+    win.close()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=500)
+    parser.add_argument("--media-mb", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PPT_TIMER_DECK_CACHE"] = os.path.join(tmp, "cache")
+        path = Path(tmp) / "deck.pptx"
+        expected = generate(path, args.slides, args.media_mb)
+        print(f"{args.slides} 页，文件 {path.stat().st_size / 1e6:.1f} MB")
+
+        deck, cold = timed(load_deck, path)
+        cached, warm = timed(load_deck, path)
+        os.utime(path, ns=(time.time_ns(), time.time_ns()))
+        touched, t_touch = timed(load_deck, path)
+        print(f"首次加载（解析 + 写缓存）   {cold * 1000:8.1f} ms")
+        print(f"再次加载（命中缓存）        {warm * 1000:8.1f} ms")
+        print(f"改时间戳后（比对摘要）      {t_touch * 1000:8.1f} ms")
+
+        tracemalloc.start()
+        parse_deck(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"解析峰值内存 {peak / 1e6:.2f} MB")
+
+        ok_parse = matches(deck, expected) and matches(cached, expected) and matches(touched, expected)
+        print(f"页序/标题/隐藏/备注解析: {'正确' if ok_parse else '错误'}")
+
+        # 内容变化（同样大小也算）后缓存必须失效
+        changed = generate(path, args.slides, args.media_mb, seed=8)
+        ok_invalidate = matches(load_deck(path), changed)
+        print(f"修改内容后重新解析: {'是' if ok_invalidate else '否'}")
+
+        # 全部隐藏：Deck 报 DeckError，main.py 在启动 Qt 之前给出命令行错误
+        hidden_path = Path(tmp) / "hidden.pptx"
+        generate(hidden_path, 5, 1, hidden_share=1.0)
+        try:
+            load_deck(hidden_path).playable()
+            ok_hidden = False
+        except pptx_pacing.DeckError:
+            ok_hidden = True
+        cli = subprocess.run(
+            [sys.executable, "main.py", "--pptx", str(hidden_path), "--timers", "2"],
+            cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, timeout=60,
+            env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+        )
+        ok_hidden = ok_hidden and cli.returncode == 2 and "Traceback" not in cli.stderr and "隐藏" in cli.stderr
+        print(f"全部隐藏的演示文稿: {'命令行报错' if ok_hidden else '未正确报错'}")
+
+        strict_path = Path(tmp) / "strict.pptx"
+        strict_expected = generate(strict_path, 12, 1, ns="strict")
+        ok_strict = matches(load_deck(strict_path), strict_expected)
+        print(f"Strict 命名空间: {'正确' if ok_strict else '错误'}")
+
+    ok_plan = plan_checks(deck)
+    print(f"预算分配（合计等于总时长、备注加权、隐藏页）: {'正确' if ok_plan else '错误'}")
+    ok_window = window_check(deck)
+    print(f"窗口页码随倒计时推进: {'正确' if ok_window else '错误'}")
+
+    ok = ok_parse and ok_invalidate and ok_hidden and ok_strict and ok_plan and ok_window and cold < 1.0 and warm < 0.05
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+每次刷新的开销：对比旧的「每次 setStyleSheet」与颜色状态调色板两种方式，
+统计时间标签收到的 polish / 样式 / 调色板 / 重绘事件以及单次刷新耗时。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/render_cost.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from main import CountdownWindow  # noqa: E402
+
+TICKS = 600
+
+
+def legacy_update(win):
+    # 旧实现：每次刷新都拼一段样式表
+    if win.remaining_seconds <= 10:
+        color = win.COLOR_RED if win.blink_state else win.COLOR_RED_DIM
+    elif win.remaining_seconds <= 30:
+        color = win.COLOR_ORANGE
+    else:
+        color = win.COLOR_NORMAL
+    win.time_label.setStyleSheet(f"QLabel{{color:{color}; background: transparent;}}")
+    win.time_label.setText(win.format_time(win.remaining_seconds))
+
+
+def measure(app, update):
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+    win.render_stats.reset()
+    spent = 0.0
+    for i in range(TICKS):
+        # 覆盖常规、橙色与红色闪烁三段
+        win.remaining_seconds = TICKS - i
+        win.blink_state = bool(i % 2)
+        t0 = time.perf_counter()
+        update(win)
+        app.processEvents()
+        spent += time.perf_counter() - t0
+    counts = dict(win.render_stats.counts)
+    win.close()
+    return spent / TICKS, counts
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    rows = [
+        ("setStyleSheet", measure(app, legacy_update)),
+        ("颜色状态调色板", measure(app, CountdownWindow.update_time_view)),
+    ]
+    print(f"刷新次数: {TICKS}")
+    for name, (per_tick, counts) in rows:
+        per = {k: v / TICKS for k, v in counts.items()}
+        print(f"{name:<14} 每次 {per_tick * 1e6:8.1f} us  "
+              + "  ".join(f"{k}={v:.3f}" for k, v in per.items()))
+
+
+if __name__ == "__main__":
+    main()
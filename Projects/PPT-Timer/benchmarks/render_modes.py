@@ -0,0 +1,136 @@
+"""
+三种渲染方式（translucent / mask / solid）的重绘开销与合成面积：
+- 整窗重绘（repaint）与跳秒（虚拟时钟逐步推进）的 CPU 时间，悬停控制显示时再测一次整窗重绘
+- 每次重绘需要合成器做 alpha 混合的面积：translucent 为整个窗口，mask 为裁剪区域，solid 为 0
+并检查裁剪区域确实跟着悬停控制的显隐变化（包括新窗口第一次淡入，控制区此前从未排版），
+数字与按钮之间的空隙仍算在窗口内，solid 模式的窗口角落是不透明底色。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/render_modes.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QPoint, QRect  # noqa: E402
+from PySide6.QtGui import QColor, QCursor  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+
+REPAINTS = 500
+TICKS = 2000
+ROUNDS = 5
+
+
+def region_area(region) -> int:
+    return sum(r.width() * r.height() for r in region)
+
+
+def make_window(app, mode, clock=None):
+    win = CountdownWindow(clock)
+    win.set_render_mode(mode)
+    win.show()
+    app.processEvents()
+    return win
+
+
+def repaint_cost(win):
+    cpu0 = time.process_time()
+    for _ in range(REPAINTS):
+        win.repaint()
+    return (time.process_time() - cpu0) / REPAINTS * 1e6
+
+
+def tick_cost(app, mode):
+    clock = VirtualClock(start=1000.0)
+    win = make_window(app, mode, clock)
+    win.set_duration(CountdownWindow.MAX_MINUTES * 60)
+    win.start_timer()
+    app.processEvents()
+    cpu0 = time.process_time()
+    for _ in range(TICKS):
+        clock.step()
+        app.processEvents()
+    cpu = time.process_time() - cpu0
+    win.close()
+    win.deleteLater()
+    return cpu / TICKS * 1e6
+
+
+def center(widget, win):
+    return widget.mapTo(win, widget.rect().center())
+
+
+def first_hover_check(app):
+    # 新窗口第一次悬停走淡入动画，三个按钮都要在裁剪区域里
+    win = make_window(app, "mask")
+    win.set_hover_visible(True)
+    QTest.qWait(CountdownWindow.HOVER_FADE_MS + 100)
+    buttons = (win.pause_button, win.reset_button, win.close_button)
+    ok = all(win.mask().contains(center(b, win)) for b in buttons)
+    # 时间数字与悬停按钮之间的空隙不在裁剪区域里，但不能算离开窗口
+    gap = QRect(win.mask().boundingRect())
+    probe = None
+    for y in range(gap.top(), gap.bottom()):
+        point = QPoint(gap.left() + 2, y)
+        if not win.mask().contains(point):
+            probe = point
+            break
+    if probe is not None:
+        QCursor.setPos(win.mapToGlobal(probe))
+        ok = ok and win._pointer_inside()
+    win.close()
+    win.deleteLater()
+    return ok
+
+
+def measure(app, mode):
+    win = make_window(app, mode)
+    hidden = min(repaint_cost(win) for _ in range(ROUNDS))
+    area = win.width() * win.height()
+    blended_hidden = {"translucent": area, "mask": region_area(win.mask()), "solid": 0}[mode]
+    checks = []
+    if mode == "mask":
+        checks.append(win.mask().contains(center(win.time_label, win)))
+        checks.append(win.mask().contains(center(win.start_button, win)))
+        checks.append(not win.mask().contains(center(win.pause_button, win)))
+    win.set_hover_visible(True, instant=True)
+    app.processEvents()
+    shown = min(repaint_cost(win) for _ in range(ROUNDS))
+    blended_shown = {"translucent": area, "mask": region_area(win.mask()), "solid": 0}[mode]
+    if mode == "mask":
+        checks.append(win.mask().contains(center(win.pause_button, win)))
+        win.set_hover_visible(False, instant=True)
+        app.processEvents()
+        checks.append(not win.mask().contains(center(win.pause_button, win)))
+    if mode == "solid":
+        corner = win.grab().toImage().pixelColor(1, 1)
+        checks.append(corner == QColor(CountdownWindow.SOLID_BACKDROP))
+    win.close()
+    win.deleteLater()
+    tick = min(tick_cost(app, mode) for _ in range(ROUNDS))
+    return hidden, shown, tick, area, blended_hidden, blended_shown, all(checks)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    rows = {mode: measure(app, mode) for mode in CountdownWindow.RENDER_MODES}
+    print(f"{'方式':<12} {'整窗重绘 µs':>11} {'含悬停控制 µs':>13} {'每次跳秒 µs':>11} {'窗口面积':>8} {'混合面积':>8} {'悬停时混合':>10}")
+    for mode, (hidden, shown, tick, area, bh, bs, _) in rows.items():
+        print(f"{mode:<12} {hidden:>11.1f} {shown:>13.1f} {tick:>11.1f} {area:>8} {bh:>8} {bs:>10}")
+    first_hover = first_hover_check(app)
+    print(f"裁剪模式首次淡入按钮可见、空隙不算离开: {'是' if first_hover else '否'}")
+    ok = all(r[6] for r in rows.values()) and rows["mask"][4] < rows["translucent"][4] and first_hover
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
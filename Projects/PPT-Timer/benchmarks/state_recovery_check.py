@@ -0,0 +1,200 @@
+"""
+崩溃恢复检查与写入量测量。
+
+1. kill -9：启动 main.py（带 --state 与控制接口），设定时长并开始，强杀后重启，
+   确认接着原截止时刻继续；再暂停、强杀、重启，确认精确剩余时间不变。
+2. 正常结束后重启：回到完整时长，而不是停在闪烁的 00:00。
+   同时运行的计时器：默认位置被占用时各用各的文件，--state 指定的文件被占用时警告。
+3. 每小时 I/O：虚拟时钟模拟 1 小时运行（每 10 分钟暂停/继续一次），统计状态文件的
+   记录改写次数、写系统调用与脏页字节数，并与“每秒写一次 + fsync”的做法对比。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/state_recovery_check.py
+"""
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+import state_store  # noqa: E402
+from state_store import StateStore  # noqa: E402
+
+TOLERANCE_MS = 300
+
+
+class Child:
+    def __init__(self, state, sock):
+        if os.path.exists(sock):
+            os.unlink(sock)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(ROOT / "main.py"), "--state", state, "--control", "unix:" + sock],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        end = time.monotonic() + 20
+        while True:
+            try:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(sock)
+                break
+            except OSError:
+                self.sock.close()
+                if time.monotonic() > end or self.proc.poll() is not None:
+                    raise SystemExit("子进程未能启动控制接口")
+                time.sleep(0.05)
+        self.reader = self.sock.makefile("rb")
+
+    def call(self, **req):
+        self.sock.sendall(json.dumps(req).encode() + b"\n")
+        reply = json.loads(self.reader.readline())
+        if not reply["ok"]:
+            raise SystemExit(f"控制接口错误: {reply}")
+        return reply["status"]
+
+    def kill(self):
+        self.sock.close()
+        os.kill(self.proc.pid, signal.SIGKILL)
+        self.proc.wait()
+
+
+def check_kill9(tmp):
+    state = os.path.join(tmp, "state.bin")
+    sock = os.path.join(tmp, "ctl.sock")
+    results = []
+
+    child = Child(state, sock)
+    child.call(cmd="set_duration", seconds=420)
+    child.call(cmd="start")
+    time.sleep(1.5)
+    before = child.call(cmd="status")
+    t_before = time.monotonic()
+    child.kill()
+
+    child = Child(state, sock)
+    after = child.call(cmd="status")
+    elapsed_ms = (time.monotonic() - t_before) * 1000
+    drift = after["remaining_ms"] - (before["remaining_ms"] - elapsed_ms)
+    results.append(("运行中强杀", after["running"] and after["total_seconds"] == 420
+                    and abs(drift) < TOLERANCE_MS, f"剩余 {after['remaining_ms']} ms，偏差 {drift:+.0f} ms"))
+
+    paused = child.call(cmd="pause")
+    child.kill()
+    child = Child(state, sock)
+    after = child.call(cmd="status")
+    results.append(("暂停后强杀", not after["running"] and after["remaining_ms"] == paused["remaining_ms"],
+                    f"剩余 {paused['remaining_ms']} -> {after['remaining_ms']} ms"))
+    child.kill()
+    return results
+
+
+def check_finish_restart(tmp):
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    path = os.path.join(tmp, "finish.bin")
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    store = StateStore(path)
+    store.attach(win, resume=False)
+    win.set_duration(60)
+    win.start_timer()
+    while win.is_running and clock.step() is not None:
+        pass
+    store.close()
+    win.close()
+
+    win = CountdownWindow(VirtualClock(start=2000.0))
+    store = StateStore(path)
+    store.attach(win)
+    ok = not win.is_running and win.remaining_seconds == 60 and win.color_state() == "normal"
+    detail = f"{win.engine.text()}，{win.color_state()}"
+    store.close()
+    win.close()
+    return "结束后重启", ok, detail
+
+
+def check_concurrent(tmp):
+    # 锁按打开的文件计，同一进程里开两次与两个进程的效果相同
+    default = os.path.join(tmp, "shared.bin")
+    os.environ["PPT_TIMER_STATE"] = default
+    try:
+        first, second = StateStore(), StateStore()
+    finally:
+        del os.environ["PPT_TIMER_STATE"]
+    separate = str(first.path) == default and first.path != second.path
+    warned = []
+    handler = logging.Handler()
+    handler.emit = warned.append
+    state_store.log.addHandler(handler)
+    try:
+        shared = StateStore(first.path)
+    finally:
+        state_store.log.removeHandler(handler)
+    detail = f"{first.path.name} / {second.path.name}，指定占用中的文件时警告 {len(warned)} 条"
+    for store in (first, second, shared):
+        store.close()
+    return "同时运行", separate and len(warned) == 1, detail
+
+
+def proc_io():
+    with open("/proc/self/io") as f:
+        return {k: int(v) for k, v in (line.split(":") for line in f)}
+
+
+def measure_hour(tmp):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    win.show()
+    app.processEvents()
+    store = StateStore(os.path.join(tmp, "hour.bin"))
+    store.attach(win, resume=False)
+    win.set_duration(CountdownWindow.MAX_MINUTES * 60)
+
+    io0 = proc_io()
+    writes0 = store.writes
+    win.start_timer()
+    ticks = 0
+    while clock.now() < 1000.0 + 3600:
+        clock.step()
+        ticks += 1
+        if ticks % 600 == 0:
+            win.pause_timer()
+            win.start_timer()
+    io1 = proc_io()
+    writes = store.writes - writes0
+    store.close()
+    win.close()
+    return ticks, writes, io1["syscw"] - io0["syscw"], io1["write_bytes"] - io0["write_bytes"]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        results = check_kill9(tmp)
+        results.append(check_finish_restart(tmp))
+        results.append(check_concurrent(tmp))
+        ticks, writes, syscw, dirty = measure_hour(tmp)
+
+    for name, ok, detail in results:
+        print(f"{name:<10} {'通过' if ok else '失败'}  {detail}")
+    print(f"模拟 1 小时: 唤醒 {ticks} 次，状态记录改写 {writes} 次（内存映射，无写系统调用）")
+    print(f"  write 系统调用 {syscw} 次，脏页 {dirty // 1024} KB")
+    print("  对比每秒写文件 + fsync: 3600 次 write + 3600 次 fsync")
+    ok = all(ok for _, ok, _ in results) and writes <= 2 * (ticks // 600) + 2
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+CountdownWindow 无界面基准套件（Linux，QT_QPA_PLATFORM=offscreen）。
+
+测量项：
+- 每次跳秒的 CPU 时间
+- 每次跳秒的绘制事件与样式刷新（polish / StyleChange）次数
+- 模拟 MAX_MINUTES 分钟完整倒计时前后的 RSS 增长
+- 悬停事件与拖动事件的吞吐
+
+结果写成 JSON，便于不同版本之间对比：
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py --out before.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py --out after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import PySide6  # noqa: E402
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt  # noqa: E402
+from PySide6.QtGui import QEnterEvent, QMouseEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow, RenderStats  # noqa: E402
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+def virtual_window(app):
+    # 用手动虚拟时钟驱动：每步跳到下一次到期并处理
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    win.show()
+    app.processEvents()
+
+    def step():
+        clock.step()
+        app.processEvents()
+
+    return win, step
+
+
+def bench_ticks(app, ticks):
+    win, step = virtual_window(app)
+    window_stats = RenderStats(win)
+    win.total_seconds = ticks + 60
+    win.reset_timer()
+    win.start_timer()
+    app.processEvents()
+    win.render_stats.reset()
+    window_stats.reset()
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    for _ in range(ticks):
+        step()
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    label = win.render_stats.counts
+    result = {
+        "ticks": ticks,
+        "cpu_us_per_tick": cpu / ticks * 1e6,
+        "wall_us_per_tick": wall / ticks * 1e6,
+        "label_paints_per_tick": label["paint"] / ticks,
+        "window_paints_per_tick": window_stats.counts["paint"] / ticks,
+        "repolish_per_tick": (label["polish"] + label["style_change"]) / ticks,
+        "palette_changes_per_tick": label["palette_change"] / ticks,
+    }
+    win.close()
+    return result
+
+
+def bench_full_countdown(app):
+    win, step = virtual_window(app)
+    win.total_seconds = CountdownWindow.MAX_MINUTES * 60
+    win.reset_timer()
+    rss0 = rss_bytes()
+    cpu0 = time.process_time()
+    win.start_timer()
+    wakeups = 0
+    while win.is_running:
+        step()
+        wakeups += 1
+    cpu = time.process_time() - cpu0
+    rss1 = rss_bytes()
+    win.close()
+    return {
+        "minutes": CountdownWindow.MAX_MINUTES,
+        "wakeups": wakeups,
+        "cpu_s": cpu,
+        "rss_start_kb": rss0 // 1024,
+        "rss_end_kb": rss1 // 1024,
+        "rss_growth_kb": (rss1 - rss0) // 1024,
+    }
+
+
+def bench_hover(app, events):
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+    targets = (win, win.time_label, win.hover_controls)
+    p = QPointF(1, 1)
+    t0 = time.perf_counter()
+    for i in range(events // 2):
+        w = targets[i % 3]
+        app.sendEvent(w, QEnterEvent(p, p, p))
+        app.sendEvent(w, QEvent(QEvent.Leave))
+        if i % 64 == 0:
+            app.processEvents()
+    app.processEvents()
+    spent = time.perf_counter() - t0
+    stats = dict(win.hover_stats)
+    win.close()
+    return {"sent": events, "events_per_s": events / spent, **stats}
+
+
+def bench_drag(app, events):
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+    start = win.frameGeometry().topLeft()
+    win._press_pos = start
+    win._moved = False
+    win.dragging = True
+    win.drag_offset = QPoint()
+    t0 = time.perf_counter()
+    for i in range(events):
+        p = QPointF(start + QPoint(i % 400, i % 300))
+        app.sendEvent(win, QMouseEvent(QEvent.MouseMove, p, p, p, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+        if i % 16 == 0:
+            app.processEvents()
+    p = QPointF(start)
+    app.sendEvent(win, QMouseEvent(QEvent.MouseButtonRelease, p, p, p, Qt.LeftButton, Qt.NoButton, Qt.NoModifier))
+    spent = time.perf_counter() - t0
+    stats = dict(win.drag_stats)
+    win.close()
+    return {"sent": events, "events_per_s": events / spent, **stats}
+
+
+def run(args):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+        },
+        "tick": bench_ticks(app, args.ticks),
+        "full_countdown": bench_full_countdown(app),
+        "hover": bench_hover(app, args.events),
+        "drag": bench_drag(app, args.events),
+    }
+
+
+def compare(current, baseline):
+    # 只比较数值项，打印 基线 -> 当前 与比值
+    for section, values in current.items():
+        if section == "meta" or section not in baseline:
+            continue
+        for key, value in values.items():
+            old = baseline[section].get(key)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+                ratio = f"x{value / old:.2f}" if old else "-"
+                name = f"{section}.{key}"
+                print(f"{name:<40} {old:>12.3f} -> {value:>12.3f}  {ratio}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CountdownWindow headless benchmarks")
+    parser.add_argument("--out", help="结果 JSON 路径（默认输出到 stdout）")
+    parser.add_argument("--compare", help="与之前的结果 JSON 对比")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = run(args)
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
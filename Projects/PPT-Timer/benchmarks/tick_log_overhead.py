@@ -0,0 +1,110 @@
+"""
+计时记录的开销与容量：
+- 有/无记录时每次跳秒的 CPU 时间（虚拟时钟逐步推进）
+- 180 分钟完整倒计时写入的条数是否在容量之内、占用内存
+- 导出 CSV 的耗时
+- 真实时钟下运行几秒，从记录里读出跳秒迟到的分布
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/tick_log_overhead.py
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import CountdownWindow  # noqa: E402
+from tick_log import TICK, TickLog  # noqa: E402
+
+TICKS = 5000
+REAL_S = 4
+
+
+def tick_cost(app, with_log):
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    if with_log:
+        win.set_tick_log(TickLog(win._now))
+    win.show()
+    app.processEvents()
+    win.set_duration(CountdownWindow.MAX_MINUTES * 60)
+    win.start_timer()
+    app.processEvents()
+    cpu0 = time.process_time()
+    for _ in range(TICKS):
+        clock.step()
+        app.processEvents()
+    cpu = time.process_time() - cpu0
+    win.close()
+    return cpu / TICKS * 1e6
+
+
+def full_session(app):
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    tick_log = TickLog(win._now)
+    win.set_tick_log(tick_log)
+    win.show()
+    app.processEvents()
+    win.set_duration(CountdownWindow.MAX_MINUTES * 60)
+    win.start_timer()
+    while win.is_running or win.engine.state.flashing:
+        clock.step()
+        app.processEvents()
+    win.close()
+    return tick_log
+
+
+def real_lateness(app):
+    win = CountdownWindow()
+    tick_log = TickLog(win._now)
+    win.set_tick_log(tick_log)
+    win.show()
+    QTest.qWaitForWindowExposed(win)
+    win.start_timer()
+    QTest.qWait(REAL_S * 1000)
+    win.close()
+    late = sorted((t - v) * 1000 for t, kind, v in tick_log.rows() if kind == TICK)
+    return late
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    without = min(tick_cost(app, False) for _ in range(3))
+    with_log = min(tick_cost(app, True) for _ in range(3))
+    print(f"每次跳秒 CPU: 无记录 {without:.1f} µs，有记录 {with_log:.1f} µs（差 {with_log - without:+.1f} µs）")
+
+    tick_log = full_session(app)
+    print(f"{CountdownWindow.MAX_MINUTES} 分钟完整倒计时: 写入 {tick_log.count} 条，容量 {tick_log.capacity} 条，"
+          f"占用 {tick_log.nbytes() / 1024:.0f} KB")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.csv")
+        t0 = time.perf_counter()
+        rows = tick_log.dump_csv(path)
+        spent = time.perf_counter() - t0
+        with open(path, newline="", encoding="utf-8") as f:
+            kinds = [row[1] for row in csv.reader(f)][1:]
+    print(f"导出 CSV: {rows} 行，{spent * 1000:.0f} ms（tick {kinds.count('tick')} / paint {kinds.count('paint')} "
+          f"/ event {kinds.count('event')}）")
+
+    late = real_lateness(app)
+    if late:
+        print(f"真实时钟 {REAL_S} s: 跳秒 {len(late)} 次，迟到 中位 {late[len(late) // 2]:.2f} ms，最大 {late[-1]:.2f} ms")
+
+    ok = tick_log.count <= tick_log.capacity and rows == tick_log.count and len(late) >= REAL_S - 1
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
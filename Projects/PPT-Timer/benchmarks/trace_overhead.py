@@ -0,0 +1,116 @@
+"""
+追踪模式的开销：同一进程里测量未开启与开启时每次跳秒、每个鼠标移动事件的 CPU 时间；
+未开启时被追踪的方法必须就是原函数（关闭后也恢复原样），
+并检查写出的文件是合法的 trace event JSON、批量写入的次数。
+
+运行：
+    QT_QPA_PLATFORM=offscreen python benchmarks/trace_overhead.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt  # noqa: E402
+from PySide6.QtGui import QMouseEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from clocks import VirtualClock  # noqa: E402
+from main import TRACE_TARGETS, CountdownWindow  # noqa: E402
+from perf_trace import Tracer  # noqa: E402
+
+TICKS = 3000
+MOVES = 3000
+ROUNDS = 5
+
+
+def tick_cost(app):
+    clock = VirtualClock(start=1000.0)
+    win = CountdownWindow(clock)
+    win.show()
+    app.processEvents()
+    win.set_duration(CountdownWindow.MAX_MINUTES * 60)
+    win.start_timer()
+    app.processEvents()
+    cpu0 = time.process_time()
+    for _ in range(TICKS):
+        clock.step()
+        app.processEvents()
+    cpu = time.process_time() - cpu0
+    win.close()
+    win.deleteLater()
+    return cpu / TICKS * 1e6
+
+
+def move_cost(app):
+    win = CountdownWindow()
+    win.show()
+    app.processEvents()
+    start = win.frameGeometry().topLeft()
+    win._press_pos = start
+    win.dragging = True
+    win.drag_offset = QPoint()
+    cpu0 = time.process_time()
+    for i in range(MOVES):
+        p = QPointF(start + QPoint(i % 400, i % 300))
+        app.sendEvent(win, QMouseEvent(QEvent.MouseMove, p, p, p, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+    cpu = time.process_time() - cpu0
+    win.dragging = False
+    win.close()
+    win.deleteLater()
+    return cpu / MOVES * 1e6
+
+
+def measure(app):
+    return min(tick_cost(app) for _ in range(ROUNDS)), min(move_cost(app) for _ in range(ROUNDS))
+
+
+def methods():
+    return {(cls, name): cls.__dict__[name] for cls, names in TRACE_TARGETS.items() for name in names}
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    originals = methods()
+    rows = [("未开启", *measure(app))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trace.json")
+        tracer = Tracer(path)
+        writes = [0]
+        flush = tracer.flush
+
+        def counted_flush():
+            writes[0] += bool(tracer.events)
+            flush()
+
+        tracer.flush = counted_flush
+        tracer.patch(TRACE_TARGETS)
+        rows.append(("开启", *measure(app)))
+        tracer.unpatch()
+        tracer.close()
+        restored = methods() == originals
+
+        size = os.path.getsize(path)
+        with open(path, encoding="utf-8") as f:
+            events = [e for e in json.load(f) if e["ph"] == "X"]
+
+    print(f"{'状态':<8} {'每次跳秒 µs':>12} {'每个移动事件 µs':>16}")
+    for name, tick, move in rows:
+        print(f"{name:<8} {tick:>12.1f} {move:>16.1f}")
+    print(f"关闭后方法恢复为原函数: {'是' if restored else '否'}")
+    print(f"追踪事件 {len(events)} 条，文件 {size / 1024:.0f} KB，分 {writes[0]} 批写入")
+    names = sorted({e["name"] for e in events})
+    print("涉及方法:", ", ".join(names))
+    ok = bool(events) and restored and writes[0] <= len(events) // 1000 + 1
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+终端模式与图形界面的启动时间、常驻内存对比（Linux）：
+- 终端模式：在伪终端里启动 python main.py --tty，从创建进程到第一帧画面（帮助行）出现的时间
+- 图形界面：QT_QPA_PLATFORM=offscreen 启动 main.py，到时间显示第一次绘制完成的时间
+两者都在首帧后静置 1 秒读取 /proc/<pid>/status 的 VmRSS，各跑多次取中位数。
+另外检查终端进程没有映射任何 Qt 库，运行中每秒输出的字节数（只重画变化的字符格），
+以及空格开始、Esc 退出能正常工作。
+
+运行：
+    python benchmarks/tty_footprint.py
+"""
+import fcntl
+import os
+import select
+import signal
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 5
+SETTLE_S = 1.0
+RUN_S = 3.0
+TIMEOUT_S = 20
+ROWS, COLS = 30, 100
+
+GUI_PROBE = """
+import sys
+sys.argv = ["main.py", "--no-resume", "--state", sys.argv[1]]
+import main
+
+paint = main.TimeDisplay.paintEvent
+
+def first_paint(self, event):
+    paint(self, event)
+    main.TimeDisplay.paintEvent = paint
+    print("FRAME", flush=True)
+
+main.TimeDisplay.paintEvent = first_paint
+main.main()
+"""
+
+
+def rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def maps_qt(pid):
+    with open(f"/proc/{pid}/maps") as f:
+        return "libQt6" in f.read()
+
+
+def read_until(fd, marker, deadline):
+    buf = b""
+    while marker not in buf:
+        left = deadline - time.monotonic()
+        if left <= 0 or not select.select([fd], [], [], left)[0]:
+            raise TimeoutError(marker)
+        buf += os.read(fd, 65536)
+    return buf
+
+
+def drain(fd, seconds):
+    n = 0
+    deadline = time.monotonic() + seconds
+    while (left := deadline - time.monotonic()) > 0:
+        if select.select([fd], [], [], left)[0]:
+            try:
+                n += len(os.read(fd, 65536))
+            except OSError:
+                break
+    return n
+
+
+def run_tty():
+    master, slave = os.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", ROWS, COLS, 0, 0))
+    env = dict(os.environ, TERM="xterm-256color", LANG="C.UTF-8")
+    t0 = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "main.py", "--tty"],
+        cwd=ROOT, env=env, stdin=slave, stdout=slave, stderr=slave, start_new_session=True,
+    )
+    os.close(slave)
+    try:
+        read_until(master, b"Esc", t0 + TIMEOUT_S)
+        startup = time.monotonic() - t0
+        drain(master, SETTLE_S)
+        rss = rss_kb(proc.pid)
+        qt = maps_qt(proc.pid)
+        os.write(master, b" ")
+        drain(master, 0.2)
+        out_rate = drain(master, RUN_S) / RUN_S
+        os.write(master, b"\x1b")
+        code = proc.wait(timeout=5)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        os.close(master)
+    return startup, rss, qt, out_rate, code
+
+
+def run_gui(state_path):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    t0 = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", GUI_PROBE, state_path],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    try:
+        read_until(proc.stdout.fileno(), b"FRAME", t0 + TIMEOUT_S)
+        startup = time.monotonic() - t0
+        time.sleep(SETTLE_S)
+        rss = rss_kb(proc.pid)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    return startup, rss
+
+
+def main():
+    tty = [run_tty() for _ in range(RUNS)]
+    with tempfile.TemporaryDirectory() as tmp:
+        gui = [run_gui(os.path.join(tmp, "state.bin")) for _ in range(RUNS)]
+
+    tty_ms = statistics.median(r[0] for r in tty) * 1000
+    tty_mb = statistics.median(r[1] for r in tty) / 1024
+    gui_ms = statistics.median(r[0] for r in gui) * 1000
+    gui_mb = statistics.median(r[1] for r in gui) / 1024
+    print(f"{'模式':<10} {'启动到首帧 ms':>14} {'常驻内存 MB':>12}")
+    print(f"{'终端 --tty':<10} {tty_ms:>14.1f} {tty_mb:>12.1f}")
+    print(f"{'图形界面':<10} {gui_ms:>14.1f} {gui_mb:>12.1f}")
+    print(f"终端模式占图形界面: 启动 {tty_ms / gui_ms:.0%}，内存 {tty_mb / gui_mb:.0%}")
+    qt = any(r[2] for r in tty)
+    rate = statistics.median(r[3] for r in tty)
+    codes = {r[4] for r in tty}
+    print(f"终端进程映射 Qt 库: {'是' if qt else '否'}；运行中输出 {rate:.0f} 字节/秒；Esc 退出码 {sorted(codes)}")
+
+    ok = not qt and codes == {0} and tty_ms < gui_ms and tty_mb < gui_mb and 0 < rate < 4096
+    print("结果:", "通过" if ok else "失败")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
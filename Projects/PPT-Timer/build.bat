@@ -10,9 +10,11 @@ call .venv\Scripts\activate.bat
 python -m pip install --upgrade pip
 pip install -r requirements.txt
 
-REM 打包为单文件无控制台窗口的 exe
-pyinstaller --noconfirm --clean --onefile --windowed --name PPTCountdown main.py
+REM 打包为单文件无控制台窗口的 exe；参数原样交给 build.py，例如：
+REM   build.bat --variant slim-onedir
+REM   build.bat --all --report
+python build.py --no-open %*
 
-echo 输出文件位于 dist\PPTCountdown.exe
+echo 输出文件位于 dist\（默认 dist\PPTCountdown.exe）
 pause
 
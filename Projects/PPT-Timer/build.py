@@ -1,16 +1,454 @@
 """
 PyInstaller 打包脚本 - 可在 PyCharm 中直接运行
+
+    python build.py                          # 与以前相同：单文件 dist/PPTCountdown(.exe)
+    python build.py --variant slim-onedir    # 精简 + 目录形式，输出到 dist/slim-onedir/
+    python build.py --all --report           # 打出全部四种，生成体积与启动时间报告
+
+打包方式：
+- onefile / onedir：单文件（每次启动都要把整个运行时解压到临时目录）或目录形式
+- slim-*：只带程序实际导入的 Qt 模块（扫描源码里的 PySide6 导入），
+  插件只留平台、样式与输入法等必需的几类，不带 Qt 翻译文件
+
+--report 对每种产物按模块统计体积，并测量冷/热启动时间（启动到控制接口能应答为止），
+结果打印出来并写入 dist/build_report.json。Linux 与 Windows 上都可以运行。
+
+增量打包：每种打包方式把输入的指纹记在 build/<variant>/fingerprint.json：
+- 环境指纹：生成的 spec、PyInstaller 命令行选项、解释器与 PyInstaller/PySide6 版本、requirements.txt
+- 源码指纹：程序的 .py 源文件与自带字体的内容
+两者都没变且产物还在（大小、修改时间与上次一致）时直接复用产物；只有源码变了时不加 --clean，
+让 PyInstaller 复用工作目录里的分析结果；环境变了或指定 --force 时从头打包。
 """
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shutil
+import socket
+import statistics
 import subprocess
 import sys
-import os
+import tempfile
+import time
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent
+NAME = "PPTCountdown"
+FONT = "fonts/PPTTimerDigits-Bold.ttf"
+VARIANTS = ("onefile", "onedir", "slim-onefile", "slim-onedir")
+
+# 精简打包时保留的插件目录；其余（图片格式、TLS、打印、主题、图标引擎……）程序都用不到
+KEEP_PLUGINS = (
+    "platforms",
+    "styles",
+    "platforminputcontexts",
+    "xcbglintegrations",
+    "wayland-shell-integration",
+    "wayland-decoration-client",
+    "wayland-graphics-integration-client",
+)
+# 这些 Qt 模块用到时还需要对应的插件目录
+MODULE_PLUGINS = {"QtMultimedia": ("multimedia",)}
+
+# 源码指纹包含的文件（build.py 自身的改动会体现在生成的 spec 里）
+SOURCE_GLOBS = ("*.py", FONT)
+PYINSTALLER_OPTIONS = ("--noconfirm",)
+
+STARTUP_TIMEOUT_S = 60
+COLD_RUNS = 3
+WARM_RUNS = 5
+
+SPEC = '''# -*- mode: python ; coding: utf-8 -*-
+# 由 build.py 生成，请勿手工修改
+import os
+
+from PyInstaller.depend.bindepend import get_imports
+
+SLIM = {slim!r}
+KEEP_PLUGINS = {keep_plugins!r}
+# 输入法目录里的虚拟键盘插件会把 QtQuick / QtQml 整套带进来
+DROP_PLUGIN_FILES = ("virtualkeyboard",)
+
+
+def keep(dest):
+    if not SLIM:
+        return True
+    parts = dest.replace("\\\\", "/").split("/")
+    if "translations" in parts or dest.endswith(".qm"):
+        return False
+    if "plugins" in parts:
+        i = parts.index("plugins")
+        if any(word in parts[-1] for word in DROP_PLUGIN_FILES):
+            return False
+        return i + 1 >= len(parts) - 1 or parts[i + 1] in KEEP_PLUGINS
+    return True
+
+
+def is_qt_lib(dest):
+    return os.path.basename(dest).startswith(("libQt6", "Qt6"))
+
+
+def prune(binaries):
+    """去掉插件被删后不再被任何扩展模块或插件依赖的 Qt 库。"""
+    qt = {{os.path.basename(dest): src for dest, src, _ in binaries if is_qt_lib(dest)}}
+    needed = set()
+    stack = [src for dest, src, _ in binaries if not is_qt_lib(dest)]
+    while stack:
+        for name, _ in get_imports(stack.pop()):
+            name = os.path.basename(name)
+            if name in qt and name not in needed:
+                needed.add(name)
+                stack.append(qt[name])
+    return [e for e in binaries if not is_qt_lib(e[0]) or os.path.basename(e[0]) in needed]
+
+
+a = Analysis(
+    [{script!r}],
+    pathex=[{root!r}],
+    datas=[({font!r}, "fonts")],
+    excludes={excludes!r},
+    noarchive=False,
+)
+a.binaries = [e for e in a.binaries if keep(e[0])]
+a.datas = [e for e in a.datas if keep(e[0])]
+if SLIM:
+    a.binaries = prune(a.binaries)
+    # 顶层的 libQt6*.so 是指向 PySide6/Qt/lib 的符号链接，目标删掉了链接也要一起删
+    targets = {{dest for dest, _, _ in a.binaries}}
+    a.datas = [e for e in a.datas if e[2] != "SYMLINK" or e[1] in targets]
+pyz = PYZ(a.pure)
+if {onefile!r}:
+    exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], name={name!r}, console=False, upx=False)
+else:
+    exe = EXE(pyz, a.scripts, [], exclude_binaries=True, name={name!r}, console=False, upx=False)
+    coll = COLLECT(exe, a.binaries, a.datas, name={name!r}, upx=False)
+'''
+
+
+def used_qt_modules():
+    """扫描程序源码（不含 benchmarks 与本脚本）里导入的 PySide6.QtXxx 模块。"""
+    used = set()
+    for path in ROOT.glob("*.py"):
+        if path.name == "build.py":
+            continue
+        tree = ast.parse(path.read_text(encoding="utf-8"), str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module] + [f"{node.module}.{a.name}" for a in node.names]
+            elif isinstance(node, ast.Import):
+                names = [a.name for a in node.names]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                if parts[0] == "PySide6" and len(parts) > 1 and parts[1].startswith("Qt"):
+                    used.add(parts[1])
+    return used
+
+
+def installed_qt_modules():
+    import PySide6
+
+    package = Path(PySide6.__file__).parent
+    # PySide6/Qt 是 Qt 运行时目录，不是模块
+    return {p.name.split(".")[0] for p in package.iterdir() if p.name.startswith("Qt") and p.name != "Qt"}
+
+
+def write_spec(variant: str, work: Path) -> Path:
+    slim = variant.startswith("slim")
+    keep_plugins = list(KEEP_PLUGINS)
+    excludes = []
+    if slim:
+        used = used_qt_modules()
+        excludes = sorted(f"PySide6.{m}" for m in installed_qt_modules() - used)
+        for module in sorted(used):
+            keep_plugins += MODULE_PLUGINS.get(module, ())
+    spec = work / f"{NAME}.spec"
+    spec.write_text(SPEC.format(
+        slim=slim, keep_plugins=tuple(keep_plugins), script=str(ROOT / "main.py"), root=str(ROOT),
+        font=str(ROOT / FONT), excludes=excludes, onefile=variant.endswith("onefile"), name=NAME,
+    ), encoding="utf-8")
+    return spec
+
+
+def dist_dir(variant: str) -> Path:
+    # 默认的单文件包仍然放在 dist/ 下，与以前的输出位置一致
+    return ROOT / "dist" if variant == "onefile" else ROOT / "dist" / variant
+
+
+def artifact(variant: str) -> Path:
+    exe = NAME + (".exe" if sys.platform == "win32" else "")
+    if variant.endswith("onefile"):
+        return dist_dir(variant) / exe
+    return dist_dir(variant) / NAME / exe
+
+
+# 增量打包
+def source_files():
+    files = set()
+    for pattern in SOURCE_GLOBS:
+        files.update(p for p in ROOT.glob(pattern) if p.is_file() and p.name != "build.py")
+    return sorted(files)
+
+
+def env_fingerprint(spec: Path) -> str:
+    import PyInstaller
+    import PySide6
+
+    h = hashlib.sha256()
+    for part in (
+        spec.read_bytes(),
+        " ".join(PYINSTALLER_OPTIONS).encode(),
+        sys.version.encode(),
+        sys.platform.encode(),
+        PyInstaller.__version__.encode(),
+        PySide6.__version__.encode(),
+        (ROOT / "requirements.txt").read_bytes(),
+    ):
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def source_fingerprint() -> str:
+    h = hashlib.sha256()
+    for path in source_files():
+        name = path.relative_to(ROOT).as_posix().encode()
+        data = path.read_bytes()
+        h.update(len(name).to_bytes(8, "little") + name)
+        h.update(len(data).to_bytes(8, "little") + data)
+    return h.hexdigest()
+
+
+def artifact_stamp(variant: str):
+    try:
+        st = artifact(variant).stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_stamp(work: Path) -> dict:
+    try:
+        return json.loads((work / "fingerprint.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def build(variant: str, force: bool = False) -> Path:
+    work = ROOT / "build" / variant
+    work.mkdir(parents=True, exist_ok=True)
+    t0 = time.perf_counter()
+    spec = write_spec(variant, work)
+    env_key = env_fingerprint(spec)
+    source_key = source_fingerprint()
+    last = {} if force else load_stamp(work)
+    same_env = last.get("env") == env_key
+    last_seconds = last.get("build_seconds", 0.0)
+    if same_env and last.get("source") == source_key and last.get("artifact") == artifact_stamp(variant):
+        spent = time.perf_counter() - t0
+        print(f"\n[{variant}] 命中缓存：输入没有变化，复用 {artifact(variant)}")
+        print(f"  检查用时 {spent:.2f} s，节省约 {max(last_seconds - spent, 0):.1f} s")
+        return artifact(variant)
+
+    if force:
+        reason = "指定了 --force"
+    elif not last:
+        reason = "没有上次的打包记录"
+    elif not same_env:
+        reason = "spec / PyInstaller 选项 / 解释器 / 依赖有变化"
+    elif last.get("source") != source_key:
+        reason = "源码有变化"
+    else:
+        reason = "产物缺失或被改动"
+    incremental = same_env and not force
+    print(f"\n[{variant}] 未命中缓存（{reason}），{'增量' if incremental else '从头'}打包...")
+    print("-" * 50)
+    cmd = [
+        sys.executable, "-m", "PyInstaller", *PYINSTALLER_OPTIONS, *(() if incremental else ("--clean",)),
+        "--distpath", str(dist_dir(variant)), "--workpath", str(work), str(spec),
+    ]
+    (work / "fingerprint.json").unlink(missing_ok=True)
+    subprocess.run(cmd, check=True, cwd=ROOT)
+    seconds = time.perf_counter() - t0
+    (work / "fingerprint.json").write_text(json.dumps({
+        "env": env_key, "source": source_key, "artifact": artifact_stamp(variant),
+        # 记录从头打包的用时，命中缓存时据此估算节省的时间
+        "build_seconds": seconds if not incremental else max(seconds, last_seconds),
+    }, indent=2), encoding="utf-8")
+    note = f"，比上次从头打包节省约 {last_seconds - seconds:.1f} s" if incremental and last_seconds > seconds else ""
+    print(f"✓ [{variant}] 打包完成，用时 {seconds:.1f} s{note}: {artifact(variant)}")
+    return artifact(variant)
+
+
+# 体积报告
+def bundle_entries(variant: str):
+    """产物中的 (相对路径, 字节数)；单文件包读取其内嵌归档的目录（压缩后大小）。"""
+    if variant.endswith("onefile"):
+        from PyInstaller.archive.readers import CArchiveReader
+
+        reader = CArchiveReader(str(artifact(variant)))
+        for name, (_, length, *_rest) in reader.toc.items():
+            yield name, length
+        return
+    base = artifact(variant).parent
+    for path in base.rglob("*"):
+        # 顶层的库大多是指向 PySide6/Qt/lib 的符号链接，不重复计数
+        if path.is_file() and not path.is_symlink():
+            yield path.relative_to(base).as_posix(), path.stat().st_size
+
+
+def module_of(name: str) -> str:
+    parts = name.replace("\\", "/").split("/")
+    base = parts[-1]
+    if "plugins" in parts[:-1]:
+        return "plugins/" + parts[parts.index("plugins") + 1]
+    if "translations" in parts or base.endswith(".qm"):
+        return "translations"
+    for prefix in ("libQt6", "Qt6"):
+        if base.startswith(prefix):
+            return "Qt" + base[len(prefix):].split(".")[0]
+    if "PySide6" in parts and base.startswith("Qt"):
+        return base.split(".")[0]
+    if "shiboken6" in name or "pyside6" in base.lower():
+        return "shiboken6/pyside6"
+    if base.startswith(("libpython", "python3")) or base == "base_library.zip" or "lib-dynload" in parts:
+        return "python"
+    if base.startswith(NAME) or base == "PYZ.pyz" or base.startswith("PYZ-"):
+        return "程序与 Python 代码"
+    if base.startswith("libicu") or base.startswith("icu"):
+        return "ICU"
+    if base.startswith("lib") and ".so" in base or base.endswith(".dll"):
+        return "系统库"
+    return "其他"
+
+
+def size_report(variant: str):
+    modules = {}
+    for name, size in bundle_entries(variant):
+        key = module_of(name)
+        modules[key] = modules.get(key, 0) + size
+    if variant.endswith("onefile"):
+        total = artifact(variant).stat().st_size
+    else:
+        total = sum(modules.values())
+    return total, dict(sorted(modules.items(), key=lambda kv: -kv[1]))
+
+
+# 启动时间
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def evict_page_cache(path: Path):
+    """把产物文件从页缓存里踢出去（Linux，posix_fadvise），模拟冷启动；其他平台上无操作。"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    files = [path] if path.is_file() else [p for p in path.rglob("*") if p.is_file()]
+    for p in files:
+        fd = os.open(p, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def launch_once(exe: Path, tmp: str) -> float:
+    """启动程序，返回从创建进程到控制接口应答 status 的秒数。"""
+    port = free_port()
+    env = dict(os.environ)
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    cmd = [str(exe), "--no-resume", "--state", os.path.join(tmp, "state.bin"), "--control", f"127.0.0.1:{port}"]
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - t0 < STARTUP_TIMEOUT_S:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{exe} 启动后退出，返回码 {proc.returncode}")
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=1) as sock:
+                    sock.sendall(b'{"cmd": "status"}\n')
+                    if sock.makefile("rb").readline():
+                        return time.perf_counter() - t0
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError(f"{exe} 在 {STARTUP_TIMEOUT_S} s 内没有就绪")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def startup_report(variant: str):
+    exe = artifact(variant)
+    target = exe if variant.endswith("onefile") else exe.parent
+    with tempfile.TemporaryDirectory() as tmp:
+        cold = []
+        for _ in range(COLD_RUNS):
+            evict_page_cache(target)
+            cold.append(launch_once(exe, tmp))
+        warm = [launch_once(exe, tmp) for _ in range(WARM_RUNS)]
+    return statistics.median(cold) * 1000, statistics.median(warm) * 1000
+
+
+def report(variants):
+    results = {}
+    for variant in variants:
+        total, modules = size_report(variant)
+        cold_ms, warm_ms = startup_report(variant)
+        results[variant] = {"total_bytes": total, "modules": modules, "cold_start_ms": cold_ms, "warm_start_ms": warm_ms}
+
+    mb = 1024 * 1024
+    print("\n" + "=" * 50)
+    print(f"{'产物':<14} {'体积 MB':>9} {'冷启动 ms':>10} {'热启动 ms':>10}")
+    for variant, r in results.items():
+        print(f"{variant:<14} {r['total_bytes'] / mb:>9.1f} {r['cold_start_ms']:>10.0f} {r['warm_start_ms']:>10.0f}")
+    for variant, r in results.items():
+        print(f"\n[{variant}] 按模块（{'压缩后' if variant.endswith('onefile') else '磁盘'}大小）:")
+        for module, size in r["modules"].items():
+            if size >= 0.05 * mb:
+                print(f"  {module:<34} {size / mb:>7.2f} MB")
+    path = ROOT / "dist" / "build_report.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n报告已写入 {path}")
+
+
+def open_folder(path: Path):
+    try:
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":
+            subprocess.run(["open", path])
+        elif shutil.which("xdg-open") and os.environ.get("DISPLAY"):
+            subprocess.run(["xdg-open", path])
+    except Exception as e:
+        print(f"无法自动打开文件夹: {e}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="PPT 倒计时工具 - PyInstaller 打包")
+    parser.add_argument("--variant", choices=VARIANTS, action="append", help="打包方式，可重复；默认 onefile")
+    parser.add_argument("--all", action="store_true", help="打出全部打包方式")
+    parser.add_argument("--report", action="store_true", help="统计各产物的模块体积与冷/热启动时间")
+    parser.add_argument("--report-only", action="store_true", help="不重新打包，只对已有产物出报告")
+    parser.add_argument("--force", action="store_true", help="忽略增量缓存，从头打包")
+    parser.add_argument("--no-open", action="store_true", help="完成后不打开输出文件夹")
+    args = parser.parse_args()
+    variants = list(VARIANTS) if args.all else (args.variant or ["onefile"])
+
     print("=" * 50)
     print("PPT 倒计时工具 - PyInstaller 打包")
     print("=" * 50)
-    
+
     # 检查是否安装了 PyInstaller
     try:
         import PyInstaller
@@ -19,45 +457,18 @@ def main():
         print("✗ PyInstaller 未安装，正在安装...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "PyInstaller"])
         print("✓ PyInstaller 安装完成")
-    
+
     # 检查 main.py 是否存在
-    if not Path("main.py").exists():
+    if not (ROOT / "main.py").exists():
         print("✗ 错误: 找不到 main.py 文件")
         sys.exit(1)
-    
-    print("\n开始打包...")
-    print("-" * 50)
-    
-    # PyInstaller 命令
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--noconfirm",
-        "--clean",
-        "--onefile",
-        "--windowed",
-        "--name", "PPTCountdown",
-        "main.py"
-    ]
-    
+
     try:
-        result = subprocess.run(cmd, check=True)
-        print("\n" + "=" * 50)
-        print("✓ 打包成功！")
-        print(f"输出文件: {Path('dist/PPTCountdown.exe').absolute()}")
-        print("=" * 50)
-        
-        # 询问是否打开文件夹
-        try:
-            dist_path = Path("dist").absolute()
-            if sys.platform == "win32":
-                os.startfile(dist_path)
-            elif sys.platform == "darwin":
-                subprocess.run(["open", dist_path])
-            else:
-                subprocess.run(["xdg-open", dist_path])
-        except Exception as e:
-            print(f"无法自动打开文件夹: {e}")
-            
+        if not args.report_only:
+            for variant in variants:
+                build(variant, force=args.force)
+        if args.report or args.report_only:
+            report(variants)
     except subprocess.CalledProcessError as e:
         print("\n" + "=" * 50)
         print("✗ 打包失败！")
@@ -65,6 +476,14 @@ def main():
         print("=" * 50)
         sys.exit(1)
 
+    print("\n" + "=" * 50)
+    print("✓ 打包成功！")
+    for variant in variants:
+        print(f"输出文件: {artifact(variant)}")
+    print("=" * 50)
+    if not args.no_open:
+        open_folder(ROOT / "dist")
+
+
 if __name__ == "__main__":
     main()
-
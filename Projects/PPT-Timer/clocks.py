@@ -0,0 +1,205 @@
+"""
+时间源与唤醒队列，不依赖 Qt，图形界面、终端模式与基准脚本共用。
+
+- MonotonicClock：真实时间
+- VirtualClock：加速或手动推进的虚拟时间，用于压缩时间的演练与长时测试
+- WakeQueue：按到期时刻排队的单定时器调度逻辑；怎么挂定时器由界面决定
+"""
+import heapq
+import itertools
+import math
+import time
+import weakref
+from collections import deque
+
+
+class MonotonicClock:
+    """真实时间源：time.monotonic()，到期即按真实毫秒等待。"""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def real_delay_ms(self, dt: float):
+        return dt * 1000
+
+    def attach(self, scheduler):
+        pass
+
+    def run_due(self, at: float, callback):
+        callback()
+
+
+class VirtualClock:
+    """
+    虚拟时间源，用于压缩时间的长时测试：
+    speed > 0 时按真实流逝时间的 speed 倍前进（如 1000 倍）；
+    speed == 0 时时间静止，只能用 advance()/step() 手动推进。
+    exact 为真时，醒来晚了也会把错过的工作按各自的到期时刻依次补做，
+    因此阈值、闪烁与结束提示的行为与真实时间下逐一发生时完全一致；
+    exact 为假时则像卡顿的事件循环那样在醒来时刻一次性处理。
+    """
+
+    def __init__(self, start: float = 0.0, speed: float = 0.0, exact: bool = True):
+        self.speed = speed
+        self.exact = exact
+        self._base = start
+        self._real0 = time.monotonic()
+        self._held = None
+        self._schedulers = weakref.WeakSet()
+
+    def now(self) -> float:
+        if self._held is not None:
+            return self._held
+        if self.speed:
+            return self._base + (time.monotonic() - self._real0) * self.speed
+        return self._base
+
+    def real_delay_ms(self, dt: float):
+        # 手动模式不挂真实定时器，等待 advance()/step()
+        if self.speed:
+            return dt * 1000 / self.speed
+        return None
+
+    def attach(self, scheduler):
+        self._schedulers.add(scheduler)
+
+    def run_due(self, at: float, callback):
+        if not self.exact:
+            callback()
+            return
+        # 回调内读到的时间固定为它的到期时刻
+        self._held = at
+        try:
+            callback()
+        finally:
+            self._held = None
+
+    def next_due(self):
+        dues = [d for d in (s.next_due() for s in self._schedulers) if d is not None]
+        return min(dues) if dues else None
+
+    def advance(self, dt: float):
+        """时间前进 dt 秒，并处理期间到期的所有工作。"""
+        self._base += dt
+        self._poll()
+
+    def step(self):
+        """跳到下一个到期时刻并只处理它；没有待办时返回 None。"""
+        due = self.next_due()
+        if due is None:
+            return None
+        self._base += max(0.0, due - self.now())
+        self._poll()
+        return due
+
+    def _poll(self):
+        for scheduler in list(self._schedulers):
+            scheduler.poll()
+
+
+class WakeQueue:
+    """
+    把所有周期性工作合并到一个单次定时器上：按键登记到期时刻与回调，
+    定时器只为最早到期的那一项唤醒；没有登记项或被挂起时不产生任何唤醒。
+    键为 (所有者, 名称)，多个窗口可以共用同一个调度器。
+    granularity > 0 时唤醒时刻向上取整到该粒度，多个窗口的到期合并成一次心跳。
+    定时器由子类在 _arm() 里挂上（Qt 界面用 QTimer），到点后调用 poll()。
+    """
+
+    def __init__(self, clock, granularity: float = 0.0):
+        self.clock = clock
+        self.granularity = granularity
+        self._now = clock.now
+        self._due = {}  # 键 -> (到期时刻, 序号, 回调)
+        self._heap = []  # (到期时刻, 序号, 键)，取消/改期的旧项延迟清理
+        self._seq = itertools.count()
+        self._polling = False
+        self._suspended = False
+        # 正在执行的回调所登记的到期时刻（计时记录用来计算迟到）
+        self.current_due = None
+        self._wakeups = deque()
+        clock.attach(self)
+
+    def schedule(self, key, at: float, callback):
+        seq = next(self._seq)
+        self._due[key] = (at, seq, callback)
+        heapq.heappush(self._heap, (at, seq, key))
+        if len(self._heap) > 4 * len(self._due) + 64:
+            self._heap = [(a, n, k) for k, (a, n, _) in self._due.items()]
+            heapq.heapify(self._heap)
+        self._rearm()
+
+    def cancel(self, key):
+        if self._due.pop(key, None) is not None:
+            self._rearm()
+
+    def cancel_owner(self, owner):
+        for key in [k for k in self._due if k[0] == owner]:
+            del self._due[key]
+        self._rearm()
+
+    def pending(self, key) -> bool:
+        return key in self._due
+
+    def next_due(self):
+        heap = self._heap
+        while heap:
+            at, seq, key = heap[0]
+            entry = self._due.get(key)
+            if entry is not None and entry[1] == seq:
+                return at
+            heapq.heappop(heap)
+        return None
+
+    def suspend(self, suspended: bool):
+        self._suspended = suspended
+        self._rearm()
+
+    def _rearm(self):
+        if self._polling:
+            # 处理过程中的登记/取消在本轮结束时统一挂一次定时器
+            return
+        at = self.next_due()
+        if at is not None and self.granularity:
+            at = math.ceil(at / self.granularity) * self.granularity
+        delay = None if at is None else self.clock.real_delay_ms(at - self._now())
+        if self._suspended or delay is None:
+            self._arm(None)
+            return
+        # 向上取整毫秒，保证醒来时已到期
+        self._arm(max(0, math.ceil(delay)))
+
+    def _arm(self, delay_ms):
+        """delay_ms 毫秒后调用 poll()；None 表示停掉定时器。"""
+        raise NotImplementedError
+
+    def poll(self):
+        if self._suspended:
+            return
+        now = self._now()
+        fired = False
+        self._polling = True
+        try:
+            # 按到期先后逐个处理；回调里新登记且已到期的项也在本轮处理
+            while True:
+                at = self.next_due()
+                if at is None or at > now:
+                    break
+                _, _, key = heapq.heappop(self._heap)
+                _, _, callback = self._due.pop(key)
+                fired = True
+                self.current_due = at
+                self.clock.run_due(at, callback)
+        finally:
+            self.current_due = None
+            self._polling = False
+        if fired:
+            self._wakeups.append(now)
+        # 提前醒来时没有到期项，也只需重新挂定时器
+        self._rearm()
+
+    def wakeups_per_minute(self) -> int:
+        horizon = self._now() - 60.0
+        while self._wakeups and self._wakeups[0] < horizon:
+            self._wakeups.popleft()
+        return len(self._wakeups)
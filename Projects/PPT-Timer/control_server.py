@@ -0,0 +1,179 @@
+"""
+本地控制接口：JSON Lines，每行一个请求、一行应答，跑在 Qt 事件循环里（不另开线程）。
+
+监听地址：
+- "127.0.0.1:8765" / ":8765"  TCP（只写端口时绑定 127.0.0.1）
+- "unix:/tmp/ppt-timer.sock" 或含 "/" 的路径  本地套接字
+
+请求：
+    {"cmd": "toggle_start_pause"}
+    {"cmd": "start"} / {"cmd": "pause"} / {"cmd": "reset_timer"}
+    {"cmd": "set_duration", "minutes": 15}    也可用 "seconds"
+    {"cmd": "status"}
+    {"cmd": "dump_tick_log"}                 把计时记录导出为 CSV，应答里带路径
+多计时器时可带 "timer": 序号（默认 0）；请求里的 "id" 原样带回应答。
+应答：{"ok": true, "status": {...}} 或 {"ok": false, "error": "..."}
+"""
+import json
+import logging
+import math
+
+from PySide6.QtCore import QObject
+from PySide6.QtNetwork import QHostAddress, QLocalServer, QTcpServer
+
+from tick_log import dump_path
+
+log = logging.getLogger("ppt_timer.control")
+
+MAX_LINE = 64 * 1024
+
+
+class ControlError(ValueError):
+    pass
+
+
+def timer_status(win) -> dict:
+    engine = win.engine
+    status = {
+        "running": engine.state.running,
+        "remaining_ms": int(engine.left() * 1000),
+        "total_seconds": engine.state.total_seconds,
+        "color": engine.color_state(),
+    }
+    if win.agenda is not None and 0 <= win._agenda_index < len(win.agenda):
+        status["segment"] = win._agenda_index
+        status["title"] = win.agenda.titles[win._agenda_index]
+    return status
+
+
+def _set_duration(win, req):
+    unit = "seconds" if "seconds" in req else "minutes"
+    value = req.get(unit)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ControlError("set_duration 需要数字 minutes 或 seconds")
+    win.set_duration(round(value if unit == "seconds" else value * 60))
+
+
+def _dump_tick_log(win, req):
+    if win.tick_log is None:
+        raise ControlError("这个计时器没有开启计时记录")
+    path = dump_path()
+    rows = win.tick_log.dump_csv(path)
+    return {"tick_log": str(path), "rows": rows}
+
+
+def _start(win, req):
+    if not win.is_running:
+        win.start_timer()
+
+
+COMMANDS = {
+    "toggle_start_pause": lambda win, req: win.toggle_start_pause(),
+    "start": _start,
+    "pause": lambda win, req: win.pause_timer(),
+    "reset_timer": lambda win, req: win.reset_timer(),
+    "set_duration": _set_duration,
+    "status": lambda win, req: None,
+    "dump_tick_log": _dump_tick_log,
+}
+
+
+class ControlServer(QObject):
+    """
+    windows 是窗口列表（或返回列表的可调用对象，便于跟随 TimerManager 的增删）。
+    每个连接按字节累积到换行再处理，处理完命令后立即回写应答。
+    """
+
+    def __init__(self, windows, parent=None):
+        super().__init__(parent)
+        self._windows = windows if callable(windows) else (lambda: windows)
+        self._server = None
+        self._buffers = {}
+        self.address = None
+
+    def listen(self, address: str):
+        if address.startswith("unix:") or "/" in address:
+            path = address.removeprefix("unix:")
+            QLocalServer.removeServer(path)
+            server = QLocalServer(self)
+            ok = server.listen(path)
+            self.address = path
+        else:
+            host, _, port = address.rpartition(":")
+            server = QTcpServer(self)
+            ok = server.listen(QHostAddress(host or "127.0.0.1"), int(port))
+            self.address = f"{server.serverAddress().toString()}:{server.serverPort()}"
+        if not ok:
+            raise OSError(f"控制接口无法监听 {address}: {server.errorString()}")
+        server.newConnection.connect(self._accept)
+        self._server = server
+        log.info("控制接口监听 %s", self.address)
+        return self.address
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for conn in list(self._buffers):
+            conn.close()
+
+    def _accept(self):
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            self._buffers[conn] = bytearray()
+            conn.readyRead.connect(lambda c=conn: self._read(c))
+            conn.disconnected.connect(lambda c=conn: self._drop(c))
+
+    def _drop(self, conn):
+        if self._buffers.pop(conn, None) is not None:
+            conn.deleteLater()
+
+    def _read(self, conn):
+        buf = self._buffers.get(conn)
+        if buf is None:
+            return
+        buf += conn.readAll().data()
+        replies = []
+        while True:
+            end = buf.find(b"\n")
+            if end < 0:
+                break
+            line = bytes(buf[:end]).strip()
+            del buf[:end + 1]
+            if line:
+                replies.append(self.handle_line(line))
+        if len(buf) > MAX_LINE:
+            log.warning("控制连接发送的行过长，断开")
+            conn.abort()
+            return
+        if replies:
+            conn.write(b"".join(replies))
+            conn.flush()
+
+    def handle_line(self, line: bytes) -> bytes:
+        req = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ControlError("请求必须是 JSON 对象")
+            reply = {"ok": True, "status": self.dispatch(req)}
+        except (ControlError, ValueError) as exc:
+            reply = {"ok": False, "error": str(exc)}
+        if isinstance(req, dict) and "id" in req:
+            reply["id"] = req["id"]
+        return json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def dispatch(self, req: dict) -> dict:
+        command = COMMANDS.get(req.get("cmd"))
+        if command is None:
+            raise ControlError(f"未知命令: {req.get('cmd')!r}")
+        windows = self._windows()
+        index = req.get("timer", 0)
+        if isinstance(index, bool) or not isinstance(index, int) or not 0 <= index < len(windows):
+            raise ControlError(f"没有序号为 {index!r} 的计时器")
+        win = windows[index]
+        extra = command(win, req)
+        status = timer_status(win)
+        if extra:
+            status.update(extra)
+        return status
@@ -0,0 +1,170 @@
+"""
+倒计时核心：截止时刻、暂停/继续、颜色阈值与 MM:SS 格式化，不依赖 Qt。
+各个界面（Qt 窗口、终端）只负责按它的状态显示，并决定什么时候再来问它。
+
+时间由构造时传入的 now() 提供（默认 time.monotonic），运行时保存绝对截止时刻，
+显示的秒数由截止时刻推算，不会因为唤醒迟到而累积误差；暂停时保存精确剩余秒数。
+"""
+import math
+import time
+
+
+class CountdownState:
+    __slots__ = (
+        "total_seconds",      # 本段总时长（秒）
+        "remaining_seconds",  # 当前显示的整秒数
+        "remaining_exact",    # 暂停时的精确剩余秒数
+        "deadline",           # 运行时的截止时刻（now() 的时间轴），暂停时为 None
+        "running",
+        "blink_on",           # 红色闪烁的亮/暗相位
+        "flashing",           # 结束后的闪烁提示期间
+    )
+
+    def __init__(self, total_seconds: int):
+        self.total_seconds = total_seconds
+        self.remaining_seconds = total_seconds
+        self.remaining_exact = float(total_seconds)
+        self.deadline = None
+        self.running = False
+        self.blink_on = False
+        self.flashing = False
+
+
+class CountdownEngine:
+    MIN_MINUTES = 1
+    MAX_MINUTES = 180
+    DEFAULT_SECONDS = 15 * 60
+    ORANGE_S = 30
+    RED_S = 10
+    BLINK_S = 0.5
+    FINISH_FLASH_S = 2.2
+
+    __slots__ = ("state", "now")
+
+    def __init__(self, now=time.monotonic, total_seconds: int = DEFAULT_SECONDS):
+        self.now = now
+        self.state = CountdownState(total_seconds)
+
+    @staticmethod
+    def format_time(seconds: int) -> str:
+        m, s = divmod(max(0, seconds), 60)
+        return f"{m:02d}:{s:02d}"
+
+    @classmethod
+    def clamp_seconds(cls, seconds: int) -> int:
+        return max(cls.MIN_MINUTES * 60, min(cls.MAX_MINUTES * 60, seconds))
+
+    # 查询
+    def left(self) -> float:
+        """此刻的精确剩余秒数。"""
+        s = self.state
+        if s.running:
+            return max(0.0, s.deadline - self.now())
+        return s.remaining_exact
+
+    def text(self) -> str:
+        return self.format_time(self.state.remaining_seconds)
+
+    def color_state(self) -> str:
+        s = self.state
+        if s.remaining_seconds <= self.RED_S:
+            return "red_on" if s.blink_on else "red_off"
+        if s.remaining_seconds <= self.ORANGE_S:
+            return "orange"
+        return "normal"
+
+    def blinking(self) -> bool:
+        s = self.state
+        return s.flashing or (s.running and s.remaining_seconds <= self.RED_S)
+
+    @staticmethod
+    def next_change(left: float) -> float:
+        # 下一次显示变化发生在剩余时间跌破 ceil(left) - 1 时；至少前进 1 微秒，
+        # 避免恰好落在秒边界上的浮点误差让同一时刻被反复登记
+        return max(left - (math.ceil(left) - 1), 1e-6)
+
+    # 操作
+    def start(self):
+        s = self.state
+        if s.remaining_seconds <= 0:
+            s.remaining_seconds = s.total_seconds
+            s.remaining_exact = float(s.total_seconds)
+        s.deadline = self.now() + s.remaining_exact
+        s.running = True
+
+    def pause(self) -> bool:
+        """返回暂停前是否在运行；剩余时间原样带到下次开始，不补齐不足一秒的部分。"""
+        s = self.state
+        if not s.running:
+            return False
+        s.remaining_exact = max(0.0, s.deadline - self.now())
+        s.deadline = None
+        s.running = False
+        return True
+
+    def reset(self):
+        s = self.state
+        self.pause()
+        s.remaining_seconds = s.total_seconds
+        s.remaining_exact = float(s.total_seconds)
+        s.flashing = False
+        s.blink_on = False
+
+    def set_duration(self, seconds: int) -> int:
+        """改总时长并从头计时（运行中保持运行），返回限制在允许范围内的秒数。"""
+        s = self.state
+        seconds = self.clamp_seconds(seconds)
+        s.total_seconds = seconds
+        s.remaining_seconds = seconds
+        s.remaining_exact = float(seconds)
+        if s.running:
+            s.deadline = self.now() + s.remaining_exact
+        s.flashing = False
+        s.blink_on = False
+        return seconds
+
+    def set_remaining(self, remaining: float):
+        s = self.state
+        s.remaining_exact = remaining
+        s.remaining_seconds = math.ceil(remaining)
+        if s.running:
+            s.deadline = self.now() + remaining
+
+    def restore(self, total_seconds: int, remaining: float, running: bool):
+        s = self.state
+        self.pause()
+        s.total_seconds = self.clamp_seconds(total_seconds)
+        s.remaining_exact = min(float(remaining), float(s.total_seconds))
+        s.remaining_seconds = math.ceil(s.remaining_exact)
+        s.flashing = False
+        s.blink_on = False
+        if running:
+            self.start()
+
+    def sync(self, left: float) -> bool:
+        """按剩余时间更新显示秒数，返回显示是否变化。"""
+        shown = math.ceil(left)
+        if shown != self.state.remaining_seconds:
+            self.state.remaining_seconds = shown
+            return True
+        return False
+
+    def finish(self):
+        s = self.state
+        self.pause()
+        s.remaining_seconds = 0
+        s.remaining_exact = 0.0
+        s.blink_on = False
+        s.flashing = True
+
+    def end_flash(self):
+        self.state.flashing = False
+
+    def blink(self) -> bool:
+        """切换红色闪烁相位；不在红色区间时复位并返回 False。"""
+        s = self.state
+        if s.remaining_seconds <= self.RED_S:
+            s.blink_on = not s.blink_on
+            return True
+        s.blink_on = False
+        return False
@@ -0,0 +1,175 @@
+"""
+生成计时器自带的数字字体 fonts/PPTTimerDigits-Bold.ttf。
+
+只含时间显示用到的字符（0-9、':'、空格），数字等宽，笔画由矩形拼成（数码管风格），
+不依赖系统字体，也没有第三方授权问题。字形改动后重新运行本脚本并提交生成的 .ttf：
+    python fonts/make_digit_font.py
+
+输出是确定的（时间戳字段固定为 0），同样的字形总是得到同样的字节。
+"""
+import struct
+from pathlib import Path
+
+FAMILY = "PPT Timer Digits"
+STYLE = "Bold"
+PS_NAME = "PPTTimerDigits-Bold"
+VERSION = "Version 1.000"
+OUT = Path(__file__).resolve().parent / "PPTTimerDigits-Bold.ttf"
+
+UPM = 1000
+ASCENT, DESCENT = 800, 200
+DIGIT_W, COLON_W, SPACE_W = 600, 300, 300
+
+# 数字的笔画框（字形坐标，y 向上）：左右 60..540，高 0..700，笔画粗 110
+X0, X1, T = 60, 540, 110
+Y_TOP, Y_MID = 700, 350
+TOP = (X0, Y_TOP - T, X1, Y_TOP)
+MID = (X0, Y_MID - T // 2, X1, Y_MID + T // 2)
+BOTTOM = (X0, 0, X1, T)
+LEFT_UP = (X0, Y_MID, X0 + T, Y_TOP)
+LEFT_DOWN = (X0, 0, X0 + T, Y_MID)
+RIGHT_UP = (X1 - T, Y_MID, X1, Y_TOP)
+RIGHT_DOWN = (X1 - T, 0, X1, Y_MID)
+SEGMENTS = {
+    "0": (TOP, BOTTOM, LEFT_UP, LEFT_DOWN, RIGHT_UP, RIGHT_DOWN),
+    "1": (RIGHT_UP, RIGHT_DOWN, (X1 - 2 * T, Y_TOP - T, X1, Y_TOP)),
+    "2": (TOP, MID, BOTTOM, RIGHT_UP, LEFT_DOWN),
+    "3": (TOP, MID, BOTTOM, RIGHT_UP, RIGHT_DOWN),
+    "4": (MID, LEFT_UP, RIGHT_UP, RIGHT_DOWN),
+    "5": (TOP, MID, BOTTOM, LEFT_UP, RIGHT_DOWN),
+    "6": (TOP, MID, BOTTOM, LEFT_UP, LEFT_DOWN, RIGHT_DOWN),
+    "7": (TOP, RIGHT_UP, RIGHT_DOWN),
+    "8": (TOP, MID, BOTTOM, LEFT_UP, LEFT_DOWN, RIGHT_UP, RIGHT_DOWN),
+    "9": (TOP, MID, BOTTOM, LEFT_UP, RIGHT_UP, RIGHT_DOWN),
+}
+DOT = 110
+COLON = (
+    ((COLON_W - DOT) // 2, 130, (COLON_W + DOT) // 2, 130 + DOT),
+    ((COLON_W - DOT) // 2, 460, (COLON_W + DOT) // 2, 460 + DOT),
+)
+NOTDEF = ((50, 0, 550, 60), (50, 640, 550, 700), (50, 0, 110, 700), (490, 0, 550, 700))
+
+# 字形顺序：.notdef、空格、0-9、':'
+GLYPHS = [(".notdef", DIGIT_W, NOTDEF), ("space", SPACE_W, ())]
+GLYPHS += [(d, DIGIT_W, SEGMENTS[d]) for d in "0123456789"]
+GLYPHS += [("colon", COLON_W, COLON)]
+
+
+def glyph_data(rects):
+    """矩形按顺时针输出为闭合轮廓（TrueType 填充方向），重叠处按非零规则合并。"""
+    if not rects:
+        return b"", (0, 0, 0, 0)
+    points, ends = [], []
+    for x0, y0, x1, y1 in rects:
+        points += [(x0, y0), (x0, y1), (x1, y1), (x1, y0)]
+        ends.append(len(points) - 1)
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+    bbox = (min(xs), min(ys), max(xs), max(ys))
+    data = struct.pack(">hhhhh", len(rects), *bbox)
+    data += struct.pack(f">{len(ends)}H", *ends)
+    data += struct.pack(">H", 0)  # 无 hinting 指令
+    data += bytes([0x01]) * len(points)  # 全部为曲线上的点，坐标用 16 位差值
+    px = py = 0
+    dx, dy = [], []
+    for x, y in points:
+        dx.append(x - px)
+        dy.append(y - py)
+        px, py = x, y
+    data += struct.pack(f">{len(dx)}h", *dx) + struct.pack(f">{len(dy)}h", *dy)
+    return data + b"\0" * (-len(data) % 4), bbox
+
+
+def checksum(data: bytes) -> int:
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+def cmap_table():
+    segments = [(0x20, 0x20, 1 - 0x20), (0x30, 0x3A, 2 - 0x30), (0xFFFF, 0xFFFF, 1)]
+    n = len(segments)
+    search = 2 ** (n.bit_length() - 1)
+    sub = struct.pack(">HHHHHHH", 4, 0, 0, n * 2, search * 2, search.bit_length() - 1, (n - search) * 2)
+    sub += struct.pack(f">{n}H", *(s[1] for s in segments)) + b"\0\0"
+    sub += struct.pack(f">{n}H", *(s[0] for s in segments))
+    sub += struct.pack(f">{n}h", *(s[2] for s in segments))
+    sub += struct.pack(f">{n}H", *([0] * n))
+    sub = sub[:2] + struct.pack(">H", len(sub)) + sub[4:]
+    return struct.pack(">HHHHI", 0, 1, 3, 1, 12) + sub
+
+
+def name_table():
+    names = {
+        1: FAMILY, 2: STYLE, 3: f"{PS_NAME};1.000", 4: f"{FAMILY} {STYLE}", 5: VERSION, 6: PS_NAME,
+    }
+    records, strings = b"", b""
+    for name_id, text in names.items():
+        raw = text.encode("utf-16-be")
+        records += struct.pack(">HHHHHH", 3, 1, 0x409, name_id, len(raw), len(strings))
+        strings += raw
+    return struct.pack(">HHH", 0, len(names), 6 + len(records)) + records + strings
+
+
+def build() -> bytes:
+    glyf, loca, hmtx = b"", [0], b""
+    boxes = []
+    max_points = max_contours = 0
+    for _, advance, rects in GLYPHS:
+        data, bbox = glyph_data(rects)
+        glyf += data
+        loca.append(len(glyf))
+        hmtx += struct.pack(">Hh", advance, bbox[0])
+        if rects:
+            boxes.append(bbox)
+        max_points = max(max_points, 4 * len(rects))
+        max_contours = max(max_contours, len(rects))
+    x_min = min(b[0] for b in boxes)
+    y_min = min(b[1] for b in boxes)
+    x_max = max(b[2] for b in boxes)
+    y_max = max(b[3] for b in boxes)
+    n = len(GLYPHS)
+
+    tables = {
+        "OS/2": struct.pack(
+            ">HhHHHhhhhhhhhhhh10sIIII4sHHHhhhHHII",
+            4, DIGIT_W, 700, 5, 0,
+            650, 600, 0, 75, 650, 600, 0, 350, 50, 300, 0,
+            bytes([2, 11, 8, 3, 0, 0, 0, 0, 0, 0]), 1, 0, 0, 0, b"PPTT", 0x20,
+            0x20, 0x3A, ASCENT, -DESCENT, 0, ASCENT, DESCENT, 1, 0,
+        ) + struct.pack(">hhHHH", 0, 700, 0, 0x20, 1),
+        "cmap": cmap_table(),
+        "glyf": glyf,
+        "head": struct.pack(
+            ">IIIIHHqqhhhhHHhhh",
+            0x00010000, 0x00010000, 0, 0x5F0F3CF5, 0x0009, UPM, 0, 0,
+            x_min, y_min, x_max, y_max, 1, 8, 2, 1, 0,
+        ),
+        "hhea": struct.pack(
+            ">IhhhHhhhhhhhhhhhH",
+            0x00010000, ASCENT, -DESCENT, 0, DIGIT_W, 0, 0, x_max, 1, 0, 0, 0, 0, 0, 0, 0, n,
+        ),
+        "hmtx": hmtx,
+        "loca": struct.pack(f">{len(loca)}I", *loca),
+        "maxp": struct.pack(">IHHHHHHHHHHHHHH", 0x00010000, n, max_points, max_contours, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0),
+        "name": name_table(),
+        "post": struct.pack(">IIhhIIIII", 0x00030000, 0, -100, 50, 0, 0, 0, 0, 0),
+    }
+
+    count = len(tables)
+    search = 2 ** (count.bit_length() - 1)
+    header = struct.pack(">IHHHH", 0x00010000, count, search * 16, search.bit_length() - 1, (count - search) * 16)
+    offset = len(header) + 16 * count
+    directory, body = b"", b""
+    for tag in sorted(tables):
+        data = tables[tag]
+        directory += struct.pack(">4sIII", tag.encode("ascii"), checksum(data), offset + len(body), len(data))
+        body += data + b"\0" * (-len(data) % 4)
+    font = bytearray(header + directory + body)
+    # head.checkSumAdjustment：整个文件的校验和与 0xB1B0AFBA 之差
+    head_offset = struct.unpack_from(">I", directory, 16 * sorted(tables).index("head") + 8)[0]
+    struct.pack_into(">I", font, head_offset + 8, (0xB1B0AFBA - checksum(bytes(font))) & 0xFFFFFFFF)
+    return bytes(font)
+
+
+if __name__ == "__main__":
+    OUT.write_bytes(build())
+    print(f"已生成 {OUT}（{OUT.stat().st_size} 字节）")
@@ -1,45 +1,351 @@
+import argparse
+import logging
+import math
+import os
 import sys
-from PySide6.QtCore import Qt, QTimer, QPoint, QEasingCurve, Property, QEvent
-from PySide6.QtGui import QFont, QCursor, QGuiApplication, QShortcut, QKeySequence
+import time
+
+if __name__ == "__main__" and "--tty" in sys.argv[1:]:
+    # 终端模式在导入 PySide6 之前分流，进程里不加载任何 Qt 库
+    from tty_timer import main as tty_main
+
+    sys.exit(tty_main(sys.argv[1:]))
+
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QPoint,
+    QEasingCurve,
+    QPropertyAnimation,
+    QAbstractAnimation,
+    Property,
+    QEvent,
+    QObject,
+    QRect,
+    QRectF,
+    QSize,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QFontMetrics,
+    QCursor,
+    QGuiApplication,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRegion,
+    QShortcut,
+    QKeySequence,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
-    QLabel,
     QPushButton,
     QHBoxLayout,
     QVBoxLayout,
     QLineEdit,
-    QGraphicsOpacityEffect,
+    QLabel,
 )
 
+from agenda import load_agenda
+from audio_cues import THRESHOLDS as CUE_THRESHOLDS, open_audio
+from clocks import MonotonicClock, VirtualClock, WakeQueue
+from countdown_engine import CountdownEngine
+from control_server import ControlServer
+from mirror import DEFAULT_ADDRESS as DEFAULT_MIRROR_ADDRESS, MirrorPublisher, MirrorSubscriber
+from perf_trace import start_from_env as start_trace
+from pptx_pacing import WEIGHTINGS as PACE_WEIGHTINGS, DeckError, load_deck, pace_text
+from state_store import StateStore
+from tick_log import TickLog, dump_path as dump_tick_log_path
+from timer_font import timer_font
+
+log = logging.getLogger("ppt_timer")
+
 
 class FadeWidget(QWidget):
+    """
+    可淡入淡出的容器，子控件放在 content 里。
+    静止时不透明度为 1 就让子控件照常绘制，为 0 就隐藏 content，都不挂任何图形效果；
+    只在淡入淡出期间隐藏 content，改为按当前不透明度贴一张 content 的快照。
+    快照缓存到 content 的尺寸、样式或子控件显隐变化为止，反复悬停不会重新截图。
+    """
+
+    INVALIDATE_EVENTS = (QEvent.Resize, QEvent.LayoutRequest, QEvent.StyleChange, QEvent.PaletteChange)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
-        self._opacity_effect.setOpacity(0.0)
+        self.content = QWidget(self)
+        policy = self.content.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.content.setSizePolicy(policy)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.content)
+        self.content.installEventFilter(self)
         self._opacity = 0.0
+        self._snapshot = None
+        self._fading = False
+        self.snapshots = 0
+        self.content.setVisible(False)
 
     def getOpacity(self):
         return self._opacity
 
     def setOpacity(self, value):
         self._opacity = value
-        self._opacity_effect.setOpacity(value)
+        if 0.0 < value < 1.0:
+            if not self._fading:
+                if self._snapshot is None or self._snapshot.devicePixelRatio() != self.content.devicePixelRatioF():
+                    self._grab()
+                self._fading = True
+                self.content.setVisible(False)
+            self.update(self.content.geometry())
+            return
+        if self._fading:
+            self._fading = False
+            self.update(self.content.geometry())
+        self.content.setVisible(value == 1.0)
 
     opacity = Property(float, getOpacity, setOpacity)
 
+    def _grab(self):
+        # content 可能从未显示过：先完成样式与排版，否则截到的是空图，
+        # 随后补发的 LayoutRequest/Resize 还会在淡入途中把快照作废
+        self.content.ensurePolished()
+        chain = [self.content]
+        while chain[-1].parentWidget() is not None:
+            chain.append(chain[-1].parentWidget())
+        # 自外向内重新排版：控制区刚变为可见时，它在窗口布局里的位置与大小也还没定
+        for widget in reversed(chain):
+            if widget.layout() is not None:
+                widget.layout().invalidate()
+                widget.layout().activate()
+        self._snapshot = self.content.grab()
+        self.snapshots += 1
+
+    def eventFilter(self, obj, event):
+        if obj is self.content and event.type() in self.INVALIDATE_EVENTS:
+            self._snapshot = None
+        return super().eventFilter(obj, event)
+
+    def paintEvent(self, event):
+        if self._fading and self._snapshot is None:
+            # 淡入淡出途中尺寸或样式变了：按新的样子重新截图
+            self._grab()
+        if self._fading:
+            painter = QPainter(self)
+            painter.setOpacity(self._opacity)
+            painter.drawPixmap(self.content.pos(), self._snapshot)
+            painter.end()
+
+
+class WakeScheduler(WakeQueue, QObject):
+    """WakeQueue 接到 Qt 事件循环上：用一个单次精确定时器在最早到期的时刻唤醒。"""
+
+    def __init__(self, clock, parent=None, granularity: float = 0.0):
+        QObject.__init__(self, parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self.poll)
+        WakeQueue.__init__(self, clock, granularity)
+
+    def _arm(self, delay_ms):
+        if delay_ms is None:
+            self._timer.stop()
+        else:
+            self._timer.start(delay_ms)
+
+
+class RenderStats(QObject):
+    """统计目标控件收到的样式刷新与重绘事件，用于衡量每次刷新的开销。"""
+
+    WATCHED = {
+        QEvent.Polish: "polish",
+        QEvent.StyleChange: "style_change",
+        QEvent.PaletteChange: "palette_change",
+        QEvent.Paint: "paint",
+    }
+
+    def __init__(self, target):
+        super().__init__(target)
+        self.counts = dict.fromkeys(self.WATCHED.values(), 0)
+        target.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        name = self.WATCHED.get(event.type())
+        if name is not None:
+            self.counts[name] += 1
+        return False
+
+    def reset(self):
+        for k in self.counts:
+            self.counts[k] = 0
+
+
+class TimeDisplay(QWidget):
+    """
+    自绘的 MM:SS 显示：把 0-9 与 ':' 按颜色、字体和设备像素比预渲染进一张图集，
+    绘制时只贴图；setText 只把发生变化的字符格子加入重绘区域。
+    """
+
+    GLYPHS = "0123456789:"
+    MAX_ATLASES = 16
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._atlases = {}
+        self._atlas = None  # (dpr, pixmap, {字符: 源矩形})，颜色/字体变化时置空
+        self._cells = None  # 每个字符的 (QRect, QRectF) 目标格子，尺寸/字体/长度变化时置空
+        self.tick_log = None
+        self._metrics()
+
+    def _metrics(self):
+        fm = QFontMetrics(self.font())
+        # 数字等宽，避免跳秒时整体抖动；冒号单独计宽
+        self._digit_w = max(fm.horizontalAdvance(c) for c in "0123456789")
+        self._colon_w = fm.horizontalAdvance(":")
+        self._cell_h = fm.height()
+        self._atlas = None
+        self._cells = None
+
+    def _glyph_width(self, ch: str) -> int:
+        return self._colon_w if ch == ":" else self._digit_w
+
+    def _build_atlas(self, dpr: float):
+        color = self.palette().color(QPalette.WindowText)
+        key = (color.rgba(), dpr, self.font().key())
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            if len(self._atlases) >= self.MAX_ATLASES:
+                self._atlases.clear()
+            width = self._digit_w * 10 + self._colon_w
+            pixmap = QPixmap(math.ceil(width * dpr), math.ceil(self._cell_h * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(self.font())
+            painter.setPen(color)
+            sources = {}
+            for i, ch in enumerate(self.GLYPHS):
+                w = self._glyph_width(ch)
+                painter.drawText(QRect(i * self._digit_w, 0, w, self._cell_h), Qt.AlignCenter, ch)
+                sources[ch] = QRectF(i * self._digit_w * dpr, 0, w * dpr, self._cell_h * dpr)
+            painter.end()
+            atlas = self._atlases[key] = (dpr, pixmap, sources)
+        self._atlas = atlas
+        return atlas
+
+    def _layout(self):
+        if self._cells is None:
+            total = sum(self._glyph_width(ch) for ch in self._text)
+            x = (self.width() - total) // 2
+            y = (self.height() - self._cell_h) // 2
+            cells = []
+            for ch in self._text:
+                w = self._glyph_width(ch)
+                rect = QRect(x, y, w, self._cell_h)
+                cells.append((rect, QRectF(rect)))
+                x += w
+            self._cells = cells
+        return self._cells
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str):
+        if text == self._text:
+            return
+        old, self._text = self._text, text
+        if len(old) != len(text):
+            self._cells = None
+            self.updateGeometry()
+            self.update()
+            return
+        dirty = QRegion()
+        for (rect, _), a, b in zip(self._layout(), old, text):
+            if a != b:
+                dirty += rect
+        self.update(dirty)
+
+    def sizeHint(self) -> QSize:
+        width = sum(self._glyph_width(ch) for ch in self._text or "00:00")
+        return QSize(width, self._cell_h)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def changeEvent(self, event):
+        et = event.type()
+        if et == QEvent.FontChange:
+            self._metrics()
+            self.updateGeometry()
+            self.update()
+        elif et == QEvent.PaletteChange:
+            self._atlas = None
+            self.update()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._cells = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        tick_log = self.tick_log
+        if tick_log is not None:
+            t0 = time.perf_counter()
+        dpr = self.devicePixelRatioF()
+        atlas = self._atlas
+        if atlas is None or atlas[0] != dpr:
+            atlas = self._build_atlas(dpr)
+        _, pixmap, sources = atlas
+        clip = event.rect()
+        painter = QPainter(self)
+        for (rect, target), ch in zip(self._layout(), self._text):
+            source = sources.get(ch)
+            if source is not None and clip.intersects(rect):
+                painter.drawPixmap(target, pixmap, source)
+        painter.end()
+        if tick_log is not None:
+            tick_log.paint(time.perf_counter() - t0)
+
 
 class CountdownWindow(QWidget):
-    MIN_MINUTES = 1
-    MAX_MINUTES = 180
+    # 显示或运行状态变化（镜像发布端据此发帧）
+    state_changed = Signal()
+
+    MIN_MINUTES = CountdownEngine.MIN_MINUTES
+    MAX_MINUTES = CountdownEngine.MAX_MINUTES
+    HOVER_FADE_MS = 180
+    BLINK_S = CountdownEngine.BLINK_S
+    FINISH_FLASH_S = CountdownEngine.FINISH_FLASH_S
+    OCCLUDED_TICK_S = 5
+    HOVER_DEBOUNCE_MS = 40
+    HOVER_EVENTS = (QEvent.Enter, QEvent.HoverEnter, QEvent.Leave, QEvent.HoverLeave)
 
     COLOR_NORMAL = "#8B0000"  # 深红
     COLOR_ORANGE = "#FF8C00"
     COLOR_RED = "#FF0000"
+    COLOR_RED_DIM = "#AA0000"
 
-    def __init__(self):
+    # 颜色状态 -> 颜色；每个状态预先生成一份调色板，切换时只换调色板
+    STATE_COLORS = {
+        "normal": COLOR_NORMAL,
+        "orange": COLOR_ORANGE,
+        "red_on": COLOR_RED,
+        "red_off": COLOR_RED_DIM,
+    }
+
+    # 渲染方式：translucent 逐像素透明（默认）；mask 仍透明，但窗口裁剪到时间与按钮；
+    # solid 不透明底色，合成器不必做 alpha 混合
+    RENDER_MODES = ("translucent", "mask", "solid")
+    SOLID_BACKDROP = "#DCDCDC"
+    MASK_EVENTS = (QEvent.Resize, QEvent.Move, QEvent.Show, QEvent.Hide, QEvent.LayoutRequest)
+
+    def __init__(self, clock=None, scheduler=None):
         super().__init__()
 
         # 窗口属性：无边框、透明背景、始终置顶
@@ -48,34 +354,69 @@ class CountdownWindow(QWidget):
         )
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setMouseTracking(True)
+        self.render_mode = "translucent"
+        self._mask_sources = ()
 
-        # 状态
-        self.total_seconds = 15 * 60
-        self.remaining_seconds = self.total_seconds
-        self.is_running = False
+        # 计时状态与规则都在 CountdownEngine 里，窗口只负责显示与安排唤醒
+        if scheduler is not None:
+            clock = scheduler.clock
+        self.clock = clock or MonotonicClock()
+        self._now = self.clock.now
+        self.engine = CountdownEngine(self._now)
+        self.read_only = False
+        self.tick_log = None
+        self.audio = None
         self.dragging = False
         self.drag_offset = QPoint()
-        self.blink_state = False
+        self._press_pos = None
+        self._moved = False
+
+        # 唯一的计时唤醒源：跳秒（对齐秒边界）、闪烁与结束提示都登记在这里。
+        # 暂停/结束后没有登记项，隐藏时只保留截止时刻一次唤醒，被遮挡时降频。
+        # 由 TimerManager 托管时与其他窗口共用同一个调度器
+        self.scheduler = scheduler or WakeScheduler(self.clock, self)
+        self._tick_key = (id(self), "tick")
+        self._blink_key = (id(self), "blink")
+        self._flash_key = (id(self), "flash_end")
+        self._agenda_key = (id(self), "agenda")
 
-        # 定时器
-        self.tick_timer = QTimer(self)
-        self.tick_timer.setInterval(1000)
-        self.tick_timer.timeout.connect(self.on_tick)
+        # 议程模式：结束一段后自动切到下一段；墙钟议程按当前时间定位分段
+        self.agenda = None
+        self._agenda_index = -1
+        self._wall_offset = time.time() - self._now()
 
-        self.blink_timer = QTimer(self)
-        self.blink_timer.setInterval(500)
-        self.blink_timer.timeout.connect(self.on_blink)
+        # 幻灯片节奏：按总时长给每页分配预算，显示“此刻应讲到第几页”
+        self.deck = None
+        self._pace_options = ("equal", False)
+        self._pace_plan = None
+        self._pace_total = None
+        self._pace_index = -1
+        self.power_mode = "visible"
+        self._watching_expose = False
+
+        # 拖动：只保留最新指针位置，每个显示帧最多真正移动一次窗口
+        self._drag_target = None
+        self._drag_queued_at = 0.0
+        self._frame_ms = 16
+        self.move_timer = QTimer(self)
+        self.move_timer.setSingleShot(True)
+        self.move_timer.setTimerType(Qt.PreciseTimer)
+        self.move_timer.timeout.connect(self._apply_drag_move)
+        self.drag_stats = {"requested": 0, "applied": 0, "worst_frame_ms": 0.0}
 
         # 主要显示：时间
-        self.time_label = QLabel(self.format_time(self.remaining_seconds))
-        self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet(
-            f"QLabel{{color:{self.COLOR_NORMAL}; background: transparent;}}"
-        )
-        font = QFont("Segoe UI", 40, QFont.Bold)
-        self.time_label.setFont(font)
+        self.time_label = TimeDisplay(self.engine.text())
+        self._palettes = {}
+        for state, color in self.STATE_COLORS.items():
+            palette = QPalette(self.time_label.palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._palettes[state] = palette
+        self._color_state = "normal"
+        self.time_label.setPalette(self._palettes["normal"])
+        self.time_label.setFont(timer_font())
         self.time_label.setCursor(QCursor(Qt.IBeamCursor))
         self.time_label.setMouseTracking(True)
+        self.render_stats = RenderStats(self.time_label)
 
         # 时间编辑框（点击时切换）
         self.time_edit = QLineEdit()
@@ -102,7 +443,7 @@ class CountdownWindow(QWidget):
         # 悬停控制区（重置、暂停、关闭）
         self.hover_controls = FadeWidget()
         self.hover_controls.setVisible(True)
-        hover_layout = QHBoxLayout(self.hover_controls)
+        hover_layout = QHBoxLayout(self.hover_controls.content)
         hover_layout.setContentsMargins(0, 0, 0, 0)
         hover_layout.setSpacing(8)
 
@@ -139,6 +480,14 @@ class CountdownWindow(QWidget):
         top_row.addWidget(self.time_container)
         top_row.addWidget(self.start_button, 0, Qt.AlignVCenter)
 
+        # 节奏行：加载了演示文稿时才显示
+        self.pace_label = QLabel()
+        self.pace_label.setVisible(False)
+        self.pace_label.setStyleSheet(f"QLabel{{color:{self.COLOR_NORMAL}; font-size:14px; font-weight:bold;}}")
+        pace_row = QHBoxLayout()
+        pace_row.setContentsMargins(12, 0, 12, 6)
+        pace_row.addWidget(self.pace_label, 0, Qt.AlignLeft)
+
         # 底部行：悬停控制
         bottom_row = QHBoxLayout()
         bottom_row.setContentsMargins(12, 0, 12, 10)
@@ -149,10 +498,23 @@ class CountdownWindow(QWidget):
         root.setContentsMargins(10, 10, 10, 10)
         root.setSpacing(0)
         root.addLayout(top_row)
+        root.addLayout(pace_row)
         root.addLayout(bottom_row)
 
+        # 悬停淡入淡出：整个窗口只用这一个动画对象，反复改目标值复用
+        self.hover_anim = QPropertyAnimation(self.hover_controls, b"opacity", self)
+        self.hover_anim.setEasingCurve(QEasingCurve.InOutQuad)
+        self.hover_anim.finished.connect(self._on_hover_fade_finished)
+
         # 初始：控制隐藏（透明）
         self.set_hover_visible(False, instant=True)
+        self._hover_state = "outside"
+        self._hover_target = "outside"
+        self.hover_stats = {"events": 0, "hit_tests": 0, "transitions": 0}
+        self._hover_debounce = QTimer(self)
+        self._hover_debounce.setSingleShot(True)
+        self._hover_debounce.setInterval(self.HOVER_DEBOUNCE_MS)
+        self._hover_debounce.timeout.connect(self._resolve_hover)
 
         # 交互：事件过滤用于 hover 显示
         self.installEventFilter(self)
@@ -170,16 +532,40 @@ class CountdownWindow(QWidget):
         self.move(int(screen.width() * 0.7), int(screen.height() * 0.1))
 
     # 事件过滤：控制 hover 可见性
+    # 窗口与子控件的进出事件只负责启动一次防抖，成串的 Enter/Leave 合并为一次判定
     def eventFilter(self, obj, event):
-        et = event.type()
-        if et in (QEvent.Enter, QEvent.HoverEnter):
-            self.set_hover_visible(True)
-        elif et in (QEvent.Leave, QEvent.HoverLeave):
-            # 如果鼠标仍在控制区或时间区内，不隐藏
-            if not self.rect().contains(self.mapFromGlobal(QCursor.pos())):
-                self.set_hover_visible(False)
+        if event.type() == QEvent.Expose and obj is self.windowHandle():
+            self._update_power_mode()
+        elif event.type() in self.HOVER_EVENTS:
+            self.hover_stats["events"] += 1
+            if not self._hover_debounce.isActive():
+                self._hover_debounce.start()
+        elif self.render_mode == "mask" and event.type() in self.MASK_EVENTS and obj in self._mask_sources:
+            self._update_mask()
         return super().eventFilter(obj, event)
 
+    def _pointer_inside(self) -> bool:
+        # 鼠标仍在控制区或时间区内即视为在窗口内；裁剪模式下以裁剪区域的外接矩形为准，
+        # 在数字与按钮之间的空隙移动不算离开
+        pos = self.mapFromGlobal(QCursor.pos())
+        if self.render_mode == "mask":
+            return self.mask().boundingRect().contains(pos)
+        return self.rect().contains(pos)
+
+    # 悬停状态机：outside / inside / fading（正在淡向 _hover_target）
+    def _resolve_hover(self):
+        self.hover_stats["hit_tests"] += 1
+        target = "inside" if self._pointer_inside() else "outside"
+        if target == self._hover_target:
+            return
+        self._hover_target = target
+        self.hover_stats["transitions"] += 1
+        self.set_hover_visible(target == "inside")
+        if self.hover_anim.state() == QAbstractAnimation.Running:
+            self._hover_state = "fading"
+        else:
+            self._hover_state = target
+
     # 透明背景下自绘一个圆角阴影（轻微）以增强可读性（不遮挡内容）
     def paintEvent(self, event):
         # 不绘制背景，保持完全透明
@@ -192,6 +578,9 @@ class CountdownWindow(QWidget):
             self._moved = False
             self.dragging = True
             self.drag_offset = self._press_pos - self.frameGeometry().topLeft()
+            rate = self.screen().refreshRate() if self.screen() else 0
+            self._frame_ms = max(1, int(1000 / rate)) if rate > 0 else 16
+            self.drag_stats = {"requested": 0, "applied": 0, "worst_frame_ms": 0.0}
             event.accept()
             return
         super().mousePressEvent(event)
@@ -201,15 +590,41 @@ class CountdownWindow(QWidget):
             now_pos = event.globalPosition().toPoint()
             if (now_pos - self._press_pos).manhattanLength() > 3:
                 self._moved = True
-            self.move(now_pos - self.drag_offset)
+            self.drag_stats["requested"] += 1
+            if self._drag_target is None:
+                self._drag_queued_at = time.perf_counter()
+            self._drag_target = now_pos - self.drag_offset
+            if not self.move_timer.isActive():
+                self.move_timer.start(self._frame_ms)
             event.accept()
             return
         super().mouseMoveEvent(event)
 
+    def _apply_drag_move(self):
+        if self._drag_target is None:
+            return
+        self.move(self._drag_target)
+        self._drag_target = None
+        stats = self.drag_stats
+        stats["applied"] += 1
+        # 帧耗时：从本帧第一次排队到真正移动完成
+        spent = (time.perf_counter() - self._drag_queued_at) * 1000
+        if spent > stats["worst_frame_ms"]:
+            stats["worst_frame_ms"] = spent
+
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and self.dragging:
             was_moved = self._moved
             self.dragging = False
+            # 松开时立即落到最后位置
+            self.move_timer.stop()
+            self._apply_drag_move()
+            if was_moved:
+                stats = self.drag_stats
+                log.debug(
+                    "drag: %d moves requested, %d applied, worst frame %.1f ms",
+                    stats["requested"], stats["applied"], stats["worst_frame_ms"],
+                )
             event.accept()
             # 未移动且不在运行时，进入编辑
             if not was_moved and not self.is_running and self.time_label.underMouse():
@@ -228,98 +643,330 @@ class CountdownWindow(QWidget):
     # 悬停控制显隐与动画
     def set_hover_visible(self, visible: bool, instant: bool = False):
         target = 1.0 if visible else 0.0
+        anim = self.hover_anim
         if instant:
+            anim.stop()
             self.hover_controls.setVisible(True)
             self.hover_controls.setOpacity(target)
             if target == 0.0:
                 self.hover_controls.setVisible(False)
             return
-        from PySide6.QtCore import QPropertyAnimation
-
-        self.hover_controls.setVisible(True)
-        anim = QPropertyAnimation(self.hover_controls, b"opacity", self)
-        anim.setDuration(180)
-        anim.setStartValue(self.hover_controls.getOpacity())
+        current = self.hover_controls.getOpacity()
+        if anim.state() == QAbstractAnimation.Running:
+            # 已在朝同一目标淡入/淡出
+            if anim.endValue() == target:
+                return
+        elif current == target:
+            return
+        # 被打断时从当前不透明度出发反向，时长按剩余距离缩放，保持速度一致
+        anim.stop()
+        anim.setStartValue(current)
         anim.setEndValue(target)
-        anim.setEasingCurve(QEasingCurve.InOutQuad)
-        def on_finished():
-            if target == 0.0:
-                self.hover_controls.setVisible(False)
-        anim.finished.connect(on_finished)
+        anim.setDuration(max(1, round(self.HOVER_FADE_MS * abs(target - current))))
+        self.hover_controls.setVisible(True)
         anim.start()
 
+    def _on_hover_fade_finished(self):
+        if self.hover_controls.getOpacity() == 0.0:
+            self.hover_controls.setVisible(False)
+        self._hover_state = self._hover_target
+
     # 计时逻辑
     def on_tick(self):
-        if self.remaining_seconds <= 0:
+        if self.tick_log is not None and self.scheduler.current_due is not None:
+            self.tick_log.tick(self.scheduler.current_due)
+        left = self.engine.left()
+        if left <= 0:
             self.finish_timer()
             return
-        self.remaining_seconds -= 1
-        self.update_time_view()
-        if self.remaining_seconds <= 10 and not self.blink_timer.isActive():
-            self.blink_timer.start()
+        shown = self.remaining_seconds
+        if self.engine.sync(left):
+            if self.audio is not None:
+                self._play_threshold_cues(shown)
+            self.update_time_view()
+        self._sync_blink()
+        self._arm_tick(left)
+
+    def _arm_tick(self, left: float):
+        step = self.engine.next_change(left)
+        if self.power_mode == "hidden":
+            # 不可见时不刷新，只在截止时刻醒一次
+            step = left
+        elif self.power_mode == "occluded":
+            # 被遮挡时按秒边界降频，但不越过截止时刻
+            step = min(left, step + self.OCCLUDED_TICK_S - 1)
+        if self.audio is not None and self.power_mode != "visible":
+            # 开了提示音时，降频或隐藏也要按时醒来响提示音
+            for seconds, _ in CUE_THRESHOLDS:
+                if left > seconds:
+                    step = min(step, left - seconds)
+        self.scheduler.schedule(self._tick_key, self._now() + step, self.on_tick)
+
+    def _play_threshold_cues(self, shown: int):
+        # 显示的秒数从阈值以上跳到阈值（或更低）时响一次；
+        # 一次越过多个阈值（调整剩余时间）时只响最低的那个
+        for seconds, cue in sorted(CUE_THRESHOLDS):
+            if shown > seconds >= self.remaining_seconds:
+                self.audio.play(cue)
+                break
+
+    def _sync_blink(self):
+        # 只在可见时闪烁：运行中最后 10 秒，或结束提示期间
+        should = self.power_mode == "visible" and self.engine.blinking()
+        if should and not self.scheduler.pending(self._blink_key):
+            self.scheduler.schedule(self._blink_key, self._now() + self.BLINK_S, self.on_blink)
+        elif not should:
+            self.scheduler.cancel(self._blink_key)
 
     def on_blink(self):
-        if self.remaining_seconds <= 10:
-            self.blink_state = not self.blink_state
+        if self.engine.blink():
             self.update_time_view()
+            self._sync_blink()
+
+    def _end_flash(self):
+        self.engine.end_flash()
+        self._sync_blink()
+        if self.agenda is not None:
+            self.advance_agenda()
+
+    def _update_power_mode(self):
+        handle = self.windowHandle()
+        if not self.isVisible() or self.isMinimized():
+            mode = "hidden"
+        elif handle is not None and not handle.isExposed():
+            mode = "occluded"
         else:
-            self.blink_timer.stop()
-            self.blink_state = False
+            mode = "visible"
+        if mode == self.power_mode:
+            return
+        self.power_mode = mode
+        if self.is_running:
+            # 立即按新模式重排；从隐藏恢复时顺带补上显示
+            self.on_tick()
+        else:
+            self._sync_blink()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not self._watching_expose:
+            # 遮挡与否只能从顶层 QWindow 的 Expose 事件得知
+            handle.installEventFilter(self)
+            self._watching_expose = True
+        self._update_power_mode()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_power_mode()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self._update_power_mode()
+        super().changeEvent(event)
+
+    def wakeups_per_minute(self) -> int:
+        return self.scheduler.wakeups_per_minute()
+
+    # 视图读取的状态都来自计时核心
+    format_time = staticmethod(CountdownEngine.format_time)
+
+    @property
+    def total_seconds(self) -> int:
+        return self.engine.state.total_seconds
 
-    def format_time(self, seconds: int) -> str:
-        m, s = divmod(max(0, seconds), 60)
-        return f"{m:02d}:{s:02d}"
+    @total_seconds.setter
+    def total_seconds(self, seconds: int):
+        self.engine.state.total_seconds = seconds
+
+    @property
+    def remaining_seconds(self) -> int:
+        return self.engine.state.remaining_seconds
+
+    @remaining_seconds.setter
+    def remaining_seconds(self, seconds: int):
+        self.engine.state.remaining_seconds = seconds
+
+    @property
+    def is_running(self) -> bool:
+        return self.engine.state.running
+
+    @property
+    def blink_state(self) -> bool:
+        return self.engine.state.blink_on
+
+    @blink_state.setter
+    def blink_state(self, on: bool):
+        self.engine.state.blink_on = on
+
+    def color_state(self) -> str:
+        return self.engine.color_state()
 
     def update_time_view(self):
-        # 颜色策略
-        if self.remaining_seconds <= 10:
-            # 红色闪烁
-            color = self.COLOR_RED if self.blink_state else "#AA0000"
-        elif self.remaining_seconds <= 30:
-            color = self.COLOR_ORANGE
+        # 只有颜色状态变化时才换调色板，其余刷新只是一次文本更新
+        state = self.color_state()
+        if state != self._color_state:
+            self._color_state = state
+            self.time_label.setPalette(self._palettes[state])
+            self._log_event(state)
+        self.time_label.setText(self.engine.text())
+        if self.deck is not None:
+            self._update_pace()
+        self.state_changed.emit()
+
+    # 幻灯片节奏
+    def load_deck(self, deck, weighting: str = "equal", include_hidden: bool = False):
+        self.deck = deck
+        self._pace_options = (weighting, include_hidden)
+        self._pace_total = None
+        self.pace_label.setVisible(True)
+        self._update_pace()
+        self._update_mask()
+
+    def _update_pace(self):
+        # 总时长变了才重新分配；跳秒时只做一次二分查找，页码变了才改文字
+        total = self.total_seconds
+        if total != self._pace_total:
+            self._pace_plan = self.deck.plan(total, *self._pace_options)
+            self._pace_total = total
+            self._pace_index = -1
+        plan = self._pace_plan
+        i = plan.index_at(total - self.remaining_seconds)
+        if i != self._pace_index:
+            self._pace_index = i
+            self.pace_label.setText(pace_text(self.deck, plan, i))
+            self.pace_label.setToolTip(self.deck.titles[plan.slides[i]])
+
+    def set_read_only(self):
+        # 镜像窗口：只显示收到的状态，不接受本地操作，也不在本地计时
+        self.pause_timer()
+        self.read_only = True
+        for b in (self.start_button, self.pause_button, self.reset_button):
+            b.setVisible(False)
+        self._update_mask()
+
+    def set_render_mode(self, mode: str):
+        """在 show() 之前调用：透明属性改变需要重建原生窗口。"""
+        if mode not in self.RENDER_MODES:
+            raise ValueError(f"未知的渲染方式: {mode}")
+        self.render_mode = mode
+        solid = mode == "solid"
+        self.setAttribute(Qt.WA_TranslucentBackground, not solid)
+        # 打开透明背景时 Qt 会顺带设置 WA_NoSystemBackground，关掉时要自己恢复
+        self.setAttribute(Qt.WA_NoSystemBackground, not solid)
+        if solid:
+            palette = QPalette(self.palette())
+            palette.setColor(QPalette.Window, QColor(self.SOLID_BACKDROP))
+            self.setPalette(palette)
+        self.setAutoFillBackground(solid)
+        if mode == "mask":
+            # 布局变化会移动/缩放这几个子控件，据此重算裁剪区域（窗口自身移动不影响）
+            buttons = (self.pause_button, self.reset_button, self.close_button)
+            self._mask_sources = (
+                self.time_container, self.time_label, self.start_button, self.hover_controls, self.pace_label,
+                self.hover_controls.content, *buttons,
+            )
+            for widget in (self.time_container, self.start_button, self.pace_label, self.hover_controls.content, *buttons):
+                widget.installEventFilter(self)
+        self._update_mask()
+
+    def _update_mask(self):
+        # 裁剪区域：时间数字（编辑时为编辑框）、开始按钮，以及正在显示的悬停按钮。
+        # 按钮取外接矩形而不是圆形：圆形区域会拆成几十个矩形，每次重绘的裁剪都要付出代价
+        if self.render_mode != "mask":
+            if not self.mask().isEmpty():
+                self.clearMask()
+            return
+        label = self.time_label
+        if label.isVisibleTo(self):
+            # 时间控件会随布局拉高，只取居中的数字部分
+            rect = QRect(QPoint(), label.sizeHint())
+            rect.moveCenter(label.rect().center())
+            rect.translate(label.mapTo(self, QPoint()))
         else:
-            color = self.COLOR_NORMAL
-        self.time_label.setStyleSheet(f"QLabel{{color:{color}; background: transparent;}}")
-        self.time_label.setText(self.format_time(self.remaining_seconds))
+            rect = QRect(self.time_edit.mapTo(self, QPoint()), self.time_edit.size())
+        region = QRegion(rect)
+        if self.start_button.isVisibleTo(self):
+            region += self.start_button.geometry()
+        if self.pace_label.isVisibleTo(self):
+            region += self.pace_label.geometry()
+        # 淡入淡出期间按钮本身是隐藏的（画的是快照），看悬停控制区整体是否显示
+        controls = self.hover_controls
+        if controls.isVisibleTo(self):
+            # 首次显示前 content 还没排过版，按钮都挤在 x=0，先让布局就位再取位置
+            controls.content.layout().activate()
+            for b in (self.pause_button, self.reset_button, self.close_button):
+                if b.isVisibleTo(controls.content):
+                    region += QRect(b.mapTo(self, QPoint()), b.size())
+        if region != self.mask():
+            self.setMask(region)
+
+    def show_remote_state(self, remaining_ms: int, color: str):
+        self.engine.set_remaining(remaining_ms / 1000)
+        if color != self._color_state:
+            self._color_state = color
+            self.time_label.setPalette(self._palettes[color])
+        self.time_label.setText(self.engine.text())
+
+    def set_tick_log(self, tick_log):
+        # 计时记录：跳秒迟到、时间数字绘制耗时与状态事件
+        self.tick_log = tick_log
+        self.time_label.tick_log = tick_log
+
+    def _log_event(self, name: str):
+        if self.tick_log is not None:
+            self.tick_log.event(name)
 
     def toggle_start_pause(self):
+        if self.read_only:
+            return
         if self.is_running:
             self.pause_timer()
         else:
             self.start_timer()
 
     def start_timer(self):
-        if self.remaining_seconds <= 0:
-            self.remaining_seconds = self.total_seconds
-        self.tick_timer.start()
-        self.is_running = True
+        self.engine.start()
+        self._log_event("start")
+        self._arm_tick(self.engine.left())
+        self._sync_blink()
         self.start_button.setText("⏸")
         self.pause_button.setText("⏸")
+        self.state_changed.emit()
 
     def pause_timer(self):
-        self.tick_timer.stop()
-        self.is_running = False
+        self.scheduler.cancel(self._tick_key)
+        if self.engine.pause():
+            self._log_event("pause")
+        self._sync_blink()
         self.start_button.setText("▶")
         self.pause_button.setText("▶")
+        self.state_changed.emit()
 
     def reset_timer(self):
+        if self.read_only:
+            return
         self.pause_timer()
-        self.remaining_seconds = self.total_seconds
-        self.blink_timer.stop()
-        self.blink_state = False
+        self._log_event("reset")
+        self.engine.reset()
+        self.scheduler.cancel(self._flash_key)
+        self._sync_blink()
         self.update_time_view()
 
     def finish_timer(self):
+        if self.audio is not None:
+            self.audio.play("finish")
         self.pause_timer()
-        self.remaining_seconds = 0
-        self.update_time_view()
+        self._log_event("finish")
         # 结束提示：快速红色闪烁几次
-        self.blink_state = False
-        self.blink_timer.start()
-        QTimer.singleShot(2200, self.blink_timer.stop)
+        self.engine.finish()
+        self.update_time_view()
+        self._sync_blink()
+        self.scheduler.schedule(self._flash_key, self._now() + self.FINISH_FLASH_S, self._end_flash)
 
     # 编辑分钟
     def enter_edit_mode(self):
+        if self.read_only:
+            return
         minutes = max(1, self.total_seconds // 60)
         self.time_edit.setText(str(minutes))
         self.time_stack.setCurrentWidget(self.time_edit)
@@ -332,14 +979,71 @@ class CountdownWindow(QWidget):
             minutes = int(text)
         except ValueError:
             minutes = max(self.MIN_MINUTES, min(self.MAX_MINUTES, self.total_seconds // 60))
-        minutes = max(self.MIN_MINUTES, min(self.MAX_MINUTES, minutes))
-        self.total_seconds = minutes * 60
-        self.remaining_seconds = self.total_seconds
-        self.blink_timer.stop()
-        self.blink_state = False
-        self.update_time_view()
+        self.set_duration(minutes * 60)
         self.time_stack.setCurrentWidget(self.time_label)
 
+    def set_duration(self, seconds: int):
+        self._log_event("set_duration")
+        self.engine.set_duration(seconds)
+        if self.is_running:
+            self._arm_tick(self.engine.left())
+        self.scheduler.cancel(self._flash_key)
+        self._sync_blink()
+        self.update_time_view()
+
+    def restore_state(self, total_seconds: int, remaining: float, running: bool):
+        # 崩溃恢复：按保存的总时长与精确剩余时间还原，运行中的接着计时
+        self.pause_timer()
+        self._log_event("restore")
+        self.engine.restore(total_seconds, remaining, running=False)
+        self.scheduler.cancel(self._flash_key)
+        self.update_time_view()
+        if running:
+            self.start_timer()
+
+    # 议程
+    def load_agenda(self, agenda):
+        self.pause_timer()
+        self.agenda = agenda
+        self._agenda_index = -1
+        # 相对议程等演讲者按开始；墙钟议程立即对上当前分段
+        self.advance_agenda(autostart=agenda.anchored)
+
+    def _wall_now(self) -> float:
+        return self._now() + self._wall_offset
+
+    def advance_agenda(self, autostart: bool = True):
+        agenda = self.agenda
+        self.scheduler.cancel(self._agenda_key)
+        now = self._wall_now()
+        if agenda.anchored:
+            i = agenda.index_at(now)
+        else:
+            i = self._agenda_index + 1
+        if i >= len(agenda):
+            self.setWindowTitle("")
+            self.time_label.setToolTip("议程已结束")
+            return
+        self._agenda_index = i
+        title, start, end = agenda.segment(i)
+        self.setWindowTitle(title)
+        self.time_label.setToolTip(title)
+        self.total_seconds = math.ceil(end - start)
+        self.reset_timer()
+        if agenda.anchored:
+            if start > now:
+                # 落在空档里：到点再开始
+                self.scheduler.schedule(self._agenda_key, self._now() + (start - now), self._start_agenda_segment)
+                return
+            self.engine.set_remaining(end - now)
+            self.update_time_view()
+        if autostart:
+            self.start_timer()
+
+    def _start_agenda_segment(self):
+        if not self.is_running:
+            self.start_timer()
+
     def safe_close(self):
         self.close()
 
@@ -368,11 +1072,175 @@ class QStackedLayoutCompat(QVBoxLayout):
             each.setVisible(each is w)
 
 
+class TimerManager(QObject):
+    """
+    在一个进程里托管多个独立的倒计时窗口。所有窗口共用一个调度器，
+    也就只有一个心跳定时器；各窗口仍只在显示的秒数或颜色变化时重绘。
+    """
+
+    HEARTBEAT_S = 0.02
+
+    def __init__(self, clock=None, parent=None):
+        super().__init__(parent)
+        self.clock = clock or MonotonicClock()
+        self.scheduler = WakeScheduler(self.clock, self, granularity=self.HEARTBEAT_S)
+        self.windows = []
+
+    def create_window(self, minutes=None) -> CountdownWindow:
+        win = CountdownWindow(scheduler=self.scheduler)
+        win.setAttribute(Qt.WA_DeleteOnClose, True)
+        if minutes is not None:
+            minutes = max(win.MIN_MINUTES, min(win.MAX_MINUTES, minutes))
+            win.total_seconds = minutes * 60
+            win.reset_timer()
+        owner = id(win)
+        win.destroyed.connect(lambda *_: self._forget(win, owner))
+        self.windows.append(win)
+        return win
+
+    def _forget(self, win, owner):
+        # 窗口销毁后撤掉它在共享调度器里的登记
+        self.scheduler.cancel_owner(owner)
+        if win in self.windows:
+            self.windows.remove(win)
+
+    def close_all(self):
+        for win in list(self.windows):
+            win.close()
+
+
+# PPT_TIMER_TRACE 开启时被包上计时的热点方法
+TRACE_TARGETS = {
+    WakeQueue: ("poll",),
+    TimeDisplay: ("setText", "paintEvent"),
+    CountdownWindow: (
+        "on_tick", "on_blink", "update_time_view", "paintEvent", "eventFilter", "_resolve_hover",
+        "set_hover_visible", "mousePressEvent", "mouseMoveEvent", "mouseReleaseEvent", "_apply_drag_move",
+    ),
+}
+
+
 def main():
-    app = QApplication(sys.argv)
-    win = CountdownWindow()
-    win.show()
-    sys.exit(app.exec())
+    logging.basicConfig(level=os.environ.get("PPT_TIMER_LOG_LEVEL", "WARNING").upper())
+    parser = argparse.ArgumentParser(description="PPT 倒计时")
+    parser.add_argument(
+        "--speed", type=float, default=0,
+        help="时间压缩倍数（如 1000），用于快速演练长倒计时；默认使用真实时间",
+    )
+    parser.add_argument(
+        "--timers", type=int, default=1,
+        help="在同一进程中打开多个独立倒计时（共用一个心跳）",
+    )
+    parser.add_argument("--agenda", help="议程文件（.csv / .json / .jsonl），按分段自动切换")
+    parser.add_argument("--track", help="只加载议程中指定 track 的分段")
+    parser.add_argument("--pptx", help="演示文稿（.pptx），按页分配总时长并显示此刻应讲到第几页")
+    parser.add_argument(
+        "--pace", choices=PACE_WEIGHTINGS, default="equal",
+        help="按页分配方式：equal 平均分配；notes 按演讲者备注长度加权",
+    )
+    parser.add_argument("--include-hidden", action="store_true", help="隐藏的幻灯片也分配时间")
+    parser.add_argument(
+        "--control", metavar="ADDR",
+        help="开启本地控制接口（JSON Lines），如 127.0.0.1:8765 或 unix:/tmp/ppt-timer.sock",
+    )
+    parser.add_argument(
+        "--state", metavar="PATH",
+        help="崩溃恢复状态文件（默认 ~/.ppt-timer/state.bin，或环境变量 PPT_TIMER_STATE；"
+             "已被另一个计时器占用时改用 state-2.bin 等）",
+    )
+    parser.add_argument("--no-resume", action="store_true", help="启动时不恢复上次的计时状态")
+    parser.add_argument("--sounds", action="store_true", help="剩余 30 秒、10 秒与结束时播放提示音")
+    parser.add_argument(
+        "--render", choices=CountdownWindow.RENDER_MODES, default="translucent",
+        help="窗口渲染方式：translucent 逐像素透明；mask 裁剪到时间与按钮；solid 不透明底色（合成开销最小）",
+    )
+    parser.add_argument("--tty", action="store_true", help="终端模式（curses，不加载 Qt），可配合 --minutes N、--speed")
+    mirror = parser.add_mutually_exclusive_group()
+    mirror.add_argument(
+        "--publish", nargs="?", const=DEFAULT_MIRROR_ADDRESS, metavar="GROUP:PORT",
+        help=f"把倒计时状态组播给镜像窗口（默认 {DEFAULT_MIRROR_ADDRESS}）",
+    )
+    mirror.add_argument(
+        "--mirror", nargs="?", const=DEFAULT_MIRROR_ADDRESS, metavar="GROUP:PORT",
+        help="作为镜像窗口只显示发布端的状态，本地不计时",
+    )
+    args, qt_args = parser.parse_known_args()
+    if args.timers > 1:
+        # 议程、崩溃恢复与镜像只接在单窗口上，多窗口时不能静默忽略
+        single_only = [
+            flag for flag, value in (
+                ("--agenda", args.agenda), ("--track", args.track),
+                ("--state", args.state), ("--no-resume", args.no_resume),
+                ("--publish", args.publish), ("--mirror", args.mirror),
+            ) if value
+        ]
+        if single_only:
+            parser.error(f"{'、'.join(single_only)} 只能用于单个计时器，不能与 --timers {args.timers} 同时使用")
+    tracer = start_trace(TRACE_TARGETS)
+    agenda = None
+    if args.agenda:
+        try:
+            agenda = load_agenda(args.agenda, args.track)
+        except (OSError, ValueError) as exc:
+            parser.error(f"{args.agenda}: {exc}")
+    deck = None
+    if args.pptx:
+        try:
+            deck = load_deck(args.pptx)
+            deck.playable(args.include_hidden)
+        except DeckError as exc:
+            parser.error(f"{args.pptx}: {exc}")
+    app = QApplication(sys.argv[:1] + qt_args)
+    clock = VirtualClock(speed=args.speed) if args.speed > 0 else None
+    # 提示音在启动时合成并打开输出，到点只需写入
+    audio = open_audio() if args.sounds else None
+    if audio is not None:
+        app.aboutToQuit.connect(audio.close)
+    if args.timers > 1:
+        manager = TimerManager(clock)
+        for i in range(args.timers):
+            win = manager.create_window()
+            win.audio = audio
+            if audio is not None and i:
+                # 每个窗口一路输出，同时到点的提示音不会争用同一个缓冲区
+                win.audio = audio.channel()
+                app.aboutToQuit.connect(win.audio.close)
+            win.set_render_mode(args.render)
+            if deck is not None:
+                win.load_deck(deck, args.pace, args.include_hidden)
+            win.move(win.pos() + QPoint(0, 40 * (i % 16)))
+            win.show()
+    else:
+        win = CountdownWindow(clock)
+        win.audio = audio
+        win.set_render_mode(args.render)
+        tick_log = TickLog(win._now)
+        win.set_tick_log(tick_log)
+        if os.environ.get("PPT_TIMER_TICK_LOG"):
+            app.aboutToQuit.connect(lambda: tick_log.dump_csv(dump_tick_log_path()))
+        if agenda is not None:
+            win.load_agenda(agenda)
+        if deck is not None:
+            win.load_deck(deck, args.pace, args.include_hidden)
+        if agenda is None and not args.mirror:
+            # 单窗口计时才保存状态；议程模式由议程本身决定分段
+            store = StateStore(args.state)
+            store.attach(win, resume=not args.no_resume)
+            app.aboutToQuit.connect(store.close)
+        if args.publish:
+            MirrorPublisher(win, args.publish)
+        elif args.mirror:
+            win.set_read_only()
+            MirrorSubscriber(lambda frame: win.show_remote_state(frame.remaining_ms, frame.color), args.mirror, win)
+        win.show()
+        windows = [win]
+    if args.control:
+        server = ControlServer(manager.windows if args.timers > 1 else windows, app)
+        server.listen(args.control)
+    code = app.exec()
+    if tracer is not None:
+        tracer.close()
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+"""
+镜像显示：发布端把倒计时状态打成定长二进制帧，通过 UDP 组播发给各个镜像窗口；
+订阅端只按收到的帧显示，不在本地计时，多块屏幕因此不会各走各的。
+
+帧（网络字节序，24 字节）：
+    magic "PPTM" | 版本 u8 | 标志 u8 | 颜色 u8 | 保留 u8 | 会话 u32 | 序号 u32 | 剩余毫秒 i32 | 总秒数 u32
+单调时钟上的截止时刻在不同机器之间没有可比性，帧里发送的是发出时刻的剩余毫秒数。
+序号不新于已显示帧的包（迟到、乱序、重复）直接丢弃；发布端重启会换会话号，订阅端随之重新同步。
+"""
+import logging
+import os
+import struct
+from typing import NamedTuple
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtNetwork import QAbstractSocket, QHostAddress, QUdpSocket
+
+log = logging.getLogger("ppt_timer.mirror")
+
+DEFAULT_ADDRESS = "239.255.42.99:45454"
+MAGIC = b"PPTM"
+VERSION = 1
+FRAME = struct.Struct("!4sBBBxIIiI")
+COLOR_STATES = ("normal", "orange", "red_on", "red_off")
+FLAG_RUNNING = 0x01
+FLAG_FLASHING = 0x02
+
+
+class MirrorFrame(NamedTuple):
+    session: int
+    seq: int
+    running: bool
+    flashing: bool
+    color: str
+    remaining_ms: int
+    total_seconds: int
+
+
+def pack_frame(session, seq, running, flashing, color, remaining_ms, total_seconds) -> bytes:
+    flags = (FLAG_RUNNING if running else 0) | (FLAG_FLASHING if flashing else 0)
+    return FRAME.pack(
+        MAGIC, VERSION, flags, COLOR_STATES.index(color),
+        session, seq & 0xFFFFFFFF, remaining_ms, total_seconds,
+    )
+
+
+def unpack_frame(data: bytes):
+    """格式不对（长度、magic、版本、颜色）时返回 None。"""
+    if len(data) != FRAME.size:
+        return None
+    magic, version, flags, color, session, seq, remaining_ms, total_seconds = FRAME.unpack(data)
+    if magic != MAGIC or version != VERSION or color >= len(COLOR_STATES):
+        return None
+    return MirrorFrame(
+        session, seq, bool(flags & FLAG_RUNNING), bool(flags & FLAG_FLASHING),
+        COLOR_STATES[color], remaining_ms, total_seconds,
+    )
+
+
+def parse_address(address: str):
+    host, _, port = address.rpartition(":")
+    return QHostAddress(host or DEFAULT_ADDRESS.partition(":")[0]), int(port)
+
+
+class MirrorPublisher(QObject):
+    """
+    跟随窗口的 state_changed 发帧：同一轮事件里的多次变化合并成一帧。
+    一段时间没有变化（如暂停）时重发最后一帧，让晚加入的订阅端也能对上。
+    """
+
+    KEEPALIVE_S = 1.0
+
+    def __init__(self, win, address=DEFAULT_ADDRESS, ttl=1):
+        super().__init__(win)
+        self.win = win
+        self.group, self.port = parse_address(address)
+        self.session = int.from_bytes(os.urandom(4), "big")
+        self.seq = 0
+        self.sent = 0
+        self._queued = False
+        self._keepalive_key = (id(win), "mirror_keepalive")
+        self.socket = QUdpSocket(self)
+        self.socket.setSocketOption(QAbstractSocket.MulticastTtlOption, ttl)
+        self.socket.setSocketOption(QAbstractSocket.MulticastLoopbackOption, 1)
+        win.state_changed.connect(self._queue)
+        log.info("镜像发布到 %s", address)
+        self._queue()
+
+    def _queue(self):
+        if not self._queued:
+            self._queued = True
+            QTimer.singleShot(0, self.publish)
+
+    def publish(self):
+        self._queued = False
+        win = self.win
+        state = win.engine.state
+        self.seq = (self.seq + 1) & 0xFFFFFFFF
+        data = pack_frame(
+            self.session, self.seq, state.running, state.flashing,
+            win._color_state, int(win.engine.left() * 1000), state.total_seconds,
+        )
+        self.socket.writeDatagram(data, self.group, self.port)
+        self.sent += 1
+        win.scheduler.schedule(self._keepalive_key, win._now() + self.KEEPALIVE_S, self.publish)
+
+
+class MirrorSubscriber(QObject):
+    """
+    加入组播组，把每批到达的包里最新的有效帧交给 on_frame(frame)。
+    stats 统计收到、丢弃（迟到/乱序/重复）、格式错误与序号空洞（丢包）。
+    """
+
+    def __init__(self, on_frame, address=DEFAULT_ADDRESS, parent=None):
+        super().__init__(parent)
+        self.on_frame = on_frame
+        self.group, self.port = parse_address(address)
+        self._session = None
+        self._seq = 0
+        self.stats = {"received": 0, "dropped": 0, "malformed": 0, "lost": 0}
+        self.socket = QUdpSocket(self)
+        bound = self.socket.bind(
+            QHostAddress(QHostAddress.AnyIPv4), self.port,
+            QAbstractSocket.ShareAddress | QAbstractSocket.ReuseAddressHint,
+        )
+        if not bound or not self.socket.joinMulticastGroup(self.group):
+            raise OSError(f"无法加入组播 {address}: {self.socket.errorString()}")
+        self.socket.readyRead.connect(self._read)
+        log.info("镜像订阅 %s", address)
+
+    def _read(self):
+        socket = self.socket
+        stats = self.stats
+        latest = None
+        while socket.hasPendingDatagrams():
+            frame = unpack_frame(socket.receiveDatagram().data().data())
+            stats["received"] += 1
+            if frame is None:
+                stats["malformed"] += 1
+                continue
+            if frame.session != self._session:
+                # 新的发布端（或发布端重启）：从这一帧重新开始
+                self._session = frame.session
+            else:
+                ahead = (frame.seq - self._seq) & 0xFFFFFFFF
+                if ahead == 0 or ahead >= 0x80000000:
+                    stats["dropped"] += 1
+                    continue
+                stats["lost"] += ahead - 1
+            self._seq = frame.seq
+            latest = frame
+        if latest is not None:
+            self.on_frame(latest)
@@ -0,0 +1,105 @@
+"""
+性能追踪：设置环境变量 PPT_TIMER_TRACE=trace.json 后，把计时、绘制、事件过滤与鼠标处理等
+热点方法包一层计时，输出 Chrome / Perfetto 可打开的 trace event JSON（chrome://tracing、ui.perfetto.dev）。
+
+- 时间戳取 perf_counter_ns，写出时换算成微秒并保留到纳秒
+- 事件先攒在内存里（只存 名称、开始、结束 三元组），每满一批才写一次文件
+- 未开启时不做任何替换，被追踪的方法就是原函数，没有额外开销
+- 使用数组格式：进程异常退出时缺少结尾的 "]" 也能被查看器读取
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+ENV = "PPT_TIMER_TRACE"
+BATCH = 4096
+
+
+class Tracer:
+    def __init__(self, path, batch: int = BATCH):
+        self.path = path
+        self.batch = batch
+        self.events = []
+        self.written = 0
+        self._patched = []
+        self._pid = os.getpid()
+        self._tid = threading.get_native_id()
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write("[\n")
+        self._meta("process_name", {"name": "ppt_timer"})
+        self._meta("thread_name", {"name": "GUI"})
+        atexit.register(self.close)
+
+    def _meta(self, name, args, last=False):
+        self._file.write(json.dumps({
+            "name": name, "ph": "M", "pid": self._pid, "tid": self._tid, "args": args,
+        }) + ("\n" if last else ",\n"))
+
+    def add(self, name, start_ns, end_ns):
+        events = self.events
+        events.append((name, start_ns, end_ns))
+        if len(events) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if not self.events or self._file is None:
+            return
+        head = f'{{"ph":"X","pid":{self._pid},"tid":{self._tid},"name":"'
+        self._file.write("".join(
+            f'{head}{name}","ts":{start / 1000:.3f},"dur":{(end - start) / 1000:.3f}}},\n'
+            for name, start, end in self.events
+        ))
+        self._file.flush()
+        self.written += len(self.events)
+        self.events.clear()
+
+    def wrap(self, name, fn):
+        add = self.add
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                add(name, start, clock())
+
+        return traced
+
+    def patch(self, targets):
+        """targets: {类: (方法名, ...)}；按 类名.方法名 记录。"""
+        for cls, names in targets.items():
+            for name in names:
+                original = cls.__dict__[name]
+                self._patched.append((cls, name, original))
+                setattr(cls, name, self.wrap(f"{cls.__name__}.{name}", original))
+
+    def unpatch(self):
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched.clear()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        # 最后一项不带逗号并补上结尾，使文件成为合法 JSON
+        self._meta("trace_end", {"events": self.written}, last=True)
+        self._file.write("]\n")
+        self._file.close()
+        self._file = None
+        atexit.unregister(self.close)
+
+
+def start_from_env(targets):
+    """环境变量指定了路径时开始追踪并返回 Tracer，否则返回 None。"""
+    path = os.environ.get(ENV)
+    if not path:
+        return None
+    tracer = Tracer(path)
+    tracer.patch(targets)
+    return tracer
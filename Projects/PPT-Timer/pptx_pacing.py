@@ -0,0 +1,290 @@
+"""
+按幻灯片分配时间：读取 .pptx 的页序、标题、隐藏标记与演讲者备注长度，
+把总时长按页分成整秒预算，计时中据已用时间查出“此刻应讲到第几页”。
+
+.pptx 是 zip 包，只解压 XML 部件（presentation.xml、各页与备注页及其关系文件），
+图片、视频等媒体不读取；每个部件用 iterparse 增量解析，边读边丢弃元素。
+按本地名匹配标签，Transitional 与 Strict 两种命名空间都能识别。
+
+解析结果缓存在 ~/.ppt-timer/decks/ 下（环境变量 PPT_TIMER_DECK_CACHE 可另指目录），每个文件一份 JSON：
+- 大小与修改时间都没变：直接用缓存，不打开 zip
+- 修改时间变了但大小没变（复制、同步工具改了时间戳）：比对 zip 中央目录（各部件名、CRC、大小）的摘要，一致仍用缓存
+"""
+import bisect
+import hashlib
+import json
+import os
+import posixpath
+import zipfile
+from array import array
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+from countdown_engine import CountdownEngine
+
+CACHE_VERSION = 1
+WEIGHTINGS = ("equal", "notes")
+# 按备注加权时，预算中随备注长度变化的比例；其余部分每页均分，没有备注的页也有基本时间
+NOTES_SHARE = 0.7
+TITLE_TYPES = ("title", "ctrTitle")
+NOTES_REL = "/notesSlide"
+
+
+class DeckError(ValueError):
+    pass
+
+
+class Deck:
+    """按放映顺序的每页信息；hidden 为每页一个字节，notes_chars 为备注正文的字符数。"""
+
+    __slots__ = ("titles", "hidden", "notes_chars")
+
+    def __init__(self, titles, hidden, notes_chars):
+        self.titles = titles
+        self.hidden = hidden
+        self.notes_chars = notes_chars
+
+    def __len__(self):
+        return len(self.titles)
+
+    def playable(self, include_hidden: bool = False) -> array:
+        """参与分配的页；一页都没有时抛出 DeckError。"""
+        slides = array("I", (i for i in range(len(self)) if include_hidden or not self.hidden[i]))
+        if not slides:
+            raise DeckError("所有幻灯片都已隐藏，没有可分配时间的页（可加 --include-hidden）")
+        return slides
+
+    def plan(self, total_seconds: int, weighting: str = "equal", include_hidden: bool = False):
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"未知的分配方式: {weighting}")
+        slides = self.playable(include_hidden)
+        weights = [1.0] * len(slides)
+        if weighting == "notes":
+            mean = sum(self.notes_chars[i] for i in slides) / len(slides)
+            if mean > 0:
+                weights = [1 - NOTES_SHARE + NOTES_SHARE * self.notes_chars[i] / mean for i in slides]
+        return SlidePlan(slides, _split_seconds(total_seconds, weights))
+
+
+class SlidePlan:
+    """slides 为参与分配的页（Deck 中的下标），ends 为各页预算的累计结束秒数。"""
+
+    __slots__ = ("slides", "ends")
+
+    def __init__(self, slides, ends):
+        self.slides = slides
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.slides)
+
+    def index_at(self, elapsed: float) -> int:
+        """已用 elapsed 秒时应在讲的页；超时后停在最后一页。"""
+        return min(bisect.bisect_right(self.ends, elapsed), len(self.slides) - 1)
+
+    def budget(self, i: int) -> int:
+        return int(self.ends[i] - (self.ends[i - 1] if i else 0))
+
+
+def _split_seconds(total_seconds: int, weights) -> array:
+    # 最大余数法：各页取整后合计仍等于总时长
+    scale = total_seconds / sum(weights)
+    exact = [w * scale for w in weights]
+    seconds = [int(x) for x in exact]
+    short = total_seconds - sum(seconds)
+    for i in sorted(range(len(exact)), key=lambda i: seconds[i] - exact[i])[:short]:
+        seconds[i] += 1
+    ends = array("d")
+    t = 0
+    for s in seconds:
+        t += s
+        ends.append(t)
+    return ends
+
+
+# 解析
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _rel_id(attrib) -> str:
+    # r:id（命名空间随 Transitional / Strict 而不同）
+    for key, value in attrib.items():
+        if key.startswith("{") and _local(key) == "id":
+            return value
+    return ""
+
+
+def _read_rels(zf, part: str) -> dict:
+    """部件的关系文件：rId -> (类型, 部件路径)；没有关系文件时为空。"""
+    folder, name = posixpath.split(part)
+    rels_name = posixpath.join(folder, "_rels", name + ".rels")
+    try:
+        stream = zf.open(rels_name)
+    except KeyError:
+        return {}
+    rels = {}
+    with stream:
+        for _, elem in iterparse(stream):
+            if _local(elem.tag) == "Relationship" and elem.get("TargetMode") != "External":
+                target = elem.get("Target", "")
+                if target.startswith("/"):
+                    path = target.lstrip("/")
+                else:
+                    path = posixpath.normpath(posixpath.join(folder, target))
+                rels[elem.get("Id")] = (elem.get("Type", ""), path)
+            elem.clear()
+    return rels
+
+
+def _slide_order(zf) -> list:
+    rels = _read_rels(zf, "ppt/presentation.xml")
+    order = []
+    with zf.open("ppt/presentation.xml") as stream:
+        for _, elem in iterparse(stream):
+            tag = _local(elem.tag)
+            if tag == "sldId":
+                order.append(rels[_rel_id(elem.attrib)][1])
+            elif tag == "sldIdLst":
+                # 页序之后的内容（尺寸、默认文本样式……）不需要
+                break
+    return order
+
+
+def _scan_part(zf, part: str, wanted):
+    """
+    返回 (根元素属性, {占位符类型: 文本})。文本取自占位符类型在 wanted 中的形状，
+    同类型的形状只取第一个；不带 type 的占位符按 OOXML 默认视为 "obj"。
+    """
+    texts = {}
+    root = None
+    ph_type = None
+    chunks = None
+    with zf.open(part) as stream:
+        for event, elem in iterparse(stream, ("start", "end")):
+            tag = _local(elem.tag)
+            if event == "start":
+                if root is None:
+                    root = dict(elem.attrib)
+                elif tag == "sp":
+                    ph_type, chunks = None, []
+                elif tag == "ph" and chunks is not None:
+                    ph_type = elem.get("type", "obj")
+                continue
+            if tag == "t" and chunks is not None:
+                chunks.append(elem.text or "")
+            elif tag == "sp":
+                if ph_type in wanted and ph_type not in texts:
+                    texts[ph_type] = "".join(chunks)
+                ph_type, chunks = None, None
+                elem.clear()
+            elif tag in ("spTree", "grpSp", "pic", "graphicFrame", "cxnSp"):
+                elem.clear()
+    return root or {}, texts
+
+
+def parse_deck(path) -> Deck:
+    try:
+        zf = zipfile.ZipFile(path)
+    except (OSError, zipfile.BadZipFile) as exc:
+        raise DeckError(f"无法打开演示文稿: {exc}") from None
+    titles = []
+    hidden = bytearray()
+    notes_chars = array("I")
+    with zf:
+        try:
+            for part in _slide_order(zf):
+                attrib, texts = _scan_part(zf, part, TITLE_TYPES)
+                titles.append(texts.get("title") or texts.get("ctrTitle") or "")
+                hidden.append(attrib.get("show") in ("0", "false"))
+                chars = 0
+                for rel_type, target in _read_rels(zf, part).values():
+                    if rel_type.endswith(NOTES_REL):
+                        chars = len(_scan_part(zf, target, ("body",))[1].get("body", "").strip())
+                        break
+                notes_chars.append(chars)
+        except KeyError as exc:
+            raise DeckError(f"演示文稿缺少部件: {exc}") from None
+        except SyntaxError as exc:
+            raise DeckError(f"演示文稿 XML 无法解析: {exc}") from None
+    if not titles:
+        raise DeckError("演示文稿里没有幻灯片")
+    return Deck(titles, bytes(hidden), notes_chars)
+
+
+# 缓存
+def cache_dir() -> Path:
+    return Path(os.environ.get("PPT_TIMER_DECK_CACHE") or Path.home() / ".ppt-timer" / "decks")
+
+
+def cache_file(path: Path) -> Path:
+    name = hashlib.sha1(os.fsencode(path.resolve())).hexdigest()[:20]
+    return cache_dir() / f"{name}.json"
+
+
+def content_digest(path: Path) -> str:
+    """zip 中央目录的摘要：各部件名、CRC 与大小，任何部件内容变化都会反映出来。"""
+    h = hashlib.sha1()
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            h.update(f"{info.filename}\0{info.CRC:08x}\0{info.file_size}\n".encode())
+    return h.hexdigest()
+
+
+def _load_cached(cached: Path, st, path: Path):
+    try:
+        data = json.loads(cached.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, None
+    if data.get("version") != CACHE_VERSION or data.get("size") != st.st_size:
+        return None, None
+    if data.get("mtime_ns") != st.st_mtime_ns:
+        digest = content_digest(path)
+        if data.get("digest") != digest:
+            return None, digest
+        data["mtime_ns"] = st.st_mtime_ns
+        _write_cache(cached, data)
+    deck = Deck(data["titles"], bytes(data["hidden"]), array("I", data["notes_chars"]))
+    return deck, data["digest"]
+
+
+def _write_cache(cached: Path, data: dict):
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, cached)
+    except OSError:
+        # 缓存写不进去只是下次再解析一遍
+        pass
+
+
+def load_deck(path, use_cache: bool = True) -> Deck:
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError as exc:
+        raise DeckError(f"无法打开演示文稿: {exc}") from None
+    cached = cache_file(path)
+    digest = None
+    if use_cache:
+        deck, digest = _load_cached(cached, st, path)
+        if deck is not None:
+            return deck
+    deck = parse_deck(path)
+    if use_cache:
+        _write_cache(cached, {
+            "version": CACHE_VERSION,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "digest": digest or content_digest(path),
+            "titles": deck.titles,
+            "hidden": list(deck.hidden),
+            "notes_chars": list(deck.notes_chars),
+        })
+    return deck
+
+
+def pace_text(deck: Deck, plan: SlidePlan, i: int) -> str:
+    slide = plan.slides[i]
+    return f"第 {slide + 1}/{len(deck)} 页 · {CountdownEngine.format_time(plan.budget(i))}"
@@ -0,0 +1,169 @@
+"""
+崩溃保护：把计时状态保存在内存映射的小文件里，进程被杀或误按 Esc 后重启可以接着计时。
+
+只在状态真正变化时（开始、暂停、重置、改时长）原地改写映射内存，不逐秒写、不逐次 fsync；
+运行中记录的是墙钟截止时刻，跳秒不改变记录。脏页由内核回写，退出时 flush 一次。
+
+文件里有两个槽轮流写，每条记录（小端，40 字节）：
+    magic "PPTS" | 版本 u8 | 运行 u8 | 保留 2 | 总秒数 u32 | 剩余秒 f64 | 截止时刻(Unix) f64 | 代数 u64 | CRC32 u32
+读取时取校验通过且代数最大的一条，断电时写了一半的槽不影响另一条。
+
+打开的状态文件一直加着独占锁（进程退出或崩溃时由系统释放）。默认位置已被另一个
+运行中的计时器占用时依次改用 state-2.bin、state-3.bin……，同时运行的几个计时器不会互相覆盖；
+--state 指定的文件被占用时照常使用，但会警告。
+"""
+import itertools
+import logging
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+log = logging.getLogger("ppt_timer.state")
+
+MAGIC = b"PPTS"
+VERSION = 1
+RECORD = struct.Struct("<4sBB2xIddQI")
+SLOTS = 2
+FILE_SIZE = RECORD.size * SLOTS
+
+
+def default_path(instance: int = 1) -> Path:
+    path = Path(os.environ.get("PPT_TIMER_STATE") or Path.home() / ".ppt-timer" / "state.bin")
+    if instance > 1:
+        path = path.with_name(f"{path.stem}-{instance}{path.suffix}")
+    return path
+
+
+def _open_locked(path: Path):
+    """打开（必要时创建）状态文件并尝试加独占锁，返回 (fd, 是否拿到锁)。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            # 锁文件末尾之后的一个字节，不妨碍映射记录区
+            os.lseek(fd, FILE_SIZE, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return fd, False
+    return fd, True
+
+
+class TimerState(NamedTuple):
+    running: bool
+    total_seconds: int
+    remaining: float
+    deadline: float
+    generation: int
+
+
+def _pack(state: TimerState) -> bytes:
+    body = RECORD.pack(
+        MAGIC, VERSION, state.running, state.total_seconds,
+        state.remaining, state.deadline, state.generation, 0,
+    )[:-4]
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def _unpack(data: bytes):
+    magic, version, running, total, remaining, deadline, generation, crc = RECORD.unpack(data)
+    if magic != MAGIC or version != VERSION or crc != zlib.crc32(data[:-4]):
+        return None
+    return TimerState(bool(running), total, remaining, deadline, generation)
+
+
+class StateStore:
+    def __init__(self, path=None):
+        if path:
+            self.path = Path(path)
+            fd, locked = _open_locked(self.path)
+            if not locked:
+                log.warning("状态文件 %s 正被另一个计时器进程使用，两边会互相覆盖；"
+                            "同时运行多个计时器时请各用 --state 指定不同的文件", self.path)
+        else:
+            # 默认位置被占用时依次改用下一个实例的文件
+            for instance in itertools.count(1):
+                self.path = default_path(instance)
+                fd, locked = _open_locked(self.path)
+                if locked:
+                    break
+                os.close(fd)
+        # 锁跟着文件描述符，关闭存储时才释放
+        self._fd = fd
+        try:
+            if os.fstat(fd).st_size != FILE_SIZE:
+                os.ftruncate(fd, FILE_SIZE)
+            self._map = mmap.mmap(fd, FILE_SIZE)
+        except OSError:
+            os.close(fd)
+            raise
+        self.writes = 0
+        self._last = None
+        self._win = None
+        saved = self.load()
+        self._generation = saved.generation if saved else 0
+
+    def load(self):
+        best = None
+        for slot in range(SLOTS):
+            offset = slot * RECORD.size
+            state = _unpack(self._map[offset:offset + RECORD.size])
+            if state is not None and (best is None or state.generation > best.generation):
+                best = state
+        return best
+
+    def save(self, running: bool, total_seconds: int, remaining: float, deadline: float):
+        key = (running, total_seconds, remaining, deadline)
+        if key == self._last:
+            return
+        self._last = key
+        self._generation += 1
+        offset = (self._generation % SLOTS) * RECORD.size
+        self._map[offset:offset + RECORD.size] = _pack(TimerState(*key, self._generation))
+        self.writes += 1
+
+    def attach(self, win, resume: bool = True):
+        """先按保存的状态恢复窗口，再跟随 state_changed 保存。"""
+        self._win = win
+        saved = self.load() if resume else None
+        if saved is not None:
+            left = saved.deadline - win._wall_now() if saved.running else saved.remaining
+            if saved.running and left > 0:
+                win.restore_state(saved.total_seconds, left, running=True)
+            elif left > 0:
+                win.restore_state(saved.total_seconds, left, running=False)
+            else:
+                # 停机期间已经到点，或上次正常计时结束：回到这一段的完整时长，不停在闪烁的 00:00
+                win.restore_state(saved.total_seconds, saved.total_seconds, running=False)
+            log.info("从 %s 恢复计时状态: %s", self.path, saved)
+        win.state_changed.connect(self._on_state_changed)
+        self._on_state_changed()
+
+    def _on_state_changed(self):
+        win = self._win
+        state = win.engine.state
+        if state.running:
+            # 运行中的记录只取决于截止时刻：跳秒时与上次相同，不会写
+            self.save(True, state.total_seconds, 0.0, state.deadline + win._wall_offset)
+        else:
+            self.save(False, state.total_seconds, state.remaining_exact, 0.0)
+
+    def close(self):
+        if self._map.closed:
+            return
+        if self._win is not None:
+            self._win.state_changed.disconnect(self._on_state_changed)
+            self._win = None
+        self._map.flush()
+        self._map.close()
+        os.close(self._fd)
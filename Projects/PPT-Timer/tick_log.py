@@ -0,0 +1,87 @@
+"""
+计时记录：定长环形缓冲区，三列紧凑数组（时刻 d / 类型 B / 数值 d），记录时不创建 Python 对象。
+
+- tick   每次跳秒：时刻为实际执行时间，数值为登记的到期时间（两者之差即迟到）
+- paint  每次绘制时间数字：数值为绘制耗时（秒）
+- event  开始、暂停、重置、结束、改时长以及颜色状态切换：数值为事件编号
+
+默认容量 65536 条（约 1.1 MB），3 小时会话按每秒一次跳秒、一次绘制再加闪烁也用不完；
+写满后覆盖最旧的记录。dump_csv() 按时间顺序导出；设置了 PPT_TIMER_TICK_LOG 时退出时自动导出，
+也可以通过控制接口的 dump_tick_log 命令随时导出。
+"""
+import csv
+import os
+import tempfile
+from array import array
+from pathlib import Path
+
+TICK = 0
+PAINT = 1
+EVENT = 2
+EVENTS = ("start", "pause", "reset", "finish", "set_duration", "restore", "normal", "orange", "red_on", "red_off")
+EVENT_CODES = {name: i for i, name in enumerate(EVENTS)}
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+def dump_path() -> Path:
+    """环境变量 PPT_TIMER_TICK_LOG 指定的 CSV 路径；未设置时放在临时目录。"""
+    path = os.environ.get("PPT_TIMER_TICK_LOG")
+    return Path(path) if path else Path(tempfile.gettempdir()) / f"ppt-timer-ticks-{os.getpid()}.csv"
+
+
+class TickLog:
+    def __init__(self, now, capacity: int = DEFAULT_CAPACITY):
+        self.now = now
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.kinds = array("B", bytes(capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.times, self.kinds, self.values))
+
+    def tick(self, scheduled: float):
+        i = self.count % self.capacity
+        self.times[i] = self.now()
+        self.kinds[i] = TICK
+        self.values[i] = scheduled
+        self.count += 1
+
+    def paint(self, seconds: float):
+        i = self.count % self.capacity
+        self.times[i] = self.now()
+        self.kinds[i] = PAINT
+        self.values[i] = seconds
+        self.count += 1
+
+    def event(self, name: str):
+        i = self.count % self.capacity
+        self.times[i] = self.now()
+        self.kinds[i] = EVENT
+        self.values[i] = EVENT_CODES[name]
+        self.count += 1
+
+    def rows(self):
+        """按时间顺序逐条产出 (时刻, 类型, 数值)。"""
+        start = self.count - len(self)
+        for n in range(start, self.count):
+            i = n % self.capacity
+            yield self.times[i], self.kinds[i], self.values[i]
+
+    def dump_csv(self, path) -> int:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(("time_s", "kind", "scheduled_s", "late_ms", "paint_us", "event"))
+            for t, kind, value in self.rows():
+                if kind == TICK:
+                    writer.writerow((f"{t:.6f}", "tick", f"{value:.6f}", f"{(t - value) * 1000:.3f}", "", ""))
+                elif kind == PAINT:
+                    writer.writerow((f"{t:.6f}", "paint", "", "", f"{value * 1e6:.1f}", ""))
+                else:
+                    writer.writerow((f"{t:.6f}", "event", "", "", "", EVENTS[int(value)]))
+        return len(self)
@@ -0,0 +1,91 @@
+"""
+计时数字的字体。启动时把自带的 fonts/PPTTimerDigits-Bold.ttf 注册进 QFontDatabase，
+按字体族名精确命中，不再让系统为不存在的 "Segoe UI" 做回退匹配（冷缓存时可达数百毫秒）。
+
+最终选中的字体族记在 ~/.ppt-timer/settings.ini（QSettings，可用环境变量 PPT_TIMER_SETTINGS 另指），
+以 Qt 版本和字体文件内容的校验值为键。键不变时下次启动直接使用记下的结果：
+- 上次用的是自带字体：只注册文件，跳过族名校验
+- 自带字体不可用（文件缺失或损坏）：直接用记下的系统字体族，不再枚举全部系统字体
+同一进程内只解析一次，多个计时窗口共用结果。
+"""
+import os
+import sys
+import zlib
+from pathlib import Path
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QSettings, qVersion
+from PySide6.QtGui import QFont, QFontDatabase
+
+FALLBACK_FAMILIES = ("Segoe UI", "DejaVu Sans", "Arial")
+POINT_SIZE = 40
+
+_families = {}  # 字体文件路径 -> 本进程已解析出的字体族
+
+
+def resource_dir() -> Path:
+    # PyInstaller 打包后数据文件解压在 sys._MEIPASS 下
+    return Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
+
+
+def font_path() -> Path:
+    return resource_dir() / "fonts" / "PPTTimerDigits-Bold.ttf"
+
+
+def settings_path() -> Path:
+    return Path(os.environ.get("PPT_TIMER_SETTINGS") or Path.home() / ".ppt-timer" / "settings.ini")
+
+
+def cache_key(path: Path) -> str:
+    # 按内容而不是修改时间：单文件 exe 每次启动都解压到新的临时目录
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return f"{qVersion()}/{PYSIDE_VERSION}/missing"
+    return f"{qVersion()}/{PYSIDE_VERSION}/{len(data)}/{zlib.crc32(data):08x}"
+
+
+def register_bundled(path: Path):
+    """注册自带字体，返回其字体族名；文件缺失或无法解析时返回 None。"""
+    font_id = QFontDatabase.addApplicationFont(str(path))
+    if font_id < 0:
+        return None
+    families = QFontDatabase.applicationFontFamilies(font_id)
+    return families[0] if families else None
+
+
+def pick_system_family() -> str:
+    available = set(QFontDatabase.families())
+    for family in FALLBACK_FAMILIES:
+        if family in available:
+            return family
+    return QFontDatabase.systemFont(QFontDatabase.GeneralFont).family()
+
+
+def resolve_family(path=None, settings_file=None) -> str:
+    path = Path(path or font_path())
+    family = _families.get(path)
+    if family is not None:
+        return family
+    settings = QSettings(str(settings_file or settings_path()), QSettings.IniFormat)
+    key = cache_key(path)
+    if settings.value("font/key") == key:
+        family = settings.value("font/family")
+        if settings.value("font/bundled") == "true":
+            if QFontDatabase.addApplicationFont(str(path)) < 0:
+                family = None
+    if not family:
+        family = register_bundled(path)
+        bundled = family is not None
+        if not bundled:
+            family = pick_system_family()
+        settings.setValue("font/key", key)
+        settings.setValue("font/family", family)
+        settings.setValue("font/bundled", "true" if bundled else "false")
+        settings.sync()
+    _families[path] = family
+    return family
+
+
+def timer_font(point_size: int = POINT_SIZE) -> QFont:
+    return QFont(resolve_family(), point_size, QFont.Bold)
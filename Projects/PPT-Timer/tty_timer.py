@@ -0,0 +1,182 @@
+"""
+终端倒计时（python main.py --tty）：给后台 Linux 机器与 SSH 会话用，不加载 Qt。
+计时规则与图形界面相同（CountdownEngine：30 秒橙色、10 秒红色闪烁、结束闪烁提示），
+按键同样是 空格 开始/暂停、R 重置、Esc 退出，另有 +/- 在暂停时调整分钟。
+
+用 curses 绘制大号数字；记住每个字符格上次画的内容，每帧只重画发生变化的格子。
+没有待办时 getch 一直阻塞，运行中也只在显示秒数或闪烁相位变化时醒来。
+"""
+import argparse
+import curses
+import locale
+import math
+import os
+
+from clocks import MonotonicClock, VirtualClock
+from countdown_engine import CountdownEngine
+
+# 3x5 点阵，每个点画成两个字符宽
+FONT = {
+    "0": ("###", "# #", "# #", "# #", "###"),
+    "1": ("  #", "  #", "  #", "  #", "  #"),
+    "2": ("###", "  #", "###", "#  ", "###"),
+    "3": ("###", "  #", "###", "  #", "###"),
+    "4": ("# #", "# #", "###", "  #", "  #"),
+    "5": ("###", "#  ", "###", "  #", "###"),
+    "6": ("###", "#  ", "###", "# #", "###"),
+    "7": ("###", "  #", "  #", "  #", "  #"),
+    "8": ("###", "# #", "###", "# #", "###"),
+    "9": ("###", "# #", "###", "  #", "###"),
+    ":": (" ", "#", " ", "#", " "),
+}
+FONT_ROWS = 5
+HELP = "空格 开始/暂停   R 重置   +/- 调整分钟   Esc 退出"
+KEY_ESC = 27
+
+
+def big_rows(text: str):
+    rows = []
+    for r in range(FONT_ROWS):
+        row = " ".join(FONT[ch][r] for ch in text)
+        rows.append(row.replace("#", "██").replace(" ", "  "))
+    return rows
+
+
+class TerminalView:
+    def __init__(self, screen, engine):
+        self.screen = screen
+        self.engine = engine
+        self.cells = {}  # (y, x) -> (字符, 属性)：上次画上去的内容
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            curses.init_pair(1, curses.COLOR_RED, -1)
+            curses.init_pair(2, curses.COLOR_YELLOW, -1)
+            red, yellow = curses.color_pair(1), curses.color_pair(2)
+        else:
+            red = yellow = curses.A_NORMAL
+        self.attrs = {
+            "normal": red,
+            "orange": yellow | curses.A_BOLD,
+            "red_on": red | curses.A_BOLD,
+            "red_off": red | curses.A_DIM,
+        }
+        self.invalidate()
+
+    def invalidate(self):
+        # 尺寸变化：清屏后全部重画
+        self.cells.clear()
+        self.screen.erase()
+        h, w = self.screen.getmaxyx()
+        self._put_text(h - 1, 0, HELP[:max(0, w - 1)], curses.A_DIM)
+        self.screen.noutrefresh()
+
+    def _put_text(self, y, x, text, attr):
+        try:
+            self.screen.addstr(y, x, text, attr)
+        except curses.error:
+            pass
+
+    def draw(self):
+        engine = self.engine
+        text = engine.text()
+        attr = self.attrs[engine.color_state()]
+        if not engine.state.running:
+            attr |= curses.A_UNDERLINE if engine.state.remaining_seconds else 0
+        h, w = self.screen.getmaxyx()
+        rows = big_rows(text)
+        if len(rows[0]) >= w or FONT_ROWS + 2 > h:
+            rows = [text]
+        top = max(0, (h - 1 - len(rows)) // 2)
+        left = max(0, (w - len(rows[0])) // 2)
+        cells = self.cells
+        frame = {}
+        for dy, row in enumerate(rows):
+            y = top + dy
+            for dx, ch in enumerate(row):
+                frame[(y, left + dx)] = (ch, attr if ch != " " else 0)
+        changed = 0
+        # 文字变窄（如 100:00 -> 99:59、大字退回单行）时，擦掉新一帧不再覆盖的旧字符
+        for key in cells.keys() - frame.keys():
+            if cells[key][0] != " ":
+                self._put_text(key[0], key[1], " ", 0)
+                changed += 1
+        for key, cell in frame.items():
+            if cells.get(key) != cell:
+                self._put_text(key[0], key[1], cell[0], cell[1])
+                changed += 1
+        self.cells = frame
+        if changed:
+            self.screen.noutrefresh()
+            curses.doupdate()
+        return changed
+
+
+def run(screen, engine, clock):
+    curses.curs_set(0)
+    screen.keypad(True)
+    view = TerminalView(screen, engine)
+    state = engine.state
+    blink_at = None
+    flash_end = None
+    while True:
+        now = engine.now()
+        if state.running:
+            left = engine.left()
+            if left <= 0:
+                engine.finish()
+                flash_end = now + engine.FINISH_FLASH_S
+            else:
+                engine.sync(left)
+        if flash_end is not None and now >= flash_end:
+            engine.end_flash()
+            flash_end = None
+        if not engine.blinking():
+            blink_at = None
+        elif blink_at is None:
+            blink_at = now + engine.BLINK_S
+        elif now >= blink_at:
+            engine.blink()
+            blink_at = now + engine.BLINK_S
+        view.draw()
+
+        waits = [t - now for t in (blink_at, flash_end) if t is not None]
+        if state.running:
+            waits.append(engine.next_change(engine.left()))
+        # 等待按时间源换算成真实毫秒：--speed 加速时同样按比例缩短
+        screen.timeout(max(1, math.ceil(clock.real_delay_ms(min(waits)))) if waits else -1)
+        key = screen.getch()
+        if key == -1:
+            continue
+        if key in (KEY_ESC, ord("q"), ord("Q")):
+            return
+        if key == ord(" "):
+            if state.running:
+                engine.pause()
+            else:
+                engine.start()
+        elif key in (ord("r"), ord("R")):
+            engine.reset()
+            flash_end = None
+        elif key in (ord("+"), ord("=")) and not state.running:
+            engine.set_duration(state.total_seconds + 60)
+        elif key in (ord("-"), ord("_")) and not state.running:
+            engine.set_duration(state.total_seconds - 60)
+        elif key == curses.KEY_RESIZE:
+            view.invalidate()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PPT 倒计时（终端）")
+    parser.add_argument("--tty", action="store_true")
+    parser.add_argument("--minutes", type=int, default=CountdownEngine.DEFAULT_SECONDS // 60, help="倒计时分钟数")
+    parser.add_argument("--speed", type=float, default=0, help="时间压缩倍数，用于演练")
+    args, _ = parser.parse_known_args(argv)
+    clock = VirtualClock(speed=args.speed) if args.speed > 0 else MonotonicClock()
+    engine = CountdownEngine(clock.now)
+    engine.set_duration(args.minutes * 60)
+    locale.setlocale(locale.LC_ALL, "")
+    # Esc 默认要等 1 秒才确认不是转义序列
+    os.environ.setdefault("ESCDELAY", "25")
+    curses.wrapper(run, engine, clock)
+    return 0
@@ -1,6 +1,9 @@
+import math
 import sys
+from pathlib import Path
+
 from PySide6.QtCore import Qt, QTimer, QPoint, QEvent
-from PySide6.QtGui import QFont, QCursor, QGuiApplication, QShortcut, QKeySequence
+from PySide6.QtGui import QColor, QCursor, QGuiApplication, QPalette, QShortcut, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -11,13 +14,25 @@ from PySide6.QtWidgets import (
     QLineEdit,
 )
 
+# 计时核心与 Projects/PPT-Timer 共用（打包时用 --paths 指向该目录）
+sys.path.insert(0, str(Path(__file__).resolve().parent / "Projects" / "PPT-Timer"))
+from countdown_engine import CountdownEngine  # noqa: E402
+from timer_font import timer_font  # noqa: E402
+
+
 class CountdownWindow(QWidget):
-    MIN_MINUTES = 1
-    MAX_MINUTES = 180
+    MIN_MINUTES = CountdownEngine.MIN_MINUTES
+    MAX_MINUTES = CountdownEngine.MAX_MINUTES
 
     COLOR_NORMAL = "#8B0000"  # 深红
     COLOR_ORANGE = "#FF8C00"
     COLOR_RED = "#FF0000"
+    STATE_COLORS = {
+        "normal": COLOR_NORMAL,
+        "orange": COLOR_ORANGE,
+        "red_on": COLOR_RED,
+        "red_off": "#AA0000",
+    }
 
     def __init__(self):
         super().__init__()
@@ -29,33 +44,35 @@ class CountdownWindow(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setMouseTracking(True)
 
-        # 状态
-        self.total_seconds = 15 * 60
-        self.remaining_seconds = self.total_seconds
-        self.is_running = False
+        # 状态：计时规则在 CountdownEngine 里，窗口只负责显示
+        self.engine = CountdownEngine()
         self.dragging = False
         self.drag_offset = QPoint()
         self._press_pos = None
         self._moved = False
-        self.blink_state = False
 
-        # 定时器
+        # 定时器：跳秒对齐到显示变化的时刻
         self.tick_timer = QTimer(self)
-        self.tick_timer.setInterval(1000)
+        self.tick_timer.setSingleShot(True)
+        self.tick_timer.setTimerType(Qt.PreciseTimer)
         self.tick_timer.timeout.connect(self.on_tick)
 
         self.blink_timer = QTimer(self)
-        self.blink_timer.setInterval(500)
+        self.blink_timer.setInterval(int(CountdownEngine.BLINK_S * 1000))
         self.blink_timer.timeout.connect(self.on_blink)
 
         # 主要显示：时间
-        self.time_label = QLabel(self.format_time(self.remaining_seconds))
+        self.time_label = QLabel(self.engine.text())
         self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet(
-            f"QLabel{{color:{self.COLOR_NORMAL}; background: transparent;}}"
-        )
-        font = QFont("Segoe UI", 40, QFont.Bold)
-        self.time_label.setFont(font)
+        # 每种颜色状态一份调色板，状态变化时才换；跳秒只改文字，不重新解析样式表
+        self._palettes = {}
+        for state, color in self.STATE_COLORS.items():
+            palette = QPalette(self.time_label.palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._palettes[state] = palette
+        self._color_state = "normal"
+        self.time_label.setPalette(self._palettes["normal"])
+        self.time_label.setFont(timer_font())
         self.time_label.setCursor(QCursor(Qt.IBeamCursor))
         self.time_label.setMouseTracking(True)
 
@@ -115,72 +132,66 @@ class CountdownWindow(QWidget):
 
     # 计时逻辑
     def on_tick(self):
-        if self.remaining_seconds <= 0:
+        left = self.engine.left()
+        if left <= 0:
             self.finish_timer()
             return
-        self.remaining_seconds -= 1
-        self.update_time_view()
-        if self.remaining_seconds <= 10 and not self.blink_timer.isActive():
+        if self.engine.sync(left):
+            self.update_time_view()
+        if self.engine.blinking() and not self.blink_timer.isActive():
             self.blink_timer.start()
+        # 向上取整：提前醒来时显示还没变，只会白白多一次唤醒
+        self.tick_timer.start(max(1, math.ceil(self.engine.next_change(left) * 1000)))
 
     def on_blink(self):
-        if self.remaining_seconds <= 10:
-            self.blink_state = not self.blink_state
+        if self.engine.blink():
             self.update_time_view()
         else:
             self.blink_timer.stop()
-            self.blink_state = False
-
-    def format_time(self, seconds: int) -> str:
-        m, s = divmod(max(0, seconds), 60)
-        return f"{m:02d}:{s:02d}"
 
     def update_time_view(self):
-        if self.remaining_seconds <= 10:
-            color = self.COLOR_RED if self.blink_state else "#AA0000"
-        elif self.remaining_seconds <= 30:
-            color = self.COLOR_ORANGE
-        else:
-            color = self.COLOR_NORMAL
-        self.time_label.setStyleSheet(f"QLabel{{color:{color}; background: transparent;}}")
-        self.time_label.setText(self.format_time(self.remaining_seconds))
+        state = self.engine.color_state()
+        if state != self._color_state:
+            self._color_state = state
+            self.time_label.setPalette(self._palettes[state])
+        self.time_label.setText(self.engine.text())
 
     def toggle_start_pause(self):
-        if self.is_running:
+        if self.engine.state.running:
             self.pause_timer()
         else:
             self.start_timer()
 
     def start_timer(self):
-        if self.remaining_seconds <= 0:
-            self.remaining_seconds = self.total_seconds
-        self.tick_timer.start()
-        self.is_running = True
+        self.engine.start()
+        self.on_tick()
         self.start_button.setText("⏸")
 
     def pause_timer(self):
         self.tick_timer.stop()
-        self.is_running = False
+        self.engine.pause()
         self.start_button.setText("▶")
 
     def reset_timer(self):
         self.pause_timer()
-        self.remaining_seconds = self.total_seconds
+        self.engine.reset()
         self.blink_timer.stop()
-        self.blink_state = False
         self.update_time_view()
 
     def finish_timer(self):
         self.pause_timer()
-        self.remaining_seconds = 0
+        self.engine.finish()
         self.update_time_view()
-        self.blink_state = False
         self.blink_timer.start()
-        QTimer.singleShot(2200, self.blink_timer.stop)
+        QTimer.singleShot(int(CountdownEngine.FINISH_FLASH_S * 1000), self._end_flash)
+
+    def _end_flash(self):
+        self.engine.end_flash()
+        self.blink_timer.stop()
 
     # 进入编辑（仅当未运行）
     def enter_edit_mode(self):
-        minutes = max(1, self.total_seconds // 60)
+        minutes = max(1, self.engine.state.total_seconds // 60)
         self.time_edit.setText(str(minutes))
         self.time_label.setVisible(False)
         self.time_edit.setVisible(True)
@@ -192,12 +203,11 @@ class CountdownWindow(QWidget):
         try:
             minutes = int(text)
         except ValueError:
-            minutes = max(self.MIN_MINUTES, min(self.MAX_MINUTES, self.total_seconds // 60))
-        minutes = max(self.MIN_MINUTES, min(self.MAX_MINUTES, minutes))
-        self.total_seconds = minutes * 60
-        self.remaining_seconds = self.total_seconds
+            minutes = self.engine.state.total_seconds // 60
+        self.engine.set_duration(minutes * 60)
+        if self.engine.state.running:
+            self.on_tick()
         self.blink_timer.stop()
-        self.blink_state = False
         self.update_time_view()
         self.time_edit.setVisible(False)
         self.time_label.setVisible(True)
@@ -235,13 +245,13 @@ class CountdownWindow(QWidget):
             self.dragging = False
             event.accept()
             # 未移动且在时间标签上，且未运行时，进入编辑
-            if not was_moved and not self.is_running and self.time_label.underMouse():
+            if not was_moved and not self.engine.state.running and self.time_label.underMouse():
                 self.enter_edit_mode()
             return
         super().mouseReleaseEvent(event)
 
     def mouseDoubleClickEvent(self, event):
-        if self.time_label.underMouse() and not self.is_running:
+        if self.time_label.underMouse() and not self.engine.state.running:
             self.enter_edit_mode()
             event.accept()
         else: